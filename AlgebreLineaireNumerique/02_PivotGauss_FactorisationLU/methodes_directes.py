@@ -1,5 +1,8 @@
 import copy
 
+import numpy as np
+
+
 # Ce fichier contient un certain nombre de fonctions permettant de résoudre de diverses façons un système linéaire
 # d'équations présenté sous la forme Ax = b, où A est une matrice carrée réelle et b est un vecteur réel.
 
@@ -7,6 +10,64 @@ import copy
 # - celles démarrant par un "tiret du bas" contiennent la logique des opérations effectuées.
 # - celles NE démarrant PAS par un tel tiret gèrent ce qu'il y a autour de la logique, comme la gestion de la mémoire.
 
+# Note : Les calculs sont effectués sur des tableaux numpy de flottants (float64 par défaut) :
+# - chaque étape d'élimination est une mise à jour de rang 1 de la sous-matrice restante.
+# - chaque étape de descente/remontée est un produit scalaire entre une portion de ligne et une portion du vecteur.
+# Les matrices et vecteurs peuvent être donnés sous forme de listes Python ou de tableaux numpy : le résultat est
+# réécrit dans l'objet d'origine, qui est renvoyé.
+
+
+# [0] OUTILS
+
+# Nombre de lignes traitées par bloc lors des descentes/remontées : la contribution des blocs déjà résolus est
+# soustraite en un seul produit matrice-vecteur (ou matrice-matrice pour plusieurs seconds membres).
+_TAILLE_BLOC_RESOLUTION = 64
+
+
+def _vers_tableau(
+        A
+) -> np.ndarray:
+    """
+    Renvoie `A` sous forme de tableau numpy de flottants.
+    Si `A` est déjà un tableau de flottants, il est renvoyé tel quel afin que les calculs soient effectués sur place.
+    Sinon (liste Python, tableau d'entiers), une copie en float64 est créée.
+    :param A: la matrice ou le vecteur à convertir.
+    :return: le tableau numpy correspondant.
+    """
+
+    if isinstance(A, np.ndarray) and A.dtype.kind == 'f':
+        return A
+
+    return np.array(A, dtype=np.float64)
+
+
+def _depuis_tableau(
+        A,
+        T: np.ndarray
+):
+    """
+    Réécrit les coefficients du tableau `T` dans l'objet d'origine `A` lorsque les calculs n'ont pas pu y être menés
+    sur place (cf. `_vers_tableau`).
+    Un tableau numpy d'entiers ne pouvant pas recevoir de flottants, c'est alors `T` qui est renvoyé.
+    :param A: la matrice ou le vecteur d'origine.
+    :param T: le tableau contenant le résultat des calculs.
+    :return: l'objet contenant le résultat.
+    """
+
+    if T is A:
+        return A
+
+    if isinstance(A, np.ndarray):
+        return T
+
+    if T.ndim == 1:
+        A[:] = T.tolist()
+    else:
+        for ligne, valeurs in zip(A, T):
+            ligne[:] = valeurs.tolist()
+
+    return A
+
 
 # [1] METHODES SANS PERMUTATION
 
@@ -25,7 +86,8 @@ def _factorisation_LU(
     :return: la matrice `A` factorisée.
     """
 
-    n = len(A)
+    T = _vers_tableau(A)
+    n = len(T)
 
     #      j=0     n-2
     # i=0 (a11 a12 ... a1n) => (a11     a12     ... a1n)
@@ -34,11 +96,15 @@ def _factorisation_LU(
     #     (... ... ... ...) => (...     ...     ... ...
     # n-1 (an1 an2 ... ann) => (an1/a11 an2/a22 ... ann)
     for j in range(n - 1):
-        for i in range(j + 1, n):
-            A[i][j] /= A[j][j]
-            for l in range(j + 1, n):
-                A[i][l] -= A[i][j] * A[j][l]
-    return A
+        if T[j, j] == 0:
+            raise ZeroDivisionError('Pivot nul en position {} - utiliser une méthode avec pivot.'.format(j))
+
+        T[j + 1:, j] /= T[j, j]
+
+        # Mise à jour de rang 1 de la sous-matrice restante
+        T[j + 1:, j + 1:] -= np.outer(T[j + 1:, j], T[j, j + 1:])
+
+    return _depuis_tableau(A, T)
 
 
 def factorisation_LU(
@@ -67,23 +133,31 @@ def _descente(
 ) -> list:
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
+    Plusieurs seconds membres peuvent être traités ensemble en les donnant comme colonnes d'une matrice n x k.
     :param A: la matrice provenant de la factorisation LU.
-    :param b: le vecteur second membre.
-    :return: le vecteur y intermédiaire.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
+    :return: le vecteur (ou la matrice n x k) y intermédiaire.
     """
 
-    n = len(A)
+    LU = _vers_tableau(A)
+    y = _vers_tableau(b)
+    n = len(LU)
 
     # ( 1   0  ...  0) (y1)   (b1)
     # (a21  1  ...  0) (y2)   (b2)
     # (a31 a32 ...  0) (y3) = (b3)
     # (... ... ...  0) (..)   (..)
     # (an1 an2 ...  1) (yn)   (bn)
-    for i in range(n):
-        for j in range(i):
-            b[i] -= A[i][j] * b[j]
+    for i0 in range(0, n, _TAILLE_BLOC_RESOLUTION):
+        i1 = min(n, i0 + _TAILLE_BLOC_RESOLUTION)
+
+        # Contribution des lignes déjà résolues, en un seul produit
+        y[i0:i1] -= LU[i0:i1, :i0] @ y[:i0]
 
-    return b
+        for i in range(i0 + 1, i1):
+            y[i] -= np.dot(LU[i, i0:i], y[i0:i])
+
+    return _depuis_tableau(b, y)
 
 
 def descente(
@@ -94,7 +168,7 @@ def descente(
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
     :param A: la matrice provenant de la factorisation LU.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :param keep: (default=False) si le vecteur doit être gardé intacte. Sinon, les coefficients du vecteur seront
     réécrits pour économiser de l'espace mémoire.
     écrits dans la matrice `A` initiale.
@@ -114,9 +188,10 @@ def remontee(
 ) -> list:
     """
     Applique l'étape de remontée à l'équation Ux = y
+    Plusieurs seconds membres peuvent être traités ensemble en les donnant comme colonnes d'une matrice n x k.
     :param A : la matrice provenant de la factorisation LU.
-    :param y: le vecteur second membre intermédiaire.
-    :return: la solution x à l'équation Ux = y d'inconnue x.
+    :param y: le vecteur (ou la matrice n x k) second membre intermédiaire.
+    :return: la solution x (ou la matrice n x k des solutions) à l'équation Ux = y d'inconnue x.
     """
 
     # (a11 a12 ... a1n) (x1)   (y1)
@@ -124,13 +199,20 @@ def remontee(
     # ( 0   0  ... a3n) (x3) = (y3)
     # (... ... ... ...) (..)   (..)
     # ( 0   0  ... ann) (xn)   (yn)
-    n = len(A)
-    for i in reversed(range(n)):
-        for j in range(i+1, n):
-            y[i] -= A[i][j] * y[j]
-        y[i] /= A[i][i]
+    LU = _vers_tableau(A)
+    x = _vers_tableau(y)
+    n = len(LU)
+    for i0 in reversed(range(0, n, _TAILLE_BLOC_RESOLUTION)):
+        i1 = min(n, i0 + _TAILLE_BLOC_RESOLUTION)
 
-    return y
+        # Contribution des lignes déjà résolues, en un seul produit
+        x[i0:i1] -= LU[i0:i1, i1:] @ x[i1:]
+
+        for i in reversed(range(i0, i1)):
+            x[i] -= np.dot(LU[i, i + 1:i1], x[i + 1:i1])
+            x[i] /= LU[i, i]
+
+    return _depuis_tableau(y, x)
 
 
 def gauss_sans_permutation(
@@ -144,7 +226,7 @@ def gauss_sans_permutation(
     nuls, et entrainer une division par zéro.
     Dès lors qu'une exception `ZeroDivisionError` est levée, A est une telle matrice problématique.
     :param A: la matrice du système linéaire d'équations.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :param keep: si les objets initiaux doivent être conservés intactes.
     :return: la solution à l'équation Ax = b d'inconnue x.
     """
@@ -173,7 +255,8 @@ def _factorisation_LU_pivot_partiel(
     :return: la liste des pivots, la matrice `A` factorisée.
     """
 
-    n = len(A)
+    T = _vers_tableau(A)
+    n = len(T)
     pivots = [-1 for _ in range(n)]
 
     #      j=0     n-2
@@ -183,20 +266,18 @@ def _factorisation_LU_pivot_partiel(
     #     (... ... ... ...) => (...     ...     ... ...
     # n-1 (an1 an2 ... ann) => (an1/a11 an2/a22 ... ann)
     for j in range(n - 1):
-        i0 = pivot_partiel(A, pivots, col=j)  # Trouve le plus grand pivot en valeur absolue
+        i0 = pivot_partiel(T, pivots, col=j)  # Trouve le plus grand pivot en valeur absolue
         pivots[j] = i0
         
         # Echange des lignes i0 et j, si un autre pivot a été trouvé
         if i0 != j:
-            A[j], A[i0] = A[i0], A[j]
+            T[[j, i0]] = T[[i0, j]]
                 
-        # Factorisation classique
-        for i in range(j + 1, n):
-            A[i][j] /= A[j][j]
-            for l in range(j + 1, n):
-                A[i][l] -= A[i][j] * A[j][l]
+        # Factorisation classique, par mise à jour de rang 1 de la sous-matrice restante
+        T[j + 1:, j] /= T[j, j]
+        T[j + 1:, j + 1:] -= np.outer(T[j + 1:, j], T[j, j + 1:])
                 
-    return A, pivots
+    return _depuis_tableau(A, T), pivots
 
 
 def pivot_partiel(
@@ -210,12 +291,11 @@ def pivot_partiel(
     Renvoie une `ValueError` si tous les pivots possibles sont nuls (indique une factorisation complète).
     """
     
-    i0 = col
-    pivots[i0] = abs(A[col][col])
-    for k in range(col + 1, len(A)):
-        if abs(A[k][col]) > pivots[col]:
-            pivots[col] = abs(A[k][col])
-            i0 = k
+    T = _vers_tableau(A)
+
+    # `argmax` renvoie la première occurrence du maximum, comme le parcours strictement croissant des lignes
+    i0 = col + int(np.argmax(np.abs(T[col:, col])))
+    pivots[col] = abs(T[i0, col])
             
     if pivots[col] == 0 :
         raise ValueError('Matrice non inversible - factorisation terminée.')
@@ -251,21 +331,23 @@ def _descente_pivot_partiel(
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
     :param A: la matrice provenant de la factorisation LU.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :return: le vecteur y intermédiaire.
     """
 
+    y = _vers_tableau(b)
     n = len(A)
     
-    # Echange des coordonnées du vecteur b
+    # Echange des coordonnées du vecteur b (des lignes entières pour plusieurs seconds membres)
     for i in range(n):
         pi = pivots[i]
-        b[i], b[pi] = b[pi], b[i]
+        if pi != i:
+            y[[i, pi]] = y[[pi, i]]
 
     # Descente classique sur le vecteur b permuté
-    b = _descente(A, b)
+    y = _descente(A, y)
 
-    return b
+    return _depuis_tableau(b, y)
 
 
 def descente_pivot_partiel(
@@ -277,7 +359,7 @@ def descente_pivot_partiel(
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
     :param A: la matrice provenant de la factorisation LU.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :param keep: (default=False) si le vecteur doit être gardé intacte. Sinon, les coefficients du vecteur seront
     réécrits pour économiser de l'espace mémoire.
     écrits dans la matrice `A` initiale.
@@ -301,7 +383,7 @@ def gauss_pivot_partiel(
     Applique l'algorithme de Gauss avec méthode du pivot partiel à l'équation Ax = b d'inconnue x.
     Dès lors qu'une exception `ValueError` est levée, A est une matrice non inversible.
     :param A: la matrice du système linéaire d'équations.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :param keep: si les objets initiaux doivent être conservés intactes.
     :return: la solution à l'équation Ax = b d'inconnue x.
     """
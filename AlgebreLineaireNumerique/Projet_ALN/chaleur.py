@@ -0,0 +1,355 @@
+import warnings
+
+import numpy as np
+from scipy.sparse import csc_matrix, diags, linalg as sla
+
+from lu import MatriceTridiagonale
+from choleski import FactorisationLDLtTridiagonale
+
+
+# Ce fichier contient un solveur de l'équation de la chaleur en dimension 1, dT/dt = D d²T/dx², sur une barre de
+# longueur R dont les extrémités sont maintenues à des températures fixées (conditions de Dirichlet). La barre est
+# discrétisée en Nx points intérieurs (plus les deux extrémités) et l'intervalle [0, tmax] en Nt pas de temps.
+
+# Note : Les schémas Euler explicite, Euler implicite et Crank-Nicolson sont les cas theta = 0, 1 et 1/2 du
+# theta-schéma :
+#   (I + theta.beta.K) T^(n+1) = (I - (1-theta).beta.K) T^n,       beta = D.dt/dx^2
+# où K est le laplacien discret non normalisé (stencil (-1, 2, -1)) sur les points intérieurs, les lignes des
+# extrémités étant celles de l'identité. La partie explicite est calculée par décalage de tranches, la partie implicite
+# par une factorisation de la matrice tridiagonale calculée une fois pour toutes (LDL^T par défaut, par LAPACK).
+
+# Note : La température alterne entre deux tampons préalloués, la partie explicite écrivant dans l'un à partir de
+# l'autre, et la résolution implicite se faisant sur place. Avec la factorisation par défaut (dont `solve_into`
+# résout sur place), aucun tableau n'est donc alloué pendant les pas de temps. Une factorisation qui n'offre que
+# `solve` (SuperLU, cf. `factorisation_superlu`) alloue en revanche la solution à chaque pas, de même que le
+# multigrille (cf. `multigrille.MultigrilleTridiagonale`). Pour le schéma explicite seul, les pas sont enchaînés par
+# blocage temporel (cf. `pas_explicites_blocs`).
+
+
+# [1] SCHEMA EXPLICITE
+
+# Un pas explicite remplace chaque point intérieur par T[i] + c.(T[i-1] - 2T[i] + T[i+1]), les extrémités restant
+# fixes : c'est le produit par la matrice tridiagonale du schéma, sans la former. Il est calculé par décalage de
+# tranches, dans un second tableau (le pas suivant lisant les anciennes valeurs).
+#
+# Blocage temporel : pour un grand tableau, chaque pas relit et réécrit tout le tableau en mémoire. En découpant le
+# tableau en blocs, chacun étendu de `profondeur` points de chaque côté (halo), on peut effectuer `profondeur` pas
+# d'affilée sur une copie locale du bloc, qui reste en cache : à chaque pas, le halo perd un point valide de chaque
+# côté, et après `profondeur` pas seul le bloc lui-même est exact. Le tableau n'est ainsi parcouru qu'une fois tous
+# les `profondeur` pas, au prix du recalcul des halos. Le résultat est identique, à l'arrondi près inclus, à celui
+# des pas successifs.
+
+PROFONDEUR_BLOC_EXPLICITE = 8
+TAILLE_BLOC_EXPLICITE = 32_768
+
+
+def _stencil_explicite(
+        T: np.ndarray,
+        Y: np.ndarray,
+        c: float
+):
+    """
+    Écrit dans `Y` le pas explicite de coefficient `c` appliqué à `T`, sans allocation.
+    """
+
+    Yi, Ti = Y[1:-1], T[1:-1]
+    np.add(T[:-2], T[2:], out=Yi)
+    Yi -= Ti
+    Yi -= Ti
+    Yi *= c
+    Yi += Ti
+    Y[0], Y[-1] = T[0], T[-1]
+
+
+def pas_explicites(
+        T: np.ndarray,
+        c: float,
+        k: int = 1,
+        tampon: np.ndarray = None
+) -> np.ndarray:
+    """
+    Effectue sur place `k` pas explicites de coefficient `c` (beta pour le schéma Euler explicite) sur le champ de
+    température `T`, extrémités fixes.
+    :param T: le tableau de flottants du champ de température, modifié.
+    :param c: le coefficient du stencil.
+    :param k: (default=1) le nombre de pas.
+    :param tampon: (default=None) un tableau de même taille que `T`, servant de second tampon (alloué sinon).
+    :return: le tableau `T`.
+    """
+
+    A, B = T, np.empty_like(T) if tampon is None else tampon
+    for _ in range(k):
+        _stencil_explicite(A, B, c)
+        A, B = B, A
+
+    if A is not T:
+        T[...] = A
+
+    return T
+
+
+def pas_explicites_blocs(
+        T: np.ndarray,
+        c: float,
+        k: int = 1,
+        profondeur: int = PROFONDEUR_BLOC_EXPLICITE,
+        taille_bloc: int = TAILLE_BLOC_EXPLICITE,
+        tampon: np.ndarray = None
+) -> np.ndarray:
+    """
+    Effectue sur place `k` pas explicites de coefficient `c` sur le champ de température `T`, extrémités fixes, avec
+    blocage temporel : `profondeur` pas par passage sur le tableau, bloc de `taille_bloc` points par bloc (cf.
+    en-tête de la section).
+    :param T: le tableau de flottants du champ de température, modifié.
+    :param c: le coefficient du stencil.
+    :param k: (default=1) le nombre de pas.
+    :param profondeur: (default=PROFONDEUR_BLOC_EXPLICITE) le nombre de pas par passage.
+    :param taille_bloc: (default=TAILLE_BLOC_EXPLICITE) le nombre de points intérieurs par bloc.
+    :param tampon: (default=None) un tableau de même taille que `T`, servant de second tampon (alloué sinon).
+    :return: le tableau `T`.
+    """
+
+    n = len(T)
+    if n - 2 <= taille_bloc:
+        return pas_explicites(T, c, k, tampon)  # Un seul bloc, déjà en cache : pas de halo à recalculer
+
+    A, B = T, np.empty_like(T) if tampon is None else tampon
+    u = np.empty(min(n, taille_bloc + 2 * profondeur), dtype=T.dtype)  # Copies locales d'un bloc et de son halo
+    v = np.empty_like(u)
+
+    fait = 0
+    while fait < k:
+        s = min(profondeur, k - fait)
+        for a in range(1, n - 1, taille_bloc):
+            b = min(n - 1, a + taille_bloc)
+            debut, fin = max(0, a - s), min(n, b + s)  # Bloc [a, b) et son halo, tronqué aux extrémités
+            U, V = u[:fin - debut], v[:fin - debut]
+            U[...] = A[debut:fin]
+            for _ in range(s):
+                _stencil_explicite(U, V, c)
+                U, V = V, U
+            B[a:b] = U[a - debut:b - debut]
+        B[0], B[-1] = A[0], A[-1]
+        A, B = B, A
+        fait += s
+
+    if A is not T:
+        T[...] = A
+
+    return T
+
+
+# [2] SOLVEUR
+
+def factorisation_superlu(
+        M: MatriceTridiagonale
+) -> sla.SuperLU:
+    """
+    Factorise la matrice tridiagonale `M` par SuperLU (`scipy.sparse.linalg.splu`), après conversion au format CSC.
+    Utilisable comme paramètre `factorisation` de `SolveurChaleur1D` ; la factorisation n'offrant que `solve`, chaque
+    pas de temps alloue alors la solution.
+    :param M: la matrice tridiagonale.
+    :return: la factorisation SuperLU, munie d'une méthode `solve`.
+    """
+
+    return sla.splu(csc_matrix(diags([M.diag, M.inf, M.sup], [0, -1, 1])))
+
+
+class SolveurChaleur1D:
+    """
+    Solveur de l'équation de la chaleur en dimension 1 par theta-schéma (cf. en-tête du fichier).
+    La matrice implicite est factorisée à la construction ; chaque pas de temps ne fait ensuite qu'un produit par
+    stencil et une résolution, sur place.
+    """
+
+    def __init__(
+            self,
+            D: float,
+            R: float,
+            Nx: int,
+            Nt: int,
+            tmax: float,
+            theta: float,
+            T_gauche: float,
+            T_droite: float,
+            T_initiale: float = None,
+            factorisation=None
+    ):
+        """
+        :param D: la diffusivité thermique (en m²/s).
+        :param R: la longueur de la barre (en m).
+        :param Nx: le nombre de points intérieurs.
+        :param Nt: le nombre de pas de temps sur [0, tmax].
+        :param tmax: la durée simulée (en s).
+        :param theta: le paramètre du schéma, entre 0 (Euler explicite) et 1 (Euler implicite), 1/2 pour
+        Crank-Nicolson.
+        :param T_gauche: la température imposée en x = 0.
+        :param T_droite: la température imposée en x = R.
+        :param T_initiale: (default=None) la température initiale des points intérieurs, `T_droite` par défaut.
+        :param factorisation: (default=None) la fonction qui factorise la matrice implicite (`MatriceTridiagonale`) et
+        renvoie un objet muni d'une méthode `solve_into` ou `solve` (par exemple `factorisation_superlu`). Par défaut,
+        `FactorisationLDLtTridiagonale.depuis_tridiagonale`.
+        """
+
+        if not 0 <= theta <= 1:
+            raise ValueError('Le paramètre theta doit être compris entre 0 et 1.')
+
+        self.D, self.R, self.Nx, self.Nt, self.tmax, self.theta = D, R, Nx, Nt, tmax, theta
+        self.dx = R / (Nx + 1)
+        self.dt = tmax / (Nt + 1)
+        self.beta = D * self.dt / self.dx ** 2
+        self.T_gauche, self.T_droite = T_gauche, T_droite
+        self.k = 0  # Nombre de pas de temps effectués
+
+        # Stabilité (au sens L2, de von Neumann) : (1 - 2.theta).beta <= 1/2. Le principe du maximum (températures
+        # comprises entre leurs valeurs initiales et aux bords, sans oscillations) demande davantage :
+        # (1 - theta).beta <= 1/2, ce qui n'est jamais garanti pour theta = 1/2 et beta grand (Crank-Nicolson).
+        if theta < 1 / 2 and (1 - 2 * theta) * self.beta > 1 / 2:
+            warnings.warn('beta={:.3f} : schéma instable pour theta={} (il faut (1 - 2.theta).beta <= 1/2).'.format(
+                self.beta, theta), RuntimeWarning)
+        elif (1 - theta) * self.beta > 1 / 2:
+            warnings.warn('beta={:.3f} : principe du maximum non garanti pour theta={}, des oscillations sont '
+                          'possibles (il faut (1 - theta).beta <= 1/2).'.format(self.beta, theta), RuntimeWarning)
+
+        # Tampons de température
+        self._T = np.full(Nx + 2, T_droite if T_initiale is None else T_initiale, dtype=np.float64)
+        self._T[0], self._T[-1] = T_gauche, T_droite
+        self._suivant = self._T.copy()
+
+        # Factorisation de la matrice implicite I + theta.beta.K
+        self._resoudre = None
+        if theta > 0:
+            self.matrice = self.matrice_implicite()
+            facto = (factorisation or FactorisationLDLtTridiagonale.depuis_tridiagonale)(self.matrice)
+            if hasattr(facto, 'solve_into'):
+                self._resoudre = facto.solve_into
+            else:
+                self._resoudre = lambda b, out: out.__setitem__(Ellipsis, facto.solve(b))
+
+    def matrice_implicite(
+            self
+    ) -> MatriceTridiagonale:
+        """
+        :return: la matrice I + theta.beta.K du theta-schéma, lignes des extrémités comprises.
+        """
+
+        n = self.Nx + 2
+        a = self.theta * self.beta
+
+        diag = np.full(n, 1 + 2 * a)
+        diag[0], diag[-1] = 1, 1  # Condition aux bornes
+        inf = np.full(n - 1, -a)
+        inf[-1] = 0
+        sup = np.full(n - 1, -a)
+        sup[0] = 0
+
+        return MatriceTridiagonale(inf, diag, sup)
+
+    @property
+    def temperature(
+            self
+    ) -> np.ndarray:
+        """
+        Le champ de température courant. Le tableau renvoyé est l'un des tampons du solveur : il est réécrit par les
+        pas de temps suivants (il faut le copier pour le conserver).
+        """
+
+        return self._T
+
+    @property
+    def t(
+            self
+    ) -> float:
+        """
+        L'instant courant (en s).
+        """
+
+        return self.k * self.dt
+
+    @property
+    def positions(
+            self
+    ) -> np.ndarray:
+        """
+        Les abscisses des points de la barre (en m), extrémités comprises.
+        """
+
+        return np.arange(self.Nx + 2) * self.dx
+
+    def solution_stationnaire(
+            self
+    ) -> np.ndarray:
+        """
+        :return: la limite du champ de température quand t tend vers l'infini : le profil affine entre les
+        températures imposées.
+        """
+
+        return self.T_gauche + (self.T_droite - self.T_gauche) * self.positions / self.R
+
+    def _pas(
+            self
+    ):
+        """
+        Effectue un pas de temps, sans allocation si la factorisation résout sur place (cf. en-tête du fichier).
+        """
+
+        if self.theta < 1:
+            # Partie explicite, de coefficient (1-theta).beta, écrite dans l'autre tampon
+            _stencil_explicite(self._T, self._suivant, (1 - self.theta) * self.beta)
+            self._T, self._suivant = self._suivant, self._T
+        if self.theta > 0:
+            self._resoudre(self._T, self._T)
+
+        self.k += 1
+
+    def avancer(
+            self,
+            k: int = 1
+    ) -> np.ndarray:
+        """
+        Effectue `k` pas de temps.
+        :param k: (default=1) le nombre de pas de temps.
+        :return: le champ de température obtenu (cf. `temperature`).
+        """
+
+        if self.theta == 0:
+            # Euler explicite : pas enchaînés par blocage temporel
+            pas_explicites_blocs(self._T, self.beta, k, tampon=self._suivant)
+            self.k += k
+            return self._T
+
+        for _ in range(k):
+            self._pas()
+
+        return self._T
+
+    def avancer_jusqu_a(
+            self,
+            t: float
+    ) -> np.ndarray:
+        """
+        Effectue les pas de temps nécessaires pour atteindre l'instant `t` (au pas de temps le plus proche).
+        :param t: l'instant à atteindre (en s).
+        :return: le champ de température obtenu (cf. `temperature`).
+        """
+
+        return self.avancer(max(0, int(round((t - self.t) / self.dt))))
+
+    def instantanes(
+            self,
+            intervalle: int = 1,
+            copie: bool = True
+    ):
+        """
+        Itère sur les instants successifs, de l'instant courant jusqu'au pas de temps Nt.
+        :param intervalle: (default=1) le nombre de pas de temps entre deux instantanés.
+        :param copie: (default=True) si le champ de température doit être copié (sinon, le tampon courant est renvoyé,
+        valable jusqu'à l'instantané suivant).
+        :return: un itérateur sur les couples (t, champ de température), l'instant courant compris.
+        """
+
+        while True:
+            yield self.t, self._T.copy() if copie else self._T
+            if self.k >= self.Nt:
+                return
+            self.avancer(min(intervalle, self.Nt - self.k))
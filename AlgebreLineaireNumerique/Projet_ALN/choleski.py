@@ -1,5 +1,16 @@
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
 from math import sqrt
 
+import numpy as np
+from scipy.linalg.lapack import dpttrf, dpttrs
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.linalg import spsolve_triangular
+
+from creux import AnalyseSymbolique
+from lu import FactorisationLU
+
 
 def factorisation_choleski(A):
     n = len(A)
@@ -20,6 +31,9 @@ def factorisation_choleski(A):
 
 
 def descente_choleski(L, b):
+    if np.ndim(L) == 1:
+        return _descente_choleski_compacte(L, b)
+
     n = len(L)
 
     for i in range(n):
@@ -29,6 +43,9 @@ def descente_choleski(L, b):
 
 
 def remontee_choleski(L, b):
+    if np.ndim(L) == 1:
+        return _remontee_choleski_compacte(L, b)
+
     n = len(L)
 
     for i in reversed(range(n)):
@@ -38,13 +55,495 @@ def remontee_choleski(L, b):
         b[i] = b[i] / L[i][i]
 
 
-def factorisation_choleski_tridiagonal(L):
+def _factorisation_choleski_dense(A):
+    """
+    Factorise sur place la matrice symétrique définie positive `A` (tableau numpy) suivant la décomposition de
+    Choleski A = L L^T : le triangle inférieur de `A` est remplacé par L, une colonne après l'autre, chaque étape étant
+    une mise à jour de rang 1 de la sous-matrice restante. Le triangle strictement supérieur n'a plus de sens.
+    Une `ValueError` est levée si A n'est pas définie positive.
+    :param A: le tableau numpy de flottants de la matrice, modifié.
+    :return: le tableau `A`.
+    """
+    n = len(A)
+
+    for k in range(n):
+        if A[k, k] <= 0:
+            raise ValueError('Matrice non définie positive.')
+        A[k, k] = sqrt(A[k, k])
+        A[k + 1:, k] /= A[k, k]
+        A[k + 1:, k + 1:] -= np.outer(A[k + 1:, k], A[k + 1:, k])
+
+    return A
+
+
+def _descente_choleski_multiple(L, B):
+    """
+    Résout sur place LX = B pour une matrice triangulaire inférieure `L` et une matrice `B` de seconds membres.
+    :param L: le tableau numpy de la matrice triangulaire inférieure.
+    :param B: le tableau numpy des seconds membres (un par colonne), remplacé par X.
+    :return: le tableau `B`.
+    """
     n = len(L)
 
     for i in range(n):
-        L[i][i-1] = L[i][i-1] / L[i-1][i-1]
+        B[i] -= L[i, :i] @ B[:i]
+        B[i] /= L[i, i]
+
+    return B
+
+
+def factorisation_choleski_tuiles(A, taille_tuile=256, workers=None):
+    """
+    Factorise la matrice symétrique définie positive `A` suivant la décomposition de Choleski, la matrice étant
+    découpée en tuiles de `taille_tuile` x `taille_tuile`. À chaque étape k, la tuile diagonale L(k, k) est
+    factorisée, puis les tuiles L(i, k) sous la diagonale, et enfin les mises à jour A(i, j) -= L(i, k) L(j, k)^T
+    des tuiles restantes sont réparties sur `workers` fils d'exécution (par défaut, le nombre de coeurs).
+    Les produits numpy relâchant le verrou global de l'interpréteur, ces tâches s'exécutent réellement en parallèle.
+    :return: la matrice L (tableau numpy), nulle au-dessus de la diagonale.
+    """
+    L = np.array(A, dtype=np.float64)
+    n = len(L)
+    debuts = range(0, n, taille_tuile)
+
+    def tuile(i0):
+        return slice(i0, min(n, i0 + taille_tuile))
+
+    def calcul_L(i0, k0):
+        # L(i, k) = A(i, k) L(k, k)^-T, soit L(k, k) L(i, k)^T = A(i, k)^T
+        _descente_choleski_multiple(L[tuile(k0), tuile(k0)], L[tuile(i0), tuile(k0)].T)
+
+    def mise_a_jour(i0, j0, k0):
+        L[tuile(i0), tuile(j0)] -= L[tuile(i0), tuile(k0)] @ L[tuile(j0), tuile(k0)].T
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executeur:
+        for k0 in debuts:
+            _factorisation_choleski_dense(L[tuile(k0), tuile(k0)])
+
+            taches = [executeur.submit(calcul_L, i0, k0) for i0 in debuts if i0 > k0]
+            for tache in taches:
+                tache.result()
+
+            taches = [executeur.submit(mise_a_jour, i0, j0, k0)
+                      for i0 in debuts if i0 > k0 for j0 in debuts if k0 < j0 <= i0]
+            for tache in taches:
+                tache.result()
+
+    return np.tril(L)
+
+
+TAILLE_BLOC_CHOLESKI = 64
+
+
+def factorisation_choleski_sur_place(A, taille_bloc=TAILLE_BLOC_CHOLESKI):
+    """
+    Factorise sur place la matrice symétrique définie positive `A` (tableau numpy de flottants) suivant la
+    décomposition de Choleski : le triangle inférieur de `A` est remplacé par L, le triangle strictement supérieur
+    n'est ni lu ni modifié. Aucune autre matrice n x n n'est allouée.
+    La factorisation procède par blocs de colonnes : factorisation du bloc diagonal, descente pour le bloc de L
+    au-dessous, puis mise à jour par produits matrice-matrice des blocs restants du triangle inférieur.
+    Une `ValueError` est levée si A n'est pas définie positive.
+    :return: la matrice `A`.
+    """
+    n = len(A)
+
+    for k0 in range(0, n, taille_bloc):
+        k1 = min(n, k0 + taille_bloc)
+
+        # Bloc diagonal, factorisé sur une copie pour préserver le triangle supérieur de A
+        D = _factorisation_choleski_dense(A[k0:k1, k0:k1].copy())
+        bas = np.tril_indices(k1 - k0)
+        A[k0:k1, k0:k1][bas] = D[bas]
+
+        # L(i, k) = A(i, k) L(k, k)^-T
+        _descente_choleski_multiple(D, A[k1:, k0:k1].T)
+
+        # A(j:, j) -= L(j:, k) L(j, k)^T, bloc de colonnes par bloc de colonnes
+        for j0 in range(k1, n, taille_bloc):
+            j1 = min(n, j0 + taille_bloc)
+            D = A[j0:j1, j0:j1] - A[j0:j1, k0:k1] @ A[j0:j1, k0:k1].T
+            bas = np.tril_indices(j1 - j0)
+            A[j0:j1, j0:j1][bas] = D[bas]
+            A[j1:, j0:j1] -= A[j1:, k0:k1] @ A[j0:j1, k0:k1].T
+
+    return A
+
+
+# Stockage compact : le triangle inférieur d'une matrice de taille n est stocké ligne par ligne dans un tableau de
+# n(n+1)/2 flottants, la ligne i (coefficients 0 à i) commençant à la position i(i+1)/2.
+#
+#       (l11  0   0 )
+#   L = (l21 l22  0 )   ->   LP = (l11 l21 l22 l31 l32 l33)
+#       (l31 l32 l33)
+
+def _taille_compacte(LP):
+    """
+    :return: la taille n de la matrice stockée dans le tableau compact `LP`.
+    """
+    n = (int(sqrt(8 * len(LP) + 1)) - 1) // 2
+    if n * (n + 1) // 2 != len(LP):
+        raise ValueError('Le stockage compact doit compter n(n+1)/2 coefficients.')
+
+    return n
+
+
+def compacter(A):
+    """
+    :return: le stockage compact (tableau de n(n+1)/2 flottants) du triangle inférieur de la matrice `A`.
+    """
+    return np.asarray(A, dtype=np.float64)[np.tril_indices(len(A))]
+
+
+def decompacter(LP):
+    """
+    :return: la matrice triangulaire inférieure (tableau numpy) stockée dans le tableau compact `LP`.
+    """
+    n = _taille_compacte(LP)
+    L = np.zeros((n, n))
+    L[np.tril_indices(n)] = LP
+
+    return L
+
+
+def _lignes_compactes(LP, i0, i1, j1):
+    """
+    :return: le bloc plein des lignes `i0` à `i1` (exclue) et des colonnes 0 à `j1` (exclue) de la matrice
+    triangulaire inférieure stockée dans `LP`, complété par des zéros.
+    """
+    W = np.zeros((i1 - i0, j1))
+    for i in range(i0, i1):
+        debut = i * (i + 1) // 2
+        m = min(i + 1, j1)
+        W[i - i0, :m] = LP[debut:debut + m]
+
+    return W
+
+
+def factorisation_choleski_compacte(AP, taille_bloc=TAILLE_BLOC_CHOLESKI):
+    """
+    Factorise sur place la matrice symétrique définie positive dont le triangle inférieur est stocké dans le tableau
+    compact `AP` (cf. `compacter`), suivant la décomposition de Choleski : `AP` contient ensuite L, au même format.
+    La mémoire utilisée est ainsi de n(n+1)/2 flottants, plus un panneau de `taille_bloc` lignes.
+    La factorisation procède par blocs de lignes ("left-looking") : chaque bloc de lignes est copié dans un panneau
+    plein, résolu contre les blocs de L déjà calculés (produits matrice-matrice et descentes), puis réécrit.
+    Une `ValueError` est levée si A n'est pas définie positive.
+    :return: le tableau `AP`.
+    """
+    n = _taille_compacte(AP)
+
+    for i0 in range(0, n, taille_bloc):
+        i1 = min(n, i0 + taille_bloc)
+        W = _lignes_compactes(AP, i0, i1, i1)
+
+        # W(:, k) = (A(i, k) - L(i, :k) L(k, :k)^T) L(k, k)^-T pour chaque bloc k précédent
+        for k0 in range(0, i0, taille_bloc):
+            k1 = min(i0, k0 + taille_bloc)
+            Lk = _lignes_compactes(AP, k0, k1, k1)
+            W[:, k0:k1] -= W[:, :k0] @ Lk[:, :k0].T
+            _descente_choleski_multiple(Lk[:, k0:k1], W[:, k0:k1].T)
+
+        # Bloc diagonal
+        D = W[:, i0:i1] - W[:, :i0] @ W[:, :i0].T
+        W[:, i0:i1] = np.tril(_factorisation_choleski_dense(D))
+
+        for i in range(i0, i1):
+            debut = i * (i + 1) // 2
+            AP[debut:debut + i + 1] = W[i - i0, :i + 1]
+
+    return AP
+
+
+def _second_membre_compact(b):
+    """
+    :param b: le second membre d'une résolution en stockage compact, liste ou tableau numpy de flottants.
+    :return: le tableau de float64 dans lequel mener les calculs : `b` lui-même s'il s'y prête, une copie sinon (à
+    réécrire ensuite dans `b`, cf. `_reecriture_compacte`).
+    """
+    if isinstance(b, np.ndarray) and b.dtype.kind != 'f':
+        raise ValueError('Le second membre doit être une liste ou un tableau de flottants, modifiable sur place.')
+
+    return np.asarray(b, dtype=np.float64)
+
+
+def _reecriture_compacte(b, x):
+    """
+    Réécrit dans `b` la solution `x` lorsqu'elle a été calculée dans une copie (cf. `_second_membre_compact`), de
+    sorte que `b` soit modifié sur place comme pour une matrice pleine.
+    :param b: le second membre d'origine.
+    :param x: le tableau contenant la solution.
+    :return: le second membre `b`.
+    """
+    if x is not b:
+        b[:] = x.tolist() if isinstance(b, list) else x
+
+    return b
+
+
+def _descente_choleski_compacte(LP, b):
+    """
+    Résout sur place Ly = b, L étant stockée dans le tableau compact `LP` : chaque ligne de L y est contiguë.
+    :param LP: le tableau compact de L (cf. `compacter`).
+    :param b: le vecteur second membre, liste ou tableau de flottants, remplacé par y.
+    :return: le second membre `b`, contenant y.
+    """
+    x = _second_membre_compact(b)
+    n = len(x)
+
+    for i in range(n):
+        debut = i * (i + 1) // 2
+        x[i] = (x[i] - np.dot(LP[debut:debut + i], x[:i])) / LP[debut + i]
+
+    return _reecriture_compacte(b, x)
+
+
+def _remontee_choleski_compacte(LP, b):
+    """
+    Résout sur place L^T x = b, L étant stockée dans le tableau compact `LP` : la colonne i de L^T est la ligne i de
+    L, contiguë, dont la contribution est retranchée aux inconnues précédentes une fois x[i] connue.
+    :param LP: le tableau compact de L (cf. `compacter`).
+    :param b: le vecteur second membre, liste ou tableau de flottants, remplacé par x.
+    :return: le second membre `b`, contenant x.
+    """
+    x = _second_membre_compact(b)
+    n = len(x)
+
+    for i in reversed(range(n)):
+        debut = i * (i + 1) // 2
+        x[i] /= LP[debut + i]
+        x[:i] -= x[i] * LP[debut:debut + i]
+
+    return _reecriture_compacte(b, x)
+
+
+# Traitement par lots : une pile de matrices de même taille n, tableau de forme (lot, n, n). Les boucles portent sur
+# les n colonnes, chaque opération étant vectorisée sur tout un paquet de matrices : le coût de l'interpréteur est payé
+# n fois par paquet, et non n^3 fois par matrice. Les paquets comptent environ TAILLE_PAQUET_CHOLESKI coefficients,
+# afin que chacun reste en cache pendant toute sa factorisation.
+
+TAILLE_PAQUET_CHOLESKI = 2 ** 17
+
+
+def _paquets(lot, n):
+    """
+    :return: les tranches successives de la pile de `lot` matrices de taille `n`, par paquets.
+    """
+    taille = max(1, TAILLE_PAQUET_CHOLESKI // (n * n))
+
+    return [slice(p, min(lot, p + taille)) for p in range(0, lot, taille)]
+
+
+def _factorisation_choleski_paquet(L, decalage):
+    """
+    Factorise sur place chaque matrice du paquet `L` (forme (taille, n, n), triangle supérieur nul), `decalage` étant
+    la position du paquet dans la pile (pour le message d'erreur).
+    :param L: le paquet de matrices, modifié.
+    :param decalage: l'indice de la première matrice du paquet dans la pile.
+    """
+    n = L.shape[1]
+
+    for j in range(n):
+        # L(j:, j) = A(j:, j) - L(j:, :j) L(j, :j)^T
+        L[:, j:, j] -= (L[:, j:, :j] @ L[:, j, :j, None])[:, :, 0]
+
+        d = L[:, j, j]
+        if not np.all(d > 0):
+            raise ValueError('Matrice {} non définie positive.'.format(decalage + int(np.argmin(d > 0))))
+        d = np.sqrt(d)
+        L[:, j, j] = d
+        L[:, j + 1:, j] /= d[:, None]
+
+
+def factorisation_choleski_lot(A):
+    """
+    Factorise chacune des matrices symétriques définies positives de la pile `A` (forme (lot, n, n)) suivant la
+    décomposition de Choleski, colonne par colonne ("left-looking") : seul le triangle inférieur de A est lu.
+    Une `ValueError` est levée, indiquant la première matrice fautive, si l'une d'elles n'est pas définie positive.
+    :return: la pile des matrices L (tableau numpy de forme (lot, n, n)), nulles au-dessus de la diagonale.
+    """
+    L = np.tril(np.asarray(A, dtype=np.float64))
+    if L.ndim != 3 or L.shape[1] != L.shape[2]:
+        raise ValueError('La pile de matrices doit être de forme (lot, n, n).')
+
+    for paquet in _paquets(*L.shape[:2]):
+        _factorisation_choleski_paquet(L[paquet], paquet.start)
+
+    return L
+
+
+def _seconds_membres_lot(B):
+    """
+    :return: une vue de forme (lot, n, k) de la pile de seconds membres `B`, de forme (lot, n) ou (lot, n, k).
+    """
+    return B[:, :, None] if B.ndim == 2 else B
+
+
+def descente_choleski_lot(L, B):
+    """
+    Résout sur place L_p y_p = b_p pour chaque matrice L_p de la pile `L` (cf. `factorisation_choleski_lot`) et
+    chaque second membre b_p de la pile `B` (tableau de flottants de forme (lot, n) ou (lot, n, k)).
+    :return: le tableau `B`.
+    """
+    Y = _seconds_membres_lot(B)
+
+    for i in range(L.shape[1]):
+        Y[:, i] -= (L[:, i, None, :i] @ Y[:, :i])[:, 0]
+        Y[:, i] /= L[:, i, i, None]
+
+    return B
 
-        L[i][i] = L[i][i] - L[i][i-1] ** 2
+
+def remontee_choleski_lot(L, B):
+    """
+    Résout sur place L_p^T x_p = b_p pour chaque matrice L_p de la pile `L` et chaque second membre b_p de la pile
+    `B` (tableau de flottants de forme (lot, n) ou (lot, n, k)).
+    :return: le tableau `B`.
+    """
+    X = _seconds_membres_lot(B)
+
+    for i in reversed(range(L.shape[1])):
+        X[:, i] -= (L[:, i + 1:, i, None].transpose(0, 2, 1) @ X[:, i + 1:])[:, 0]
+        X[:, i] /= L[:, i, i, None]
+
+    return B
+
+
+def resolution_choleski_lot(L, B):
+    """
+    Résout A_p x_p = b_p pour chaque matrice A_p = L_p L_p^T de la pile factorisée `L` (cf.
+    `factorisation_choleski_lot`) et chaque second membre b_p de la pile `B` (forme (lot, n) ou (lot, n, k)).
+    :return: la pile des solutions (`B` n'est pas modifié).
+    """
+    X = np.array(B, dtype=np.float64)
+
+    # Descente puis remontée paquet par paquet, chaque paquet de L restant en cache entre les deux
+    for paquet in _paquets(*L.shape[:2]):
+        remontee_choleski_lot(L[paquet], descente_choleski_lot(L[paquet], X[paquet]))
+
+    return X
+
+
+def estimation_conditionnement_choleski(L, norme_A):
+    """
+    Estime le conditionnement cond_1(A) à partir de la factorisation de Choleski A = L L^T, en O(n^2) (cf.
+    `lu.estimation_norme_inverse`), sans calculer A^-1.
+    :param L: la matrice provenant de `factorisation_choleski` (non modifiée).
+    :param norme_A: la norme ||A||_1, calculée avant la factorisation (cf. `lu.norme_1`).
+    :return: l'estimation du conditionnement.
+    """
+
+    return FactorisationLU.depuis_choleski(L).conditionnement(norme_A)
+
+
+def log_determinant_choleski(L):
+    """
+    Calcule le déterminant de A = L L^T, en O(n) : log det(A) = 2 (log l11 + ... + log lnn).
+    :param L: la matrice provenant de `factorisation_choleski`.
+    :return: le signe du déterminant (toujours 1, A étant définie positive) et le logarithme de sa valeur absolue,
+    comme `lu.log_determinant`.
+    """
+
+    return 1., 2 * float(np.sum(np.log(np.diagonal(np.asarray(L, dtype=np.float64)))))
+
+
+# Modifications de rang 1 : à partir de A = L L^T, le facteur de A + x x^T (ajout) ou de A - x x^T (retrait) est
+# obtenu en O(n^2) en modifiant L sur place, colonne par colonne, par des rotations. Seul le triangle inférieur de L
+# est lu et modifié : L peut provenir de `factorisation_choleski_tuiles` comme de `factorisation_choleski_sur_place`.
+
+SEUIL_RETRAIT_CHOLESKI = 1e-8  # Retrait instable si un pivot perd plus de 8 chiffres significatifs
+
+
+def ajout_choleski(L, x):
+    """
+    Remplace sur place L (tableau numpy de flottants) par le facteur de Choleski de A + x x^T, A = L L^T.
+    :param x: le vecteur x (non modifié).
+    :return: la matrice `L`.
+    """
+    x = np.array(x, dtype=np.float64)
+    n = len(x)
+
+    for k in np.flatnonzero(x)[:1].tolist():  # Les colonnes avant le premier coefficient non nul de x sont inchangées
+        for j in range(k, n):
+            r = sqrt(L[j, j] ** 2 + x[j] ** 2)
+            c, s = r / L[j, j], x[j] / L[j, j]
+            L[j, j] = r
+            L[j + 1:, j] += s * x[j + 1:]
+            L[j + 1:, j] /= c
+            x[j + 1:] *= c
+            x[j + 1:] -= s * L[j + 1:, j]
+
+    return L
+
+
+def retrait_choleski(L, x, A=None, seuil=SEUIL_RETRAIT_CHOLESKI):
+    """
+    Remplace sur place L (tableau numpy de flottants) par le facteur de Choleski de A - x x^T, A = L L^T.
+    Le retrait est instable lorsqu'un pivot l_jj^2 - x_j^2 perd presque toute sa valeur (relativement à l_jj^2, d'au
+    moins un facteur `seuil`) : L est alors recalculé par une factorisation complète de A - x x^T, en O(n^3).
+    Une `ValueError` est levée si A - x x^T n'est pas définie positive.
+    :param x: le vecteur x (non modifié).
+    :param A: (default=None) la matrice A, si elle est disponible ; sinon, la refactorisation part de L L^T, L étant
+    retrouvée en défaisant les rotations déjà appliquées.
+    :param seuil: (default=SEUIL_RETRAIT_CHOLESKI) le seuil de perte relative sur les pivots.
+    :return: la matrice `L`.
+    """
+    x0 = np.asarray(x, dtype=np.float64)
+    x = x0.copy()
+    n = len(x)
+    rotations = []  # Les couples (c, s) des colonnes déjà modifiées, pour revenir à L en cas de refactorisation
+
+    for k in np.flatnonzero(x)[:1].tolist():
+        for j in range(k, n):
+            r2 = L[j, j] ** 2 - x[j] ** 2
+            if r2 <= seuil * L[j, j] ** 2:
+                if A is None:
+                    # Les rotations des colonnes k à j-1 sont défaites, de la dernière à la première, pour retrouver L
+                    for m, (c, s) in zip(range(j - 1, k - 1, -1), reversed(rotations)):
+                        x[m + 1:] += s * L[m + 1:, m]
+                        x[m + 1:] /= c
+                        L[m + 1:, m] *= c
+                        L[m + 1:, m] += s * x[m + 1:]
+                        L[m, m] /= c
+                    B = np.tril(L)
+                    B = B @ B.T
+                else:
+                    B = np.array(A, dtype=np.float64)
+                B -= np.outer(x0, x0)
+                factorisation_choleski_sur_place(B)
+                bas = np.tril_indices(n)
+                L[bas] = B[bas]
+                return L
+            r = sqrt(r2)
+            c, s = r / L[j, j], x[j] / L[j, j]
+            rotations.append((c, s))
+            L[j, j] = r
+            L[j + 1:, j] -= s * x[j + 1:]
+            L[j + 1:, j] /= c
+            x[j + 1:] *= c
+            x[j + 1:] -= s * L[j + 1:, j]
+
+    return L
+
+
+def modification_diagonale_choleski(L, i, delta, A=None):
+    """
+    Remplace sur place L par le facteur de Choleski de la matrice A = L L^T dont le coefficient diagonal a_ii est
+    augmenté de `delta` (ajout ou retrait du vecteur sqrt(|delta|) e_i), en O((n-i)^2).
+    :param A: (default=None) la matrice A avant modification, pour une éventuelle refactorisation (cf.
+    `retrait_choleski`).
+    :return: la matrice `L`.
+    """
+    x = np.zeros(len(L))
+    x[i] = sqrt(abs(delta))
+
+    return ajout_choleski(L, x) if delta >= 0 else retrait_choleski(L, x, A)
+
+
+def factorisation_choleski_tridiagonal(L):
+    n = len(L)
+
+    for i in range(n):
+        if i > 0:  # La ligne 0 n'a pas de coefficient sous-diagonal (L[0][-1] serait le dernier de la ligne)
+            L[i][i-1] = L[i][i-1] / L[i-1][i-1]
+            L[i][i] = L[i][i] - L[i][i-1] ** 2
         L[i][i] = sqrt(L[i][i])
 
     return L
@@ -54,11 +553,13 @@ def descente_choleski_tridiagonal(L, b):
     n = len(L)
 
     for i in range(n):
-        b[i] -= L[i][i-1] * b[i-1]
+        if i > 0:
+            b[i] -= L[i][i-1] * b[i-1]
         b[i] /= L[i][i]
 
     return b
 
+
 def remontee_choleski_tridiagonal(L, b):
     n = len(L)
 
@@ -70,6 +571,316 @@ def remontee_choleski_tridiagonal(L, b):
     return b
 
 
+def factorisation_choleski_incomplete(A, seuil=None, decalage=0.):
+    """
+    Factorise la matrice creuse symétrique définie positive `A` (CSR) suivant une décomposition de Choleski incomplète
+    A ~ L L^T, ligne par ligne, sans jamais former de matrice pleine :
+      - IC(0) si `seuil` vaut None : L a exactement la structure du triangle inférieur de A (aucun remplissage),
+      - IC à seuil sinon : le remplissage est autorisé, mais tout coefficient de la ligne i de L inférieur à
+      `seuil` * ||A[i]||_2 en valeur absolue est abandonné.
+    La factorisation incomplète peut échouer (pivot négatif) pour une matrice qui n'est pas une M-matrice : `decalage`
+    remplace alors A par A + decalage * diag(A). Une `ValueError` est levée en cas d'échec.
+    :param A: la matrice creuse symétrique définie positive (CSR, CSC ou pleine).
+    :param seuil: (default=None) le seuil relatif d'abandon des coefficients, None pour IC(0).
+    :param decalage: (default=0.) le décalage relatif de la diagonale.
+    :return: la matrice L au format CSR (diagonale comprise).
+    """
+    A = csr_matrix(A)
+    n = A.shape[0]
+    normes = np.sqrt(np.asarray(A.multiply(A).sum(axis=1)).ravel())
+    diagonale_A = A.diagonal() * (1 + decalage)
+
+    diag = np.zeros(n)
+    colonnes = [[] for _ in range(n)]  # colonnes[k] : couples (i, L[i][k]) des lignes i > k déjà factorisées
+    indices, valeurs, indptr = [], [], [0]
+
+    for i in range(n):
+        debut, fin = A.indptr[i], A.indptr[i + 1]
+        ligne = {int(j): v for j, v in zip(A.indices[debut:fin], A.data[debut:fin]) if j < i}
+        aii = diagonale_A[i]
+
+        # Les coefficients L[i][k] sont calculés par k croissant : chacun met à jour les coefficients L[i][r] suivants
+        # par la colonne k de L (L[i][r] -= L[i][k] L[r][k])
+        a_traiter = list(ligne)
+        heapq.heapify(a_traiter)
+        vus = set(a_traiter)
+        coefficients = []
+        while a_traiter:
+            k = heapq.heappop(a_traiter)
+            lik = ligne[k] / diag[k]
+            if seuil is not None and abs(lik) < seuil * normes[i]:
+                continue  # Coefficient abandonné
+            coefficients.append((k, lik))
+            aii -= lik ** 2
+            for r, lrk in colonnes[k]:
+                if r in ligne:
+                    ligne[r] -= lik * lrk
+                elif seuil is not None:
+                    ligne[r] = -lik * lrk  # Remplissage
+                if r not in vus and r in ligne:
+                    vus.add(r)
+                    heapq.heappush(a_traiter, r)
+
+        if aii <= 0:
+            raise ValueError('Pivot négatif en ligne {} - factorisation incomplète impossible (essayer un décalage).'
+                             .format(i))
+        diag[i] = sqrt(aii)
+
+        for k, lik in coefficients:
+            colonnes[k].append((i, lik))
+            indices.append(k)
+            valeurs.append(lik)
+        indices.append(i)
+        valeurs.append(diag[i])
+        indptr.append(len(indices))
+
+    return csr_matrix((valeurs, indices, indptr), shape=(n, n))
+
+
+def preconditionneur_choleski(L):
+    """
+    Construit le préconditionneur r -> (L L^T)^-1 r associé à la factorisation (éventuellement incomplète) `L` au
+    format CSR : une descente puis une remontée creuses.
+    :param L: la matrice L au format CSR (cf. `factorisation_choleski_incomplete`).
+    :return: la fonction r -> (L L^T)^-1 r.
+    """
+    L = csr_matrix(L)
+    LT = csr_matrix(L.T)
+
+    return lambda r: spsolve_triangular(LT, spsolve_triangular(L, r, lower=True), lower=False)
+
+
+def _factorisation_LDLt_tridiagonale(d, l):
+    """
+    Factorise sur place la matrice symétrique tridiagonale de diagonale `d` et de sous-diagonale `l` (tableaux numpy
+    de float64) suivant la décomposition A = L D L^T, L étant bidiagonale inférieure unité : `d` reçoit D et `l` la
+    sous-diagonale de L. Aucune racine carrée n'est calculée.
+    Le calcul est confié à LAPACK (`dpttrf`), qui exige une matrice définie positive ; sinon, la récurrence est menée
+    en Python, et seuls des pivots non nuls sont exigés.
+    :param d: la diagonale de la matrice, remplacée par celle de D.
+    :param l: la sous-diagonale de la matrice, remplacée par celle de L.
+    :return: les tableaux `d` et `l`.
+    """
+    D, L, info = dpttrf(d, l)  # Copies : `dpttrf` s'arrête en cours de route si A n'est pas définie positive
+    if info == 0:
+        d[:] = D
+        l[:] = L
+        return d, l
+
+    diag, sous_diag = d.tolist(), l.tolist()
+
+    for i in range(1, len(diag)):
+        if diag[i - 1] == 0:
+            raise ValueError('Pivot nul en position {} - factorisation LDL^T impossible.'.format(i - 1))
+        sous_diag[i - 1] /= diag[i - 1]
+        diag[i] -= sous_diag[i - 1] ** 2 * diag[i - 1]
+    if diag and diag[-1] == 0:
+        raise ValueError('Pivot nul en position {} - factorisation LDL^T impossible.'.format(len(diag) - 1))
+
+    d[:] = diag
+    l[:] = sous_diag
+
+    return d, l
+
+
+def _resolution_LDLt_tridiagonale(d, l, x):
+    """
+    Résout sur place L D L^T x = b, le tableau `x` contenant initialement b (vecteur, ou matrice n x k des seconds
+    membres) : descente Ly = b, division par D, puis remontée L^T x = y, en O(n), par LAPACK (`dpttrs`). Un vecteur
+    contigu de float64 est résolu sans allocation ; une matrice qui n'est pas stockée colonne par colonne est copiée.
+    :param d: la diagonale de D (cf. `_factorisation_LDLt_tridiagonale`).
+    :param l: la sous-diagonale de L.
+    :param x: le tableau numpy du second membre, remplacé par la solution.
+    :return: le tableau `x`.
+    """
+    if len(x) == 0:
+        return x
+
+    y, _ = dpttrs(d, l, x, overwrite_b=1)
+    if not np.shares_memory(y, x):
+        x[...] = y
+
+    return x
+
+
+class FactorisationLDLtTridiagonale:
+    """
+    Factorisation A = L D L^T d'une matrice symétrique tridiagonale, stockée sous forme de deux tableaux : la
+    diagonale `d` de D (taille n) et la sous-diagonale `l` de L (taille n-1). Factorisation et résolutions coûtent
+    O(n), sans racine carrée (contrairement à `factorisation_choleski_tridiagonal`), et sont calculées par LAPACK
+    (`dpttrf`, `dpttrs`). La matrice n'a pas besoin d'être définie positive (seulement de pivots non nuls), la
+    factorisation étant alors menée en Python.
+    Les matrices de l'équation de la chaleur ne sont pas symétriques à cause de leurs lignes de conditions aux bornes,
+    qui sont des lignes de l'identité (températures imposées) : `depuis_tridiagonale` reconnaît ces lignes, factorise
+    la partie intérieure (symétrique) et reporte les températures imposées dans le second membre à chaque résolution.
+    """
+
+    def __init__(self, diag, sous_diag):
+        """
+        :param diag: la diagonale de la matrice symétrique tridiagonale.
+        :param sous_diag: sa sous-diagonale (égale à sa sur-diagonale).
+        """
+        self.d = np.array(diag, dtype=np.float64)
+        self.l = np.array(sous_diag, dtype=np.float64)
+        self.bords = None  # Couplages (A[1][0], A[n-2][n-1]) des lignes de conditions aux bornes, le cas échéant
+        self.n = len(self.d)
+        _factorisation_LDLt_tridiagonale(self.d, self.l)
+
+    @classmethod
+    def depuis_tridiagonale(cls, A):
+        """
+        :param A: la matrice tridiagonale (`MatriceTridiagonale`), symétrique, ou symétrique à l'exception de ses
+        lignes 0 et n-1 lorsque celles-ci sont des lignes de l'identité (conditions aux bornes).
+        :return: la factorisation.
+        """
+        inf, diag, sup = np.asarray(A.inf), np.asarray(A.diag), np.asarray(A.sup)
+        if np.array_equal(inf, sup):
+            return cls(diag, inf)
+
+        n = len(diag)
+        if n < 3 or diag[0] != 1 or diag[-1] != 1 or sup[0] != 0 or inf[-1] != 0 \
+                or not np.array_equal(inf[1:-1], sup[1:-1]):
+            raise ValueError('Matrice tridiagonale non symétrique - factorisation LDL^T impossible.')
+
+        facto = cls(diag[1:-1], inf[1:-1])
+        facto.bords = (float(inf[0]), float(sup[-1]))
+        facto.n = n
+
+        return facto
+
+    def solve(self, b):
+        """
+        Résout l'équation Ax = b d'inconnue x.
+        :param b: le vecteur second membre, ou la matrice n x k des seconds membres (non modifié).
+        :return: la solution x.
+        """
+        return self.solve_into(b, np.empty(np.shape(b)))
+
+    def solve_into(self, b, out):
+        """
+        Résout l'équation Ax = b d'inconnue x en écrivant la solution dans le tableau `out`, sans autre allocation
+        pour un vecteur (cf. `_resolution_LDLt_tridiagonale`). `out` peut être `b` lui-même.
+        :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
+        :param out: le tableau de flottants recevant la solution, de même forme que `b`.
+        :return: le tableau `out`.
+        """
+        if out is not b:
+            out[...] = b
+
+        if self.bords is None:
+            _resolution_LDLt_tridiagonale(self.d, self.l, out)
+            return out
+
+        # Les températures imposées x[0] = b[0] et x[n-1] = b[n-1] passent dans le second membre des lignes 1 et n-2
+        interieur = out[1:-1]
+        interieur[0] -= self.bords[0] * out[0]
+        interieur[-1] -= self.bords[1] * out[-1]
+        _resolution_LDLt_tridiagonale(self.d, self.l, interieur)
+
+        return out
+
+
+class FactorisationCholeskiCreuse:
+    """
+    Factorisation de Choleski P A P^T = L L^T d'une matrice creuse symétrique définie positive A (CSR ou CSC), en trois
+    phases (cf. `lu.FactorisationLUCreuse` et `creux.py`) :
+     1. renumérotation P des inconnues limitant le remplissage de L,
+     2. analyse symbolique : arbre d'élimination et structure de chaque colonne de L,
+     3. factorisation numérique, colonne par colonne ("left-looking"), sur la structure prévue.
+    Les phases 1 et 2 ne dépendent que de la structure de A : lorsque seules les valeurs changent (beta, dt, ...),
+    `refactorisation` ne refait que la phase 3.
+    Seul le triangle inférieur de A est lu. Une `ValueError` est levée si A n'est pas définie positive.
+    """
+
+    def __init__(self, A, ordre='degre_minimal', symbolique=None):
+        """
+        :param A: la matrice creuse symétrique définie positive (CSR, CSC ou pleine).
+        :param ordre: (default='degre_minimal') la renumérotation : 'degre_minimal', 'rcm' ou None.
+        :param symbolique: (default=None) une analyse symbolique déjà calculée pour une matrice de même structure.
+        """
+        A = csc_matrix(A)
+        self.symbolique = symbolique if symbolique is not None else AnalyseSymbolique(A, ordre)
+        self.n = self.symbolique.n
+        self._structure = (A.indptr.copy(), A.indices.copy())  # Pour `refactorisation` à partir des seules valeurs
+
+        # Position de la ligne j dans la structure de chaque colonne k de `colonnes[j]`, calculée une fois pour toutes
+        self._positions = [[] for _ in range(self.n)]
+        for k in range(self.n):
+            for p, j in enumerate(self.symbolique.lignes[k].tolist()):
+                self._positions[j].append(p)
+
+        self.refactorisation(A)
+
+    def refactorisation(self, valeurs):
+        """
+        Factorise numériquement une nouvelle matrice de même structure que la matrice analysée, en réutilisant la
+        renumérotation et l'analyse symbolique.
+        :param valeurs: la nouvelle matrice (CSR, CSC ou pleine), ou le seul tableau de ses coefficients non nuls,
+        dans l'ordre du stockage CSC de la matrice initiale (attribut `data` de celle-ci au format CSC).
+        :return: la factorisation, mise à jour.
+        """
+        if np.ndim(valeurs) == 1:
+            indptr, indices = self._structure
+            valeurs = csc_matrix((valeurs, indices, indptr), shape=(self.n, self.n))
+
+        C = self.symbolique.matrice_renumerotee(valeurs)
+        lignes, colonnes = self.symbolique.lignes, self.symbolique.colonnes
+
+        self.diag = np.empty(self.n)
+        self.L = []  # Coefficients de la colonne j de L (hors diagonale), aux lignes `lignes[j]`
+
+        x = np.zeros(self.n)  # Colonne courante, pleine
+        for j in range(self.n):
+            debut, fin = C.indptr[j], C.indptr[j + 1]
+            bas = C.indices[debut:fin] >= j
+            x[C.indices[debut:fin][bas]] = C.data[debut:fin][bas]
+
+            # Contribution des colonnes k précédentes telles que L[j][k] != 0, restreinte aux lignes >= j
+            for k, p in zip(colonnes[j].tolist(), self._positions[j]):
+                x[lignes[k][p:]] -= self.L[k][p:] * self.L[k][p]
+
+            if x[j] <= 0:
+                raise ValueError('Pivot négatif ou nul en position {} - matrice non définie positive.'.format(j))
+
+            self.diag[j] = sqrt(x[j])
+            self.L.append(x[lignes[j]] / self.diag[j])
+
+            x[lignes[j]] = 0
+            x[j] = 0
+
+        return self
+
+    def solve(self, b):
+        """
+        Résout l'équation Ax = b d'inconnue x.
+        :param b: le vecteur second membre, ou la matrice n x k des seconds membres (non modifié).
+        :return: la solution x.
+        """
+        return self.solve_into(b, np.empty(np.shape(b)))
+
+    def solve_into(self, b, out):
+        """
+        Résout l'équation Ax = b d'inconnue x en écrivant la solution dans le tableau `out`.
+        :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
+        :param out: le tableau de flottants recevant la solution, de même forme que `b` (éventuellement `b`).
+        :return: le tableau `out`.
+        """
+        lignes = self.symbolique.lignes
+        y = np.asarray(b, dtype=np.float64)[self.symbolique.permutation]
+
+        # Descente Ly = Pb, puis remontée L^T x = y
+        for j in range(self.n):
+            y[j] /= self.diag[j]
+            y[lignes[j]] -= np.multiply.outer(self.L[j], y[j])
+        for j in reversed(range(self.n)):
+            y[j] -= self.L[j] @ y[lignes[j]]
+            y[j] /= self.diag[j]
+
+        out[self.symbolique.permutation] = y
+
+        return out
+
+
 '''
 A = [[1, 2, 0, 0], [2, 5, 3, 0], [0, 3, 10, 4], [0, 0, 4, 17]]
 L = factorisation_choleski_tridiagonal(A)
@@ -0,0 +1,230 @@
+import heapq
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix
+
+
+# Ce fichier contient les outils communs aux factorisations de matrices creuses (cf. `lu.py` et `choleski.py`) :
+# - les renumérotations des inconnues limitant le remplissage des facteurs,
+# - l'analyse symbolique, qui prévoit la structure des facteurs avant tout calcul numérique.
+
+# Note : Les matrices sont données au format CSR ou CSC de `scipy.sparse` (ou comme matrices pleines). Les
+# renumérotations et l'analyse symbolique ne dépendent que de la structure de la matrice A + A^T : elles peuvent donc
+# être réutilisées pour toute matrice de même structure, quelles que soient ses valeurs.
+
+
+# [1] STRUCTURE
+
+def structure_symetrique(
+        A
+) -> csr_matrix:
+    """
+    Renvoie la structure de la matrice A + A^T, sans la diagonale.
+    :param A: la matrice carrée (CSR, CSC ou pleine).
+    :return: la matrice CSR dont les coefficients non nuls (égaux à 1) sont ceux de A + A^T hors diagonale, les
+    coefficients stockés de A étant comptés même s'ils sont nuls.
+    """
+
+    A = csr_matrix(A)
+    if A.shape[0] != A.shape[1]:
+        raise ValueError('La matrice doit être carrée.')
+
+    # Les coefficients stockés égaux à zéro font partie de la structure : ils peuvent devenir non nuls lors d'une
+    # `refactorisation`. La somme porte donc sur des coefficients égaux à 1, et non sur les valeurs de A.
+    A = csr_matrix((np.ones(A.nnz), A.indices, A.indptr), shape=A.shape)
+    S = A + A.T
+    S.setdiag(0)
+    S.eliminate_zeros()
+    S.data[:] = 1
+
+    return csr_matrix(S)
+
+
+# [2] RENUMEROTATIONS
+
+def ordre_cuthill_mckee_inverse(
+        S: csr_matrix
+) -> np.ndarray:
+    """
+    Calcule la renumérotation de Cuthill-McKee inverse (RCM) du graphe de structure `S` : parcours en largeur depuis
+    un sommet de degré minimal, les voisins étant visités par degré croissant, puis inversion de l'ordre obtenu.
+    Cette renumérotation réduit la largeur de bande, et donc le remplissage d'une factorisation sans pivot.
+    :param S: la structure symétrique de la matrice (cf. `structure_symetrique`).
+    :return: la permutation p, telle que la matrice renumérotée soit A[p][:, p].
+    """
+
+    n = S.shape[0]
+    degres = np.diff(S.indptr)
+    visite = np.zeros(n, dtype=bool)
+    ordre = []
+
+    # Un parcours par composante connexe, chacun démarrant au sommet non visité de plus petit degré
+    for depart in np.argsort(degres, kind='stable'):
+        if visite[depart]:
+            continue
+
+        visite[depart] = True
+        file = [depart]
+        k = 0
+        while k < len(file):
+            i = file[k]
+            k += 1
+            voisins = S.indices[S.indptr[i]:S.indptr[i + 1]]
+            voisins = voisins[~visite[voisins]]
+            voisins = voisins[np.argsort(degres[voisins], kind='stable')]
+            visite[voisins] = True
+            file.extend(voisins.tolist())
+
+        ordre.extend(file)
+
+    return np.array(ordre[::-1], dtype=np.int64)
+
+
+def ordre_degre_minimal(
+        S: csr_matrix
+) -> np.ndarray:
+    """
+    Calcule la renumérotation par degré minimal du graphe de structure `S` : à chaque étape, le sommet éliminé est
+    celui qui a le moins de voisins dans le graphe d'élimination, ses voisins étant alors reliés entre eux (ce qui
+    représente le remplissage). Contrairement à la variante approchée (AMD), les degrés sont ici exacts.
+    :param S: la structure symétrique de la matrice (cf. `structure_symetrique`).
+    :return: la permutation p, telle que la matrice renumérotée soit A[p][:, p].
+    """
+
+    n = S.shape[0]
+    voisins = [set(S.indices[S.indptr[i]:S.indptr[i + 1]].tolist()) for i in range(n)]
+    elimine = [False for _ in range(n)]
+    tas = [(len(voisins[i]), i) for i in range(n)]
+    heapq.heapify(tas)
+    ordre = []
+
+    while tas:
+        degre, i = heapq.heappop(tas)
+        if elimine[i] or degre != len(voisins[i]):
+            continue  # Entrée périmée : le degré de i a changé depuis son insertion
+
+        elimine[i] = True
+        ordre.append(i)
+        for j in voisins[i]:
+            voisins[j] |= voisins[i]
+            voisins[j] -= {i, j}
+            heapq.heappush(tas, (len(voisins[j]), j))
+        voisins[i] = set()
+
+    return np.array(ordre, dtype=np.int64)
+
+
+def renumerotation(
+        S: csr_matrix,
+        ordre: str = 'rcm'
+) -> np.ndarray:
+    """
+    :param S: la structure symétrique de la matrice (cf. `structure_symetrique`).
+    :param ordre: (default='rcm') 'rcm' (Cuthill-McKee inverse), 'degre_minimal', ou None (aucune renumérotation).
+    :return: la permutation p, telle que la matrice renumérotée soit A[p][:, p].
+    """
+
+    if ordre is None:
+        return np.arange(S.shape[0])
+    if ordre == 'rcm':
+        return ordre_cuthill_mckee_inverse(S)
+    if ordre == 'degre_minimal':
+        return ordre_degre_minimal(S)
+
+    raise ValueError("Renumérotation inconnue : '{}'.".format(ordre))
+
+
+# [3] ANALYSE SYMBOLIQUE
+
+class AnalyseSymbolique:
+    """
+    Structure des facteurs de la factorisation (sans pivot) d'une matrice de structure symétrique, renumérotée :
+      - `permutation` : la renumérotation p des inconnues,
+      - `parent` : l'arbre d'élimination (parent[j] est la première ligne non nulle de L sous la diagonale, dans la
+      colonne j, et -1 pour une racine),
+      - `lignes` : pour chaque colonne j, les indices (croissants) des lignes non nulles de L sous la diagonale,
+      - `colonnes` : pour chaque ligne j, les indices (croissants) des colonnes non nulles de L avant la diagonale,
+      c'est-à-dire les colonnes dont dépend la colonne j lors de la factorisation.
+    Par symétrie de la structure, la colonne j de U a pour structure la ligne j de L.
+    """
+
+    def __init__(
+            self,
+            A,
+            ordre: str = 'rcm'
+    ):
+        """
+        :param A: la matrice carrée (CSR, CSC ou pleine), dont seule la structure est utilisée.
+        :param ordre: (default='rcm') la renumérotation (cf. `renumerotation`).
+        """
+
+        S = structure_symetrique(A)
+        self.n = S.shape[0]
+        self.permutation = renumerotation(S, ordre)
+
+        inverse = np.empty(self.n, dtype=np.int64)
+        inverse[self.permutation] = np.arange(self.n)
+        self.inverse = inverse
+
+        # Structure de la matrice renumérotée
+        S = csr_matrix(S[self.permutation][:, self.permutation])
+
+        # Structure de la colonne j de L : les coefficients de A sous la diagonale, auxquels s'ajoute la structure de
+        # chaque colonne fille de j dans l'arbre d'élimination (privée de j).
+        self.parent = np.full(self.n, -1, dtype=np.int64)
+        enfants = [[] for _ in range(self.n)]
+        structures = [None for _ in range(self.n)]
+        self.lignes = []
+        for j in range(self.n):
+            voisins = S.indices[S.indptr[j]:S.indptr[j + 1]]
+            structure = set(voisins[voisins > j].tolist())
+            for c in enfants[j]:
+                structure |= structures[c]
+                structures[c] = None  # Plus utile : libération de la mémoire
+            structure.discard(j)
+
+            structures[j] = structure
+            if structure:
+                self.parent[j] = min(structure)
+                enfants[self.parent[j]].append(j)
+            self.lignes.append(np.array(sorted(structure), dtype=np.int64))
+
+        colonnes = [[] for _ in range(self.n)]
+        for j in range(self.n):
+            for i in self.lignes[j].tolist():
+                colonnes[i].append(j)
+        self.colonnes = [np.array(c, dtype=np.int64) for c in colonnes]
+
+        self.nnz_L = sum(len(lignes) for lignes in self.lignes)  # Hors diagonale
+
+        # Structure de L + L^T + I, qui contient celle de la matrice renumérotée (cf. `matrice_renumerotee`)
+        lignes = np.concatenate([np.arange(self.n)] + self.lignes)
+        colonnes = np.concatenate([np.arange(self.n)] + [np.full(len(l), j) for j, l in enumerate(self.lignes)])
+        self._structure = csc_matrix((np.ones(len(lignes)), (lignes, colonnes)), shape=(self.n, self.n))
+        self._structure = self._structure + self._structure.T
+        self._structure.data[:] = 1
+
+    def matrice_renumerotee(
+            self,
+            A
+    ) -> csc_matrix:
+        """
+        Renvoie une `ValueError` si A a un coefficient non nul hors de la structure analysée : les facteurs calculés
+        sur cette structure seraient faux.
+        :param A: une matrice de même structure que celle analysée.
+        :return: la matrice renumérotée A[p][:, p], au format CSC.
+        """
+
+        A = csc_matrix(A)
+        if A.shape != (self.n, self.n):
+            raise ValueError('La matrice doit être de taille {} x {}.'.format(self.n, self.n))
+
+        C = csc_matrix(A[self.permutation][:, self.permutation])
+        hors_structure = abs(C) - abs(C).multiply(self._structure)
+        hors_structure.eliminate_zeros()
+        if hors_structure.nnz:
+            i, j = hors_structure.nonzero()
+            raise ValueError('Coefficient non nul hors de la structure analysée, en position ({}, {}).'.format(
+                self.permutation[i[0]], self.permutation[j[0]]))
+
+        return C
@@ -0,0 +1,261 @@
+from collections import namedtuple
+
+import numpy as np
+from scipy.linalg import solve_triangular
+from scipy.sparse import csr_matrix, diags, issparse, tril
+from scipy.sparse.linalg import spsolve_triangular
+
+
+# Ce fichier contient des méthodes itératives de résolution du système Ax = b : Jacobi, Gauss-Seidel, SOR
+# (sur-relaxation successive) et gradient conjugué. Contrairement aux méthodes directes (cf. `lu.py`), elles ne
+# factorisent pas A : chaque itération ne demande qu'un produit matrice-vecteur (et, sauf pour le gradient conjugué,
+# une résolution triangulaire ou diagonale). Partant d'une bonne approximation de la solution, par exemple le champ
+# de température du pas de temps précédent, quelques itérations suffisent.
+
+# Note : La matrice A peut être donnée :
+# - pleine (liste de listes ou tableau numpy),
+# - creuse (CSR ou tout format de `scipy.sparse`),
+# - sous forme d'opérateur, c'est-à-dire d'une fonction x -> Ax (gradient conjugué et Jacobi uniquement, la diagonale
+# de A devant alors être fournie pour Jacobi).
+
+# Note : Les itérations s'arrêtent dès que ||b - Ax||_2 <= tol * ||b||_2, ou après `iter_max` itérations. La norme du
+# résidu à chaque itération est conservée dans le suivi de convergence renvoyé avec la solution.
+
+
+Convergence = namedtuple('Convergence', ['converge', 'iterations', 'residus'])
+Convergence.__doc__ = """
+Suivi de convergence d'une méthode itérative : si la tolérance a été atteinte, le nombre d'itérations effectuées et
+la liste des normes du résidu ||b - Ax_k||_2 (de l'itéré initial au dernier).
+"""
+
+
+# [0] OUTILS
+
+def _operateur(
+        A
+):
+    """
+    :param A: la matrice (pleine ou creuse) ou l'opérateur x -> Ax.
+    :return: l'opérateur x -> Ax.
+    """
+
+    if callable(A):
+        return A
+    if issparse(A):
+        C = csr_matrix(A)
+        return C.dot
+
+    T = np.asarray(A, dtype=np.float64)
+    return T.dot
+
+
+def _initialisation(
+        b,
+        x0
+) -> tuple:
+    """
+    :return: le second membre et l'itéré initial (copié, nul par défaut) sous forme de tableaux de flottants, et la
+    norme du second membre.
+    """
+
+    b = np.asarray(b, dtype=np.float64)
+    x = np.zeros(b.shape) if x0 is None else np.array(x0, dtype=np.float64)
+    norme_b = np.linalg.norm(b)
+
+    return b, x, norme_b if norme_b > 0 else 1.
+
+
+# [1] METHODES STATIONNAIRES
+
+# Les méthodes de Jacobi, Gauss-Seidel et SOR découpent A = M - N, avec M facile à inverser, et itèrent
+#   x_{k+1} = x_k + M^-1 (b - A x_k)
+# où M vaut D (Jacobi), D + L (Gauss-Seidel) ou D/w + L (SOR), D et L désignant la diagonale et la partie strictement
+# triangulaire inférieure de A. Le résidu b - A x_k, nécessaire à l'itération, donne aussi le critère d'arrêt.
+
+def _iterations_stationnaires(
+        A,
+        b,
+        resoudre_M,
+        x0,
+        tol: float,
+        iter_max: int
+) -> tuple:
+    """
+    Itère x_{k+1} = x_k + M^-1 (b - A x_k) jusqu'à convergence.
+    :param resoudre_M: la fonction r -> M^-1 r.
+    :return: la solution x et le suivi de convergence.
+    """
+
+    produit = _operateur(A)
+    b, x, norme_b = _initialisation(b, x0)
+    residus = []
+
+    for k in range(iter_max + 1):
+        r = b - produit(x)
+        residus.append(float(np.linalg.norm(r)))
+        if residus[-1] <= tol * norme_b:
+            return x, Convergence(True, k, residus)
+        if k < iter_max:
+            x += resoudre_M(r)
+
+    return x, Convergence(False, iter_max, residus)
+
+
+def jacobi(
+        A,
+        b,
+        x0=None,
+        tol: float = 1e-8,
+        iter_max: int = 1000,
+        diagonale=None,
+        w: float = 1.
+) -> tuple:
+    """
+    Résout l'équation Ax = b par la méthode de Jacobi (éventuellement pondérée), qui converge notamment lorsque A
+    est à diagonale strictement dominante.
+    :param A: la matrice (pleine ou creuse) ou l'opérateur x -> Ax.
+    :param b: le vecteur second membre (non modifié).
+    :param x0: (default=None) l'itéré initial (non modifié), nul par défaut.
+    :param tol: (default=1e-8) la tolérance relative sur la norme du résidu.
+    :param iter_max: (default=1000) le nombre maximal d'itérations.
+    :param diagonale: (default=None) la diagonale de A, obligatoire si A est donnée sous forme d'opérateur.
+    :param w: (default=1.) le poids de la correction (Jacobi pondérée si w < 1).
+    :return: la solution x et le suivi de convergence.
+    """
+
+    if diagonale is None:
+        if callable(A):
+            raise ValueError("La diagonale de A doit être fournie lorsque A est donnée sous forme d'opérateur.")
+        diagonale = A.diagonal() if issparse(A) else np.diagonal(np.asarray(A, dtype=np.float64))
+
+    d = np.asarray(diagonale, dtype=np.float64)
+    if np.any(d == 0):
+        raise ZeroDivisionError('Coefficient diagonal nul - méthode de Jacobi impossible.')
+
+    return _iterations_stationnaires(A, b, lambda r: w * r / d, x0, tol, iter_max)
+
+
+def sor(
+        A,
+        b,
+        w: float = 1.,
+        x0=None,
+        tol: float = 1e-8,
+        iter_max: int = 1000
+) -> tuple:
+    """
+    Résout l'équation Ax = b par la méthode de sur-relaxation successive (SOR) de paramètre `w`, qui converge pour
+    0 < w < 2 lorsque A est symétrique définie positive. Pour w = 1, c'est la méthode de Gauss-Seidel.
+    Chaque itération résout un système triangulaire inférieur de matrice D/w + L.
+    :param A: la matrice, pleine ou creuse (un opérateur ne suffit pas).
+    :param b: le vecteur second membre (non modifié).
+    :param w: (default=1.) le paramètre de relaxation.
+    :param x0: (default=None) l'itéré initial (non modifié), nul par défaut.
+    :param tol: (default=1e-8) la tolérance relative sur la norme du résidu.
+    :param iter_max: (default=1000) le nombre maximal d'itérations.
+    :return: la solution x et le suivi de convergence.
+    """
+
+    if callable(A):
+        raise ValueError("La méthode SOR a besoin des coefficients de A : un opérateur ne suffit pas.")
+    if not 0 < w < 2:
+        raise ValueError('Le paramètre de relaxation doit vérifier 0 < w < 2.')
+
+    A = csr_matrix(A) if issparse(A) else np.asarray(A, dtype=np.float64)
+    d = A.diagonal()
+    if np.any(d == 0):
+        raise ZeroDivisionError('Coefficient diagonal nul - méthode SOR impossible.')
+
+    # M = D/w + L
+    if issparse(A):
+        M = csr_matrix(tril(A, -1) + diags(d / w))
+        resoudre_M = lambda r: spsolve_triangular(M, r, lower=True)
+    else:
+        M = np.tril(A, -1) + np.diag(d / w)
+        resoudre_M = lambda r: solve_triangular(M, r, lower=True)
+
+    return _iterations_stationnaires(A, b, resoudre_M, x0, tol, iter_max)
+
+
+def gauss_seidel(
+        A,
+        b,
+        x0=None,
+        tol: float = 1e-8,
+        iter_max: int = 1000
+) -> tuple:
+    """
+    Résout l'équation Ax = b par la méthode de Gauss-Seidel (cf. `sor` avec w = 1), qui converge lorsque A est à
+    diagonale strictement dominante ou symétrique définie positive.
+    :param A: la matrice, pleine ou creuse (un opérateur ne suffit pas).
+    :param b: le vecteur second membre (non modifié).
+    :param x0: (default=None) l'itéré initial (non modifié), nul par défaut.
+    :param tol: (default=1e-8) la tolérance relative sur la norme du résidu.
+    :param iter_max: (default=1000) le nombre maximal d'itérations.
+    :return: la solution x et le suivi de convergence.
+    """
+
+    return sor(A, b, 1., x0, tol, iter_max)
+
+
+# [2] GRADIENT CONJUGUE
+
+def gradient_conjugue(
+        A,
+        b,
+        x0=None,
+        tol: float = 1e-8,
+        iter_max: int = None,
+        preconditionneur=None
+) -> tuple:
+    """
+    Résout l'équation Ax = b, pour A symétrique définie positive, par la méthode du gradient conjugué : les
+    directions de descente successives sont A-orthogonales, et l'erreur décroît d'autant plus vite que le
+    conditionnement de A est faible. Chaque itération demande un seul produit matrice-vecteur.
+    Avec un préconditionneur M ~ A (symétrique défini positif), c'est le conditionnement de M^-1 A qui compte : par
+    exemple, une factorisation de Choleski incomplète (cf. `choleski.factorisation_choleski_incomplete`).
+    :param A: la matrice (pleine ou creuse) ou l'opérateur x -> Ax.
+    :param b: le vecteur second membre (non modifié).
+    :param x0: (default=None) l'itéré initial (non modifié), nul par défaut.
+    :param tol: (default=1e-8) la tolérance relative sur la norme du résidu.
+    :param iter_max: (default=None) le nombre maximal d'itérations, la taille du système par défaut (en arithmétique
+    exacte, la méthode converge en au plus n itérations).
+    :param preconditionneur: (default=None) la fonction r -> M^-1 r (cf. `choleski.preconditionneur_choleski`), ou
+    un objet muni d'une méthode `solve`.
+    :return: la solution x et le suivi de convergence.
+    """
+
+    produit = _operateur(A)
+    b, x, norme_b = _initialisation(b, x0)
+    if iter_max is None:
+        iter_max = len(b)
+    if preconditionneur is None:
+        preconditionneur = np.copy
+    elif not callable(preconditionneur):
+        preconditionneur = preconditionneur.solve
+
+    r = b - produit(x)
+    z = preconditionneur(r)
+    p = z.copy()
+    rz = np.dot(r, z)
+    residus = [float(np.linalg.norm(r))]
+
+    for k in range(iter_max):
+        if residus[-1] <= tol * norme_b:
+            return x, Convergence(True, k, residus)
+
+        Ap = produit(p)
+        pAp = np.dot(p, Ap)
+        if pAp <= 0:
+            raise ValueError('Direction de courbure négative ou nulle - la matrice n\'est pas définie positive.')
+
+        alpha = rz / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        residus.append(float(np.linalg.norm(r)))
+        z = preconditionneur(r)
+        rz, rz_precedent = np.dot(r, z), rz
+        p *= rz / rz_precedent
+        p += z
+
+    return x, Convergence(residus[-1] <= tol * norme_b, iter_max, residus)
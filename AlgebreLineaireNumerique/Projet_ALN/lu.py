@@ -1,4 +1,12 @@
 import copy
+import mmap
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from creux import AnalyseSymbolique
 
 
 # Ce fichier contient un certain nombre de fonctions permettant de résoudre de diverses façons un système linéaire
@@ -8,6 +16,64 @@ import copy
 # - celles démarrant par un "tiret du bas" contiennent la logique des opérations effectuées.
 # - celles NE démarrant PAS par un tel tiret gèrent ce qu'il y a autour de la logique, comme la gestion de la mémoire.
 
+# Note : Les calculs sont effectués sur des tableaux numpy de flottants (float64 par défaut) :
+# - chaque étape d'élimination est une mise à jour de rang 1 de la sous-matrice restante.
+# - chaque étape de descente/remontée est un produit scalaire entre une portion de ligne et une portion du vecteur.
+# Les matrices et vecteurs peuvent être donnés sous forme de listes Python ou de tableaux numpy : le résultat est
+# réécrit dans l'objet d'origine, qui est renvoyé.
+
+
+# [0] OUTILS
+
+# Nombre de lignes traitées par bloc lors des descentes/remontées : la contribution des blocs déjà résolus est
+# soustraite en un seul produit matrice-vecteur (ou matrice-matrice pour plusieurs seconds membres).
+_TAILLE_BLOC_RESOLUTION = 64
+
+
+def _vers_tableau(
+        A
+) -> np.ndarray:
+    """
+    Renvoie `A` sous forme de tableau numpy de flottants.
+    Si `A` est déjà un tableau de flottants, il est renvoyé tel quel afin que les calculs soient effectués sur place.
+    Sinon (liste Python, tableau d'entiers), une copie en float64 est créée.
+    :param A: la matrice ou le vecteur à convertir.
+    :return: le tableau numpy correspondant.
+    """
+
+    if isinstance(A, np.ndarray) and A.dtype.kind == 'f':
+        return A
+
+    return np.array(A, dtype=np.float64)
+
+
+def _depuis_tableau(
+        A,
+        T: np.ndarray
+):
+    """
+    Réécrit les coefficients du tableau `T` dans l'objet d'origine `A` lorsque les calculs n'ont pas pu y être menés
+    sur place (cf. `_vers_tableau`).
+    Un tableau numpy d'entiers ne pouvant pas recevoir de flottants, c'est alors `T` qui est renvoyé.
+    :param A: la matrice ou le vecteur d'origine.
+    :param T: le tableau contenant le résultat des calculs.
+    :return: l'objet contenant le résultat.
+    """
+
+    if T is A:
+        return A
+
+    if isinstance(A, np.ndarray):
+        return T
+
+    if T.ndim == 1:
+        A[:] = T.tolist()
+    else:
+        for ligne, valeurs in zip(A, T):
+            ligne[:] = valeurs.tolist()
+
+    return A
+
 
 # [1] METHODES SANS PERMUTATION
 
@@ -26,7 +92,8 @@ def _factorisation_LU(
     :return: la matrice `A` factorisée.
     """
 
-    n = len(A)
+    T = _vers_tableau(A)
+    n = len(T)
 
     #      j=0     n-2
     # i=0 (a11 a12 ... a1n) => (a11     a12     ... a1n)
@@ -35,13 +102,17 @@ def _factorisation_LU(
     #     (... ... ... ...) => (...     ...     ... ...
     # n-1 (an1 an2 ... ann) => (an1/a11 an2/a22 ... ann)
     for j in range(n - 1):
-        for i in range(j + 1, n):
-            A[i][j] /= A[j][j]
+        if T[j, j] == 0:
+            raise ZeroDivisionError('Pivot nul en position {} - utiliser une méthode avec pivot.'.format(j))
 
-        for i in range(j + 1, n):
-            for l in range(j + 1, n):
-                A[i][l] -= A[i][j] * A[j][l]
-    return A
+        T[j + 1:, j] /= T[j, j]
+
+        # Mise à jour de rang 1 de la sous-matrice restante
+        T[j + 1:, j + 1:] -= np.outer(T[j + 1:, j], T[j, j + 1:])
+    if n and T[n - 1, n - 1] == 0:
+        raise ZeroDivisionError('Pivot nul en position {} - utiliser une méthode avec pivot.'.format(n - 1))
+
+    return _depuis_tableau(A, T)
 
 
 def factorisation_LU(
@@ -70,25 +141,31 @@ def _descente(
 ) -> list:
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
+    Plusieurs seconds membres peuvent être traités ensemble en les donnant comme colonnes d'une matrice n x k.
     :param A: la matrice provenant de la factorisation LU.
-    :param b: le vecteur second membre.
-    :return: le vecteur y intermédiaire.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
+    :return: le vecteur (ou la matrice n x k) y intermédiaire.
     """
 
-    n = len(A)
+    LU = _vers_tableau(A)
+    y = _vers_tableau(b)
+    n = len(LU)
 
     # ( 1   0  ...  0) (y1)   (b1)
     # (a21  1  ...  0) (y2)   (b2)
     # (a31 a32 ...  0) (y3) = (b3)
     # (... ... ...  0) (..)   (..)
     # (an1 an2 ...  1) (yn)   (bn)
-    for i in range(n):
-        #print(A, b)
-        for j in range(i):
-            b[i] -= A[i][j] * b[j]
-            #print("{} -= {} * {}".format(b[i], A[i][j], b[j]))
+    for i0 in range(0, n, _TAILLE_BLOC_RESOLUTION):
+        i1 = min(n, i0 + _TAILLE_BLOC_RESOLUTION)
 
-    return b
+        # Contribution des lignes déjà résolues, en un seul produit
+        y[i0:i1] -= LU[i0:i1, :i0] @ y[:i0]
+
+        for i in range(i0 + 1, i1):
+            y[i] -= np.dot(LU[i, i0:i], y[i0:i])
+
+    return _depuis_tableau(b, y)
 
 
 def descente(
@@ -99,7 +176,7 @@ def descente(
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
     :param A: la matrice provenant de la factorisation LU.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :param keep: (default=False) si le vecteur doit être gardé intacte. Sinon, les coefficients du vecteur seront
     réécrits pour économiser de l'espace mémoire.
     écrits dans la matrice `A` initiale.
@@ -119,9 +196,10 @@ def remontee(
 ) -> list:
     """
     Applique l'étape de remontée à l'équation Ux = y
+    Plusieurs seconds membres peuvent être traités ensemble en les donnant comme colonnes d'une matrice n x k.
     :param A : la matrice provenant de la factorisation LU.
-    :param y: le vecteur second membre intermédiaire.
-    :return: la solution x à l'équation Ux = y d'inconnue x.
+    :param y: le vecteur (ou la matrice n x k) second membre intermédiaire.
+    :return: la solution x (ou la matrice n x k des solutions) à l'équation Ux = y d'inconnue x.
     """
 
     # (a11 a12 ... a1n) (x1)   (y1)
@@ -129,13 +207,20 @@ def remontee(
     # ( 0   0  ... a3n) (x3) = (y3)
     # (... ... ... ...) (..)   (..)
     # ( 0   0  ... ann) (xn)   (yn)
-    n = len(A)
-    for i in reversed(range(n)):
-        for j in range(i + 1, n):
-            y[i] -= A[i][j] * y[j]
-        y[i] /= A[i][i]
+    LU = _vers_tableau(A)
+    x = _vers_tableau(y)
+    n = len(LU)
+    for i0 in reversed(range(0, n, _TAILLE_BLOC_RESOLUTION)):
+        i1 = min(n, i0 + _TAILLE_BLOC_RESOLUTION)
 
-    return y
+        # Contribution des lignes déjà résolues, en un seul produit
+        x[i0:i1] -= LU[i0:i1, i1:] @ x[i1:]
+
+        for i in reversed(range(i0, i1)):
+            x[i] -= np.dot(LU[i, i + 1:i1], x[i + 1:i1])
+            x[i] /= LU[i, i]
+
+    return _depuis_tableau(y, x)
 
 
 def gauss_sans_permutation(
@@ -149,7 +234,7 @@ def gauss_sans_permutation(
     nuls, et entrainer une division par zéro.
     Dès lors qu'une exception `ZeroDivisionError` est levée, A est une telle matrice problématique.
     :param A: la matrice du système linéaire d'équations.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :param keep: si les objets initiaux doivent être conservés intactes.
     :return: la solution à l'équation Ax = b d'inconnue x.
     """
@@ -162,6 +247,102 @@ def gauss_sans_permutation(
 
 
 # [1 bis] METHODES SANS PERMUTATION TRIDIAGONALES
+
+class MatriceTridiagonale:
+    """
+    Matrice carrée tridiagonale de taille n, stockée sous la forme de trois tableaux numpy de flottants :
+      - `inf` : la sous-diagonale, de taille n-1 (inf[i] = A[i+1][i]).
+      - `diag` : la diagonale, de taille n (diag[i] = A[i][i]).
+      - `sup` : la sur-diagonale, de taille n-1 (sup[i] = A[i][i+1]).
+    Le stockage est en O(n), contre O(n²) pour une matrice pleine.
+    Après factorisation LU (cf. `factorisation_LU_tridiagonal`), `inf` contient les coefficients de L et `diag`, `sup`
+    ceux de U, de la même manière que pour une matrice pleine factorisée.
+    """
+
+    def __init__(
+            self,
+            inf,
+            diag,
+            sup
+    ):
+        """
+        :param inf: la sous-diagonale, de taille n-1.
+        :param diag: la diagonale, de taille n.
+        :param sup: la sur-diagonale, de taille n-1.
+        """
+
+        self.inf = np.array(inf, dtype=np.float64)
+        self.diag = np.array(diag, dtype=np.float64)
+        self.sup = np.array(sup, dtype=np.float64)
+
+        n = len(self.diag)
+        if len(self.inf) != n - 1 or len(self.sup) != n - 1:
+            raise ValueError('Les sous- et sur-diagonales doivent être de taille {}.'.format(n - 1))
+
+    @classmethod
+    def depuis_diags(
+            cls,
+            diagonales: list,
+            decalages: list = (0, -1, 1)
+    ) -> 'MatriceTridiagonale':
+        """
+        Construit la matrice à partir des diagonales telles que données à `scipy.sparse.diags`.
+        :param diagonales: la liste des diagonales, par exemple `[diag, lower_band, upper_band]`.
+        :param decalages: (default=(0, -1, 1)) le décalage de chaque diagonale par rapport à la diagonale principale.
+        :return: la matrice tridiagonale.
+        """
+
+        par_decalage = dict(zip(decalages, diagonales))
+        if set(par_decalage) != {-1, 0, 1}:
+            raise ValueError('Les décalages doivent être exactement -1, 0 et 1.')
+
+        return cls(par_decalage[-1], par_decalage[0], par_decalage[1])
+
+    @classmethod
+    def depuis_dense(
+            cls,
+            A
+    ) -> 'MatriceTridiagonale':
+        """
+        Construit la matrice à partir des trois diagonales centrales d'une matrice pleine `A`.
+        :param A: la matrice pleine (liste de listes ou tableau numpy).
+        :return: la matrice tridiagonale.
+        """
+
+        T = np.asarray(A, dtype=np.float64)
+
+        return cls(np.diagonal(T, -1), np.diagonal(T), np.diagonal(T, 1))
+
+    def __len__(
+            self
+    ) -> int:
+        return len(self.diag)
+
+    def __matmul__(
+            self,
+            x
+    ) -> np.ndarray:
+        """
+        Produit matrice-vecteur en O(n).
+        """
+
+        x = np.asarray(x, dtype=np.float64)
+        y = self.diag * x
+        y[1:] += self.inf * x[:-1]
+        y[:-1] += self.sup * x[1:]
+
+        return y
+
+    def vers_dense(
+            self
+    ) -> np.ndarray:
+        """
+        :return: la matrice pleine correspondante (en O(n²) mémoire, à réserver aux petites tailles).
+        """
+
+        return np.diag(self.diag) + np.diag(self.inf, -1) + np.diag(self.sup, 1)
+
+
 def _factorisation_LU_tridiagonal(
         A: list,
 ) -> list:
@@ -173,10 +354,13 @@ def _factorisation_LU_tridiagonal(
     Ainsi A = LU, et la résolution de Ax = b se décompose comme suit :
      1. Ly = b d'inconnue y, avec y = Ux
      2. Ux = y d'inconnue x
-    :param A: la matrice à factoriser suivant la décomposition LU.
+    :param A: la matrice à factoriser suivant la décomposition LU (pleine ou `MatriceTridiagonale`).
     :return: la matrice `A` factorisée.
     """
 
+    if isinstance(A, MatriceTridiagonale):
+        return _factorisation_LU_thomas(A)
+
     n = len(A)
 
     #      j=0         n-2
@@ -186,7 +370,7 @@ def _factorisation_LU_tridiagonal(
     #     (... ... ... ... ...) => (...     ...     ... ...)
     # n-1 ( 0   0  ... ... ann) => (   0       0    ... ann)
     for j in range(n - 1):
-        A[j+1][j] /= A[j+1][j+1]
+        A[j+1][j] /= A[j][j]
         #for i in range(j + 1, j + 2):
         #    A[i][j] /= A[j][j]
 
@@ -198,13 +382,40 @@ def _factorisation_LU_tridiagonal(
     return A
 
 
+def _factorisation_LU_thomas(
+        A: MatriceTridiagonale
+) -> MatriceTridiagonale:
+    """
+    Factorise la matrice tridiagonale `A` suivant la décomposition LU (algorithme de Thomas), en O(n).
+    Les coefficients de L remplacent la sous-diagonale, ceux de U la diagonale (la sur-diagonale est inchangée).
+    :param A: la matrice tridiagonale à factoriser.
+    :return: la matrice `A` factorisée.
+    """
+
+    # La récurrence est intrinsèquement séquentielle : elle est menée sur des flottants Python, plus rapides d'accès
+    # que les éléments d'un tableau numpy pris un à un.
+    inf, diag, sup = A.inf.tolist(), A.diag.tolist(), A.sup.tolist()
+
+    for j in range(len(diag) - 1):
+        if diag[j] == 0:
+            raise ZeroDivisionError('Pivot nul en position {} - utiliser une méthode avec pivot.'.format(j))
+        inf[j] /= diag[j]
+        diag[j + 1] -= inf[j] * sup[j]
+    if diag and diag[-1] == 0:
+        raise ZeroDivisionError('Pivot nul en position {} - utiliser une méthode avec pivot.'.format(len(diag) - 1))
+
+    A.inf[:], A.diag[:] = inf, diag
+
+    return A
+
+
 def factorisation_LU_tridiagonal(
         A: list,
         keep: bool = False
 ) -> list:
     """
     Factorise la matrice carrée `A` suivant la décomposition LU tridiagonal.
-    :param A: la matrice à factoriser.
+    :param A: la matrice à factoriser (pleine ou `MatriceTridiagonale`).
     :param keep: (default=False) si la matrice doit être gardée intacte. Sinon, les coefficients de L et U seront
     écrits dans la matrice `A` initiale  pour économiser de l'espace mémoire.
     :return: la matrice `A` factorisée.
@@ -229,6 +440,9 @@ def _descente_tridiagonal(
     :return: le vecteur y intermédiaire.
     """
 
+    if isinstance(A, MatriceTridiagonale):
+        return _descente_thomas(A, b)
+
     n = len(A)
 
     # ( 1   0  ...  0) (y1)   (b1)
@@ -243,6 +457,36 @@ def _descente_tridiagonal(
     return b
 
 
+def _descente_thomas(
+        A: MatriceTridiagonale,
+        b: list
+) -> list:
+    """
+    Applique l'étape de descente à l'équation Ly = b, où L provient de la factorisation de la matrice tridiagonale
+    `A`, en O(n).
+    :param A: la matrice tridiagonale factorisée.
+    :param b: le vecteur second membre.
+    :return: le vecteur y intermédiaire.
+    """
+
+    y = _vers_tableau(b)
+
+    if y.ndim > 1:
+        # Plusieurs seconds membres : chaque étape porte sur une ligne entière
+        for i in range(1, len(y)):
+            y[i] -= A.inf[i - 1] * y[i - 1]
+        return _depuis_tableau(b, y)
+
+    inf, z = A.inf.tolist(), y.tolist()
+
+    for i in range(1, len(z)):
+        z[i] -= inf[i - 1] * z[i - 1]
+
+    y[:] = z
+
+    return _depuis_tableau(b, y)
+
+
 def descente_tridiagonal(
         A: list,
         b: list,
@@ -250,7 +494,7 @@ def descente_tridiagonal(
 ) -> list:
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
-    :param A: la matrice provenant de la factorisation LU.
+    :param A: la matrice provenant de la factorisation LU (pleine ou `MatriceTridiagonale`).
     :param b: le vecteur second membre.
     :param keep: (default=False) si le vecteur doit être gardé intacte. Sinon, les coefficients du vecteur seront
     réécrits pour économiser de l'espace mémoire.
@@ -271,11 +515,14 @@ def remontee_tridiagonal(
 ) -> list:
     """
      Applique l'étape de remontée à l'équation Ux = y
-     :param A : la matrice provenant de la factorisation LU.
+     :param A : la matrice provenant de la factorisation LU (pleine ou `MatriceTridiagonale`).
      :param y: le vecteur second membre intermédiaire.
      :return: la solution x à l'équation Ux = y d'inconnue x.
      """
 
+    if isinstance(A, MatriceTridiagonale):
+        return _remontee_thomas(A, y)
+
     # (a11 a12 ...  0 ) (x1)   (y1)
     # ( 0  a22 ...  0 ) (x2)   (y2)
     # ( 0   0  ...  0 ) (x3) = (y3)
@@ -290,6 +537,193 @@ def remontee_tridiagonal(
     return y
 
 
+def _remontee_thomas(
+        A: MatriceTridiagonale,
+        y: list
+) -> list:
+    """
+    Applique l'étape de remontée à l'équation Ux = y, où U provient de la factorisation de la matrice tridiagonale
+    `A`, en O(n).
+    :param A: la matrice tridiagonale factorisée.
+    :param y: le vecteur second membre intermédiaire.
+    :return: la solution x à l'équation Ux = y d'inconnue x.
+    """
+
+    x = _vers_tableau(y)
+
+    if x.ndim > 1:
+        # Plusieurs seconds membres : chaque étape porte sur une ligne entière
+        x[-1] /= A.diag[-1]
+        for i in reversed(range(len(x) - 1)):
+            x[i] -= A.sup[i] * x[i + 1]
+            x[i] /= A.diag[i]
+        return _depuis_tableau(y, x)
+
+    diag, sup, z = A.diag.tolist(), A.sup.tolist(), x.tolist()
+
+    n = len(z)
+    z[n - 1] /= diag[n - 1]
+    for i in reversed(range(n - 1)):
+        z[i] = (z[i] - sup[i] * z[i + 1]) / diag[i]
+
+    x[:] = z
+
+    return _depuis_tableau(y, x)
+
+
+def resolution_tridiagonal_lot(
+        inf,
+        diag,
+        sup,
+        b
+) -> np.ndarray:
+    """
+    Résout d'un seul coup un lot de systèmes tridiagonaux indépendants A_k x_k = b_k (algorithme de Thomas), chaque
+    étape de la récurrence étant menée simultanément sur tous les systèmes du lot.
+    Les diagonales sont données par lot, avec les mêmes conventions que `MatriceTridiagonale` : `inf` et `sup` de
+    taille (lot, n-1), `diag` et `b` de taille (lot, n). Des sous- et sur-diagonales de taille (lot, n) sont aussi
+    acceptées, inf[k][0] et sup[k][n-1] étant alors ignorés. Les tailles sont diffusées à la manière de numpy : une
+    même matrice de taille n peut ainsi être utilisée pour tout un lot de seconds membres.
+    Les tableaux donnés ne sont pas modifiés.
+    :param inf: les sous-diagonales.
+    :param diag: les diagonales.
+    :param sup: les sur-diagonales.
+    :param b: les seconds membres.
+    :return: les solutions x, de taille (lot, n).
+    """
+
+    diag = np.asarray(diag, dtype=np.float64)
+    inf = np.asarray(inf, dtype=np.float64)
+    sup = np.asarray(sup, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+
+    n = diag.shape[-1]
+    if inf.shape[-1] == n:
+        inf = inf[..., 1:]
+    if sup.shape[-1] == n:
+        sup = sup[..., :-1]
+
+    forme = np.broadcast_shapes(diag.shape[:-1], inf.shape[:-1], sup.shape[:-1], b.shape[:-1])
+
+    # Indice de ligne en tête : chaque étape de la récurrence porte sur une ligne contiguë de tout le lot
+    a = np.ascontiguousarray(np.moveaxis(np.broadcast_to(inf, forme + (n - 1,)), -1, 0))
+    c = np.ascontiguousarray(np.moveaxis(np.broadcast_to(sup, forme + (n - 1,)), -1, 0))
+    d = np.moveaxis(np.broadcast_to(diag, forme + (n,)), -1, 0).copy()
+    x = np.moveaxis(np.broadcast_to(b, forme + (n,)), -1, 0).copy()
+
+    # Descente : élimination de la sous-diagonale
+    for i in range(1, n):
+        if np.any(d[i - 1] == 0):
+            raise ZeroDivisionError('Pivot nul en position {} - utiliser une méthode avec pivot.'.format(i - 1))
+        l = a[i - 1] / d[i - 1]
+        d[i] -= l * c[i - 1]
+        x[i] -= l * x[i - 1]
+
+    # Remontée
+    x[n - 1] /= d[n - 1]
+    for i in reversed(range(n - 1)):
+        x[i] -= c[i] * x[i + 1]
+        x[i] /= d[i]
+
+    return np.moveaxis(x, 0, -1)
+
+
+def _reduction_cyclique(
+        a: np.ndarray,
+        d: np.ndarray,
+        c: np.ndarray,
+        x: np.ndarray,
+        seuil: int
+) -> np.ndarray:
+    """
+    Résout le système tridiagonal de sous-diagonale `a` (a[..., 0] nul), diagonale `d` et sur-diagonale `c`
+    (c[..., n-1] nul), tous de taille n, par réduction cyclique :
+     1. chaque équation d'indice impair est combinée avec ses deux voisines, d'indices pairs, pour en éliminer les
+     inconnues : on obtient un système tridiagonal deux fois plus petit, portant sur les inconnues d'indices impairs,
+     2. ce système est résolu de la même manière (ou par l'algorithme de Thomas sous le seuil de taille),
+     3. les inconnues d'indices pairs s'en déduisent directement.
+    Chaque étape est une opération vectorielle sur la moitié des équations restantes.
+    :return: la solution x.
+    """
+
+    n = d.shape[-1]
+    if n <= max(seuil, 1):
+        return resolution_tridiagonal_lot(a[..., 1:], d, c[..., :-1], x)
+
+    if n % 2 == 0:
+        # Ajout d'une équation fictive x_n = 0, afin que chaque équation impaire ait ses deux voisines
+        zero, un = np.zeros(d.shape[:-1] + (1,)), np.ones(d.shape[:-1] + (1,))
+        a, d, c, x = (np.concatenate(t, axis=-1) for t in ((a, zero), (d, un), (c, zero), (x, zero)))
+        return _reduction_cyclique(a, d, c, x, seuil)[..., :n]
+
+    # 1. Réduction : équations impaires i, voisines paires i-1 (gauche) et i+1 (droite)
+    g, dr = slice(0, n - 1, 2), slice(2, n, 2)
+    alpha = a[..., 1::2] / d[..., g]
+    gamma = c[..., 1::2] / d[..., dr]
+    a_reduit = -alpha * a[..., g]
+    c_reduit = -gamma * c[..., dr]
+    d_reduit = d[..., 1::2] - alpha * c[..., g] - gamma * a[..., dr]
+    x_reduit = x[..., 1::2] - alpha * x[..., g] - gamma * x[..., dr]
+
+    # 2. Résolution du système réduit
+    y = _reduction_cyclique(a_reduit, d_reduit, c_reduit, x_reduit, seuil)
+
+    # 3. Inconnues paires
+    solution = np.empty(x.shape)
+    solution[..., 1::2] = y
+    pairs = x[..., 0::2].copy()
+    pairs[..., 1:] -= a[..., 2::2] * y
+    pairs[..., :-1] -= c[..., 0:n - 1:2] * y
+    solution[..., 0::2] = pairs / d[..., 0::2]
+
+    return solution
+
+
+def resolution_tridiagonal_reduction_cyclique(
+        inf,
+        diag,
+        sup,
+        b,
+        seuil: int = 64
+) -> np.ndarray:
+    """
+    Résout le système tridiagonal Ax = b par réduction cyclique : la taille du système est divisée par deux à chaque
+    niveau par des opérations vectorielles, au lieu de la récurrence séquentielle de l'algorithme de Thomas. Le coût
+    reste en O(n), mais chaque niveau profite des instructions vectorielles du processeur.
+    En mode hybride (`seuil` > 1), la réduction s'arrête dès que le système réduit compte au plus `seuil` inconnues,
+    qui sont alors calculées par l'algorithme de Thomas.
+    Comme l'algorithme de Thomas, la méthode est sans pivot : elle est stable pour les matrices à diagonale dominante.
+    Les mêmes conventions que `resolution_tridiagonal_lot` s'appliquent (lots de systèmes compris).
+    :param inf: la sous-diagonale, de taille n-1 (ou n, inf[0] étant ignoré).
+    :param diag: la diagonale, de taille n.
+    :param sup: la sur-diagonale, de taille n-1 (ou n, sup[n-1] étant ignoré).
+    :param b: le vecteur second membre (non modifié).
+    :param seuil: (default=64) la taille sous laquelle l'algorithme de Thomas prend le relais. 0 ou 1 pour une
+    réduction cyclique complète.
+    :return: la solution x.
+    """
+
+    diag = np.asarray(diag, dtype=np.float64)
+    inf = np.asarray(inf, dtype=np.float64)
+    sup = np.asarray(sup, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+
+    n = diag.shape[-1]
+    if inf.shape[-1] == n:
+        inf = inf[..., 1:]
+    if sup.shape[-1] == n:
+        sup = sup[..., :-1]
+
+    # Sous- et sur-diagonales complétées à la taille n par des zéros, diffusées aux dimensions du lot
+    forme = np.broadcast_shapes(diag.shape[:-1], inf.shape[:-1], sup.shape[:-1], b.shape[:-1])
+    a = np.zeros(forme + (n,))
+    c = np.zeros(forme + (n,))
+    a[..., 1:] = inf
+    c[..., :-1] = sup
+
+    return _reduction_cyclique(a, np.broadcast_to(diag, forme + (n,)), c, np.broadcast_to(b, forme + (n,)), seuil)
+
+
 # [2] METHODES AVEC PIVOT PARTIEL
 
 def _factorisation_LU_pivot_partiel(
@@ -307,7 +741,8 @@ def _factorisation_LU_pivot_partiel(
     :return: la liste des pivots, la matrice `A` factorisée.
     """
 
-    n = len(A)
+    T = _vers_tableau(A)
+    n = len(T)
     pivots = [-1 for _ in range(n)]
 
     #      j=0     n-2
@@ -317,20 +752,18 @@ def _factorisation_LU_pivot_partiel(
     #     (... ... ... ...) => (...     ...     ... ...
     # n-1 (an1 an2 ... ann) => (an1/a11 an2/a22 ... ann)
     for j in range(n - 1):
-        i0 = pivot_partiel(A, pivots, col=j)  # Trouve le plus grand pivot en valeur absolue
+        i0 = pivot_partiel(T, pivots, col=j)  # Trouve le plus grand pivot en valeur absolue
         pivots[j] = i0
 
         # Echange des lignes i0 et j, si un autre pivot a été trouvé
         if i0 != j:
-            A[j], A[i0] = A[i0], A[j]
+            T[[j, i0]] = T[[i0, j]]
 
-        # Factorisation classique
-        for i in range(j + 1, n):
-            A[i][j] /= A[j][j]
-            for l in range(j + 1, n):
-                A[i][l] -= A[i][j] * A[j][l]
+        # Factorisation classique, par mise à jour de rang 1 de la sous-matrice restante
+        T[j + 1:, j] /= T[j, j]
+        T[j + 1:, j + 1:] -= np.outer(T[j + 1:, j], T[j, j + 1:])
 
-    return A, pivots
+    return _depuis_tableau(A, T), pivots
 
 
 def pivot_partiel(
@@ -344,12 +777,11 @@ def pivot_partiel(
     Renvoie une `ValueError` si tous les pivots possibles sont nuls (indique une factorisation complète).
     """
 
-    i0 = col
-    pivots[i0] = abs(A[col][col])
-    for k in range(col + 1, len(A)):
-        if abs(A[k][col]) > pivots[col]:
-            pivots[col] = abs(A[k][col])
-            i0 = k
+    T = _vers_tableau(A)
+
+    # `argmax` renvoie la première occurrence du maximum, comme le parcours strictement croissant des lignes
+    i0 = col + int(np.argmax(np.abs(T[col:, col])))
+    pivots[col] = abs(T[i0, col])
 
     if pivots[col] == 0:
         raise ValueError('Matrice non inversible - factorisation terminée.')
@@ -385,21 +817,23 @@ def _descente_pivot_partiel(
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
     :param A: la matrice provenant de la factorisation LU.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :return: le vecteur y intermédiaire.
     """
 
+    y = _vers_tableau(b)
     n = len(A)
 
-    # Echange des coordonnées du vecteur b
+    # Echange des coordonnées du vecteur b (des lignes entières pour plusieurs seconds membres)
     for i in range(n):
         pi = pivots[i]
-        b[i], b[pi] = b[pi], b[i]
+        if pi != i:
+            y[[i, pi]] = y[[pi, i]]
 
     # Descente classique sur le vecteur b permuté
-    b = _descente(A, b)
+    y = _descente(A, y)
 
-    return b
+    return _depuis_tableau(b, y)
 
 
 def descente_pivot_partiel(
@@ -411,7 +845,7 @@ def descente_pivot_partiel(
     """
     Applique l'étape de descente à l'équation Ly = b d'inconnue y, avec y = Ux.
     :param A: la matrice provenant de la factorisation LU.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :param keep: (default=False) si le vecteur doit être gardé intacte. Sinon, les coefficients du vecteur seront
     réécrits pour économiser de l'espace mémoire.
     écrits dans la matrice `A` initiale.
@@ -428,24 +862,1575 @@ def descente_pivot_partiel(
 def gauss_pivot_partiel(
         A: list,
         b: list,
-        keep: bool = False
+        keep: bool = False,
+        seuil_conditionnement: float = None
 ) -> list:
     """
     Applique l'algorithme de Gauss avec méthode du pivot partiel à l'équation Ax = b d'inconnue x.
     Dès lors qu'une exception `ValueError` est levée, A est une matrice non inversible.
     :param A: la matrice du système linéaire d'équations.
-    :param b: le vecteur second membre.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
     :param keep: si les objets initiaux doivent être conservés intactes.
+    :param seuil_conditionnement: (default=None) si donné, le conditionnement de A est estimé à partir de la
+    factorisation (en O(n^2), cf. `estimation_conditionnement`) et un avertissement est émis s'il dépasse ce seuil.
     :return: la solution à l'équation Ax = b d'inconnue x.
     """
 
+    norme_A = norme_1(A) if seuil_conditionnement is not None else None
     LU, P = factorisation_LU_pivot_partiel(A, keep)
+    if seuil_conditionnement is not None:
+        conditionnement = estimation_conditionnement(LU, P, norme_A)
+        if conditionnement > seuil_conditionnement:
+            warnings.warn('Matrice mal conditionnée : cond_1(A) ~ {:.2e} - environ {} chiffres significatifs perdus.'
+                          .format(conditionnement, int(np.log10(conditionnement))), RuntimeWarning, stacklevel=2)
     y = descente_pivot_partiel(LU, P, b, keep)
     x = remontee(LU, y)
 
     return x
 
 
+def gauss_precision_mixte(
+        A: list,
+        b: list,
+        tol: float = None,
+        iter_max: int = 30
+) -> tuple:
+    """
+    Applique l'algorithme de Gauss avec pivot partiel à l'équation Ax = b d'inconnue x, en précision mixte :
+     1. A est factorisée en simple précision (float32), deux fois plus rapidement et avec deux fois moins de mémoire
+     qu'en double précision,
+     2. la solution est raffinée itérativement : le résidu r = b - Ax est calculé en double précision (float64), puis
+     la correction d, solution de Ad = r, est obtenue avec les facteurs en simple précision.
+    Pour une matrice bien conditionnée, la précision obtenue est celle d'une résolution en double précision.
+    Si le raffinement stagne (matrice mal conditionnée) ou que la factorisation en simple précision échoue, la
+    résolution est refaite avec une factorisation en double précision.
+    La matrice `A` et le vecteur `b` ne sont pas modifiés.
+    :param A: la matrice du système linéaire d'équations.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
+    :param tol: (default=None) la tolérance sur l'erreur inverse ||b - Ax|| / (||A|| ||x|| + ||b||) (norme infinie).
+    Par défaut, sqrt(n) fois la précision machine en double précision.
+    :param iter_max: (default=30) le nombre maximal d'itérations de raffinement.
+    :return: la solution x, le nombre d'itérations de raffinement effectuées, et un booléen indiquant si la
+    résolution a dû être refaite en double précision.
+    """
+
+    A = np.asarray(A, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    n = len(A)
+    if tol is None:
+        tol = np.sqrt(n) * np.finfo(np.float64).eps
+
+    norme_A = np.abs(A).sum(axis=1).max() if n else 0.
+    norme_b = np.abs(b).max() if b.size else 0.
+
+    iterations = 0
+    with np.errstate(all='ignore'):
+        A32 = A.astype(np.float32)
+        if np.isfinite(A32).all():
+            try:
+                facto = FactorisationLU(*_factorisation_LU_pivot_partiel_bloc(A32))
+            except ValueError:
+                facto = None
+        else:
+            facto = None
+
+        if facto is not None:
+            correction = np.empty(b.shape, dtype=np.float32)
+            x = facto.solve_into(b.astype(np.float32), correction).astype(np.float64)
+
+            norme_r_precedente = np.inf
+            while np.isfinite(x).all():
+                r = b - A @ x
+                norme_r = np.abs(r).max() if r.size else 0.
+                if norme_r <= tol * (norme_A * np.abs(x).max() + norme_b):
+                    return x, iterations, False
+
+                # Stagnation : le résidu ne diminue plus assez d'une itération à l'autre
+                if iterations == iter_max or norme_r > norme_r_precedente / 2:
+                    break
+
+                x += facto.solve_into(r.astype(np.float32), correction)
+                norme_r_precedente = norme_r
+                iterations += 1
+
+    # Repli sur une factorisation en double précision
+    x = FactorisationLU.factoriser(A).solve(b)
+
+    return x, iterations, True
+
+
+# [2 bis] METHODES AVEC PIVOT PARTIEL PAR BLOCS
+
+# Taille de bloc par défaut de la factorisation par blocs : à ajuster selon la taille des caches du processeur.
+TAILLE_BLOC_LU = 64
+
+
+def _factorisation_LU_pivot_partiel_bloc(
+        A: list,
+        taille_bloc: int = TAILLE_BLOC_LU
+) -> list:
+    """
+    Factorise la matrice carrée `A` suivant la décomposition LU avec pivot partiel, par blocs de colonnes
+    (variante "right-looking") :
+     1. le panneau des `taille_bloc` colonnes courantes est factorisé par la méthode classique,
+     2. la ligne de blocs de U correspondante est obtenue par descente sur plusieurs seconds membres,
+     3. la sous-matrice restante est mise à jour par un unique produit matrice-matrice.
+    L'essentiel des calculs est ainsi fait par l'étape 3, qui réutilise chaque coefficient chargé en cache
+    `taille_bloc` fois, au lieu d'une seule pour la mise à jour de rang 1 de la méthode classique.
+    Le résultat (coefficients et pivots) est le même que celui de `_factorisation_LU_pivot_partiel`.
+    :param A: la matrice à factoriser suivant la décomposition LU.
+    :param taille_bloc: (default=TAILLE_BLOC_LU) le nombre de colonnes de chaque panneau.
+    :return: la matrice `A` factorisée, la liste des pivots.
+    """
+
+    T = _vers_tableau(A)
+    n = len(T)
+    pivots = [-1 for _ in range(n)]
+
+    for k0 in range(0, n, taille_bloc):
+        k1 = min(n, k0 + taille_bloc)
+
+        # 1. Factorisation du panneau T[k0:, k0:k1], les échanges portant sur des lignes entières
+        for j in range(k0, min(k1, n - 1)):
+            i0 = pivot_partiel(T, pivots, col=j)
+            pivots[j] = i0
+            if i0 != j:
+                T[[j, i0]] = T[[i0, j]]
+
+            T[j + 1:, j] /= T[j, j]
+            T[j + 1:, j + 1:k1] -= np.outer(T[j + 1:, j], T[j, j + 1:k1])
+
+        if k1 == n:
+            if T[n - 1, n - 1] == 0:
+                raise ValueError('Matrice non inversible - factorisation terminée.')
+            break
+
+        # 2. U12 = L11^-1 A12
+        _descente(T[k0:k1, k0:k1], T[k0:k1, k1:])
+
+        # 3. A22 -= L21 U12
+        T[k1:, k1:] -= T[k1:, k0:k1] @ T[k0:k1, k1:]
+
+    return _depuis_tableau(A, T), pivots
+
+
+def factorisation_LU_pivot_partiel_bloc(
+        A: list,
+        keep: bool = False,
+        taille_bloc: int = TAILLE_BLOC_LU
+) -> list:
+    """
+    Factorise la matrice carrée `A` suivant la décomposition LU avec pivot partiel, par blocs de colonnes.
+    :param A: la matrice à factoriser.
+    :param keep: (default=False) si la matrice doit être gardée intacte. Sinon, les coefficients de L et U seront
+    écrits dans la matrice `A` initiale  pour économiser de l'espace mémoire.
+    :param taille_bloc: (default=TAILLE_BLOC_LU) le nombre de colonnes de chaque panneau.
+    :return: la matrice `A` factorisée, la liste des pivots.
+    """
+
+    B = A
+    if keep:
+        # Création d'une nouvelle matrice pour ne pas remplacer celle donnée en entrée
+        B = np.array(A, dtype=np.float64)
+
+    return _factorisation_LU_pivot_partiel_bloc(B, taille_bloc)
+
+
+# [2 ter] METHODES AVEC PIVOT PARTIEL PAR TUILES, EN PARALLELE
+
+def _factorisation_LU_pivot_partiel_tuiles(
+        A: list,
+        taille_tuile: int,
+        executeur: ThreadPoolExecutor
+) -> list:
+    """
+    Factorise la matrice carrée `A` suivant la décomposition LU avec pivot partiel, la matrice étant découpée en
+    tuiles de `taille_tuile` x `taille_tuile`. À chaque étape k :
+     1. le panneau des colonnes de la tuile k est factorisé (le choix des pivots porte sur toute la colonne, comme
+     dans la méthode classique),
+     2. chaque colonne de tuiles à droite du panneau est confiée à un fil d'exécution, qui calcule sa tuile de U puis
+     met à jour ses tuiles sous-diagonales par produit matrice-matrice.
+    Les produits numpy relâchant le verrou global de l'interpréteur, les tâches de l'étape 2 s'exécutent réellement
+    en parallèle.
+    :param A: la matrice à factoriser suivant la décomposition LU.
+    :param taille_tuile: le nombre de lignes et de colonnes de chaque tuile.
+    :param executeur: le groupe de fils d'exécution.
+    :return: la matrice `A` factorisée, la liste des pivots.
+    """
+
+    T = _vers_tableau(A)
+    n = len(T)
+    pivots = [-1 for _ in range(n)]
+
+    def mise_a_jour_colonne(k0, k1, c0, c1):
+        # Tuile U(k, j) = L(k, k)^-1 A(k, j), puis A(i, j) -= L(i, k) U(k, j) pour chaque tuile i sous le panneau
+        _descente(T[k0:k1, k0:k1], T[k0:k1, c0:c1])
+        for r0 in range(k1, n, taille_tuile):
+            r1 = min(n, r0 + taille_tuile)
+            T[r0:r1, c0:c1] -= T[r0:r1, k0:k1] @ T[k0:k1, c0:c1]
+
+    for k0 in range(0, n, taille_tuile):
+        k1 = min(n, k0 + taille_tuile)
+
+        # 1. Factorisation du panneau, les échanges portant sur des lignes entières
+        for j in range(k0, min(k1, n - 1)):
+            i0 = pivot_partiel(T, pivots, col=j)
+            pivots[j] = i0
+            if i0 != j:
+                T[[j, i0]] = T[[i0, j]]
+
+            T[j + 1:, j] /= T[j, j]
+            T[j + 1:, j + 1:k1] -= np.outer(T[j + 1:, j], T[j, j + 1:k1])
+
+        # 2. Mise à jour des colonnes de tuiles restantes, en parallèle
+        taches = [executeur.submit(mise_a_jour_colonne, k0, k1, c0, min(n, c0 + taille_tuile))
+                  for c0 in range(k1, n, taille_tuile)]
+        for tache in taches:
+            tache.result()
+
+    return _depuis_tableau(A, T), pivots
+
+
+def factorisation_LU_pivot_partiel_tuiles(
+        A: list,
+        keep: bool = False,
+        taille_tuile: int = 256,
+        workers: int = None
+) -> list:
+    """
+    Factorise la matrice carrée `A` suivant la décomposition LU avec pivot partiel, par tuiles traitées en parallèle.
+    :param A: la matrice à factoriser.
+    :param keep: (default=False) si la matrice doit être gardée intacte. Sinon, les coefficients de L et U seront
+    écrits dans la matrice `A` initiale  pour économiser de l'espace mémoire.
+    :param taille_tuile: (default=256) le nombre de lignes et de colonnes de chaque tuile.
+    :param workers: (default=None) le nombre de fils d'exécution. Par défaut, le nombre de coeurs de la machine.
+    :return: la matrice `A` factorisée, la liste des pivots.
+    """
+
+    B = A
+    if keep:
+        # Création d'une nouvelle matrice pour ne pas remplacer celle donnée en entrée
+        B = np.array(A, dtype=np.float64)
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executeur:
+        return _factorisation_LU_pivot_partiel_tuiles(B, taille_tuile, executeur)
+
+
+# [2 quater] METHODES AVEC PIVOT PARTIEL HORS MEMOIRE
+
+# Ces méthodes travaillent sur une matrice stockée dans un fichier et projetée en mémoire (`np.memmap`), qui peut être
+# plus grande que la mémoire vive : seuls des panneaux de colonnes sont chargés à un instant donné, leur nombre de
+# colonnes étant déduit du budget mémoire. Une matrice créée par `matrice_hors_memoire` est stockée colonne par
+# colonne, de sorte que chaque panneau est lu et écrit d'un seul tenant.
+
+def matrice_hors_memoire(
+        chemin: str,
+        n: int,
+        mode: str = 'w+'
+) -> np.memmap:
+    """
+    Projette en mémoire une matrice carrée de flottants stockée dans un fichier, colonne par colonne.
+    :param chemin: le chemin du fichier.
+    :param n: la taille de la matrice.
+    :param mode: (default='w+') le mode d'ouverture : 'w+' pour créer le fichier, 'r+' pour le modifier.
+    :return: la matrice projetée en mémoire.
+    """
+
+    return np.memmap(chemin, dtype=np.float64, mode=mode, shape=(n, n), order='F')
+
+
+def _projection(
+        A: np.ndarray
+) -> tuple:
+    """
+    :return: la projection `mmap.mmap` sur laquelle repose le tableau `A` (en remontant ses attributs `base`), et la
+    position en octets du premier coefficient de A dans celle-ci ; (None, 0) si A n'est pas projeté depuis un fichier.
+    """
+
+    base = A
+    while base is not None and not isinstance(base, mmap.mmap):
+        base = getattr(base, 'base', None)
+    if base is None:
+        return None, 0
+
+    debut_projection = np.frombuffer(base, dtype=np.uint8).__array_interface__['data'][0]
+
+    return base, A.__array_interface__['data'][0] - debut_projection
+
+
+def _liberer_pages(
+        A: np.ndarray
+):
+    """
+    Écrit sur disque les modifications de la partie `A` (tranche d'une matrice projetée en mémoire), puis signale au
+    système que les pages correspondantes peuvent être retirées de la mémoire vive (elles seront relues depuis le
+    fichier au besoin). Sans effet si A n'est pas projetée depuis un fichier, ou si le système ne permet pas de
+    retirer les pages (`mmap.MADV_DONTNEED` absent) : elles sont alors seulement écrites sur disque.
+    """
+
+    projection, debut = _projection(A)
+    if projection is None or A.size == 0:
+        return
+
+    # Étendue en octets de la tranche (pas positifs), alignée sur les pages
+    fin = debut + sum((taille - 1) * pas for taille, pas in zip(A.shape, A.strides)) + A.itemsize
+    debut -= debut % mmap.ALLOCATIONGRANULARITY
+    fin = min(len(projection), fin + (-fin) % mmap.PAGESIZE)
+
+    projection.flush(debut, fin - debut)
+    if hasattr(mmap, 'MADV_DONTNEED'):
+        projection.madvise(mmap.MADV_DONTNEED, debut, fin - debut)
+
+
+# Les mises à jour des panneaux sont faites par morceaux de lignes : le plus grand tableau temporaire alloué pendant
+# la factorisation est un morceau de 1/FRACTION_TEMPORAIRE de panneau (cf. `_largeur_panneau`).
+FRACTION_TEMPORAIRE = 4
+
+
+def _soustraire_produit(
+        C: np.ndarray,
+        X: np.ndarray,
+        Y: np.ndarray
+):
+    """
+    Effectue C -= X Y sur place, par morceaux d'au plus 1/FRACTION_TEMPORAIRE des lignes de C, de sorte que le produit
+    temporaire ne dépasse pas cette fraction de C.
+    """
+
+    morceau = max(1, -(-len(C) // FRACTION_TEMPORAIRE))
+    for i0 in range(0, len(C), morceau):
+        C[i0:i0 + morceau] -= X[i0:i0 + morceau] @ Y
+
+
+def _largeur_panneau(
+        A: np.ndarray,
+        budget_octets: int
+) -> int:
+    """
+    :return: le nombre de colonnes d'un panneau, de sorte que deux panneaux et le produit temporaire (une fraction
+    1/FRACTION_TEMPORAIRE de panneau, cf. `_soustraire_produit`) tiennent dans le budget mémoire.
+    """
+
+    n = len(A)
+    octets_par_colonne = (2 * FRACTION_TEMPORAIRE + 1) * n * A.dtype.itemsize  # Pour FRACTION_TEMPORAIRE colonnes
+    largeur = FRACTION_TEMPORAIRE * budget_octets // octets_par_colonne
+    if largeur < 1:
+        raise ValueError('Budget mémoire insuffisant : au moins {} octets sont nécessaires.'.format(
+            -(-octets_par_colonne // FRACTION_TEMPORAIRE)))
+
+    return min(n, largeur)
+
+
+def _echanges(
+        B: np.ndarray,
+        pivots: list,
+        j0: int,
+        j1: int,
+        decalage: int
+):
+    """
+    Applique au tableau `B`, dont la première ligne est la ligne `decalage` de la matrice, les échanges de lignes
+    successifs des étapes `j0` à `j1` (exclue) de la factorisation.
+    """
+
+    for j in range(j0, j1):
+        if 0 <= pivots[j] != j:
+            B[[j - decalage, pivots[j] - decalage]] = B[[pivots[j] - decalage, j - decalage]]
+
+
+def factorisation_LU_hors_memoire(
+        A: np.ndarray,
+        budget_octets: int = 2 ** 30
+) -> list:
+    """
+    Factorise la matrice carrée `A` suivant la décomposition LU avec pivot partiel, sans jamais la charger en
+    entier : les coefficients de L et U sont écrits dans `A` (typiquement projetée depuis un fichier, cf.
+    `matrice_hors_memoire`). Pour chaque panneau de colonnes :
+     1. le panneau est chargé, factorisé en mémoire (choix des pivots sur toute la colonne), puis réécrit,
+     2. les panneaux à sa droite sont chargés un par un, permutés, mis à jour par descente et produit
+     matrice-matrice, puis réécrits.
+    Les échanges de lignes dus aux panneaux suivants sont appliqués aux colonnes de L lors d'une dernière passe.
+    Le résultat (coefficients et pivots) est le même que celui de `factorisation_LU_pivot_partiel`.
+    :param A: la matrice à factoriser (`np.memmap` ou tableau numpy de flottants).
+    :param budget_octets: (default=1 Gio) la mémoire allouée aux panneaux chargés (deux panneaux à la fois, plus un
+    produit temporaire d'une fraction de panneau, cf. `_largeur_panneau`), hors pages de la projection : celles de
+    chaque panneau sont écrites sur disque et libérées dès qu'il a été réécrit.
+    :return: la matrice `A` factorisée, la liste des pivots.
+    """
+
+    n = len(A)
+    largeur = _largeur_panneau(A, budget_octets)
+    pivots = [-1 for _ in range(n)]
+
+    for k0 in range(0, n, largeur):
+        k1 = min(n, k0 + largeur)
+
+        # 1. Factorisation du panneau A[k0:, k0:k1]
+        P = np.array(A[k0:, k0:k1], dtype=np.float64)
+        pivots_panneau = [-1 for _ in range(k1 - k0)]
+        for j in range(k0, min(k1, n - 1)):
+            jp = j - k0  # Indice de la colonne (et de la ligne diagonale) dans le panneau
+            i0 = pivot_partiel(P, pivots_panneau, col=jp)
+            pivots[j] = k0 + i0
+            if i0 != jp:
+                P[[jp, i0]] = P[[i0, jp]]
+
+            P[jp + 1:, jp] /= P[jp, jp]
+            _soustraire_produit(P[jp + 1:, jp + 1:], P[jp + 1:, jp, None], P[None, jp, jp + 1:])
+        A[k0:, k0:k1] = P
+        _liberer_pages(A[k0:, k0:k1])
+
+        # 2. Mise à jour des panneaux à droite
+        for c0 in range(k1, n, largeur):
+            c1 = min(n, c0 + largeur)
+            B = np.array(A[k0:, c0:c1], dtype=np.float64)
+            _echanges(B, pivots, k0, k1, k0)
+            _descente(P[:k1 - k0], B[:k1 - k0])
+            _soustraire_produit(B[k1 - k0:], P[k1 - k0:], B[:k1 - k0])
+            A[k0:, c0:c1] = B
+            _liberer_pages(A[k0:, c0:c1])
+            del B
+
+        del P
+
+    # 3. Echanges de lignes des panneaux suivants, appliqués aux colonnes de L
+    for k0 in range(0, n, largeur):
+        k1 = min(n, k0 + largeur)
+        if k1 < n:
+            L = np.array(A[k1:, k0:k1], dtype=np.float64)
+            _echanges(L, pivots, k1, n, k1)
+            A[k1:, k0:k1] = L
+            _liberer_pages(A[k1:, k0:k1])
+            del L
+
+    return A, pivots
+
+
+def resolution_LU_hors_memoire(
+        A: np.ndarray,
+        pivots: list,
+        b: list,
+        budget_octets: int = 2 ** 30
+) -> np.ndarray:
+    """
+    Résout l'équation Ax = b d'inconnue x à partir de la factorisation `A` produite par
+    `factorisation_LU_hors_memoire`, en ne chargeant qu'un panneau de colonnes à la fois (descente puis remontée
+    par panneaux).
+    :param A: la matrice factorisée.
+    :param pivots: la liste des pivots.
+    :param b: le vecteur second membre, ou la matrice n x k des seconds membres (non modifié).
+    :param budget_octets: (default=1 Gio) la mémoire allouée au panneau chargé.
+    :return: la solution x.
+    """
+
+    n = len(A)
+    largeur = _largeur_panneau(A, 2 * budget_octets)
+    x = np.array(b, dtype=np.float64)
+    _echanges(x, pivots, 0, n, 0)
+
+    # Descente : Ly = Pb
+    for k0 in range(0, n, largeur):
+        k1 = min(n, k0 + largeur)
+        L = np.array(A[k0:, k0:k1], dtype=np.float64)
+        _descente(L[:k1 - k0], x[k0:k1])
+        x[k1:] -= L[k1 - k0:] @ x[k0:k1]
+        _liberer_pages(A[k0:, k0:k1])
+        del L
+
+    # Remontée : Ux = y
+    for k0 in reversed(range(0, n, largeur)):
+        k1 = min(n, k0 + largeur)
+        U = np.array(A[:k1, k0:k1], dtype=np.float64)
+        remontee(U[k0:], x[k0:k1])
+        x[:k0] -= U[:k0] @ x[k0:k1]
+        _liberer_pages(A[:k1, k0:k1])
+        del U
+
+    return x
+
+
+# [3] METHODES BANDE
+
+# Stockage bande (à la LAPACK) : une matrice carrée A de taille n, de largeurs de bande inférieure `kl` et supérieure
+# `ku`, est stockée dans un tableau AB de taille (kl+ku+1) x n tel que AB[ku + i - j][j] = A[i][j].
+# Chaque colonne de A est ainsi une colonne de AB, la diagonale de A étant la ligne `ku` de AB.
+#
+#       (a11 a12  0   0 )                      ( *  a12 a23 a34)
+#   A = (a21 a22 a23  0 )  (kl=1, ku=1)   AB = (a11 a22 a33 a44)
+#       ( 0  a32 a33 a34)                      (a21 a32 a43  * )
+#       ( 0   0  a43 a44)
+#
+# Avec pivot partiel, les échanges de lignes élargissent U de `kl` sur-diagonales : la factorisation travaille alors
+# sur un tableau de taille (2kl+ku+1) x n, dont les `kl` premières lignes accueillent ce remplissage.
+
+def bande_depuis_dense(
+        A: list,
+        kl: int,
+        ku: int
+) -> np.ndarray:
+    """
+    Construit le stockage bande de la matrice pleine `A`.
+    :param A: la matrice pleine.
+    :param kl: la largeur de bande inférieure (nombre de sous-diagonales).
+    :param ku: la largeur de bande supérieure (nombre de sur-diagonales).
+    :return: le tableau AB de taille (kl+ku+1) x n.
+    """
+
+    T = np.asarray(A, dtype=np.float64)
+    n = len(T)
+    AB = np.zeros((kl + ku + 1, n))
+    for k in range(-kl, ku + 1):
+        # Diagonale de décalage k : A[i][i+k] = AB[ku - k][i+k]
+        AB[ku - k, max(0, k):n + min(0, k)] = np.diagonal(T, k)
+
+    return AB
+
+
+def _factorisation_LU_bande(
+        W: np.ndarray,
+        kl: int,
+        pivot: bool
+) -> list:
+    """
+    Factorise en place la matrice bande stockée dans `W` suivant la décomposition LU, en O(n.kl.ku).
+    :param W: le stockage bande de la matrice, avec `kl` lignes supplémentaires en tête si `pivot` est vrai.
+    :param kl: la largeur de bande inférieure.
+    :param pivot: si la méthode du pivot partiel doit être appliquée.
+    :return: la liste des pivots (vide si `pivot` est faux).
+    """
+
+    n = W.shape[1]
+    ku = W.shape[0] - kl - 1  # Largeur de bande supérieure de U, remplissage compris
+    pivots = []
+
+    for j in range(n):
+        m = min(kl + 1, n - j)  # Nombre de coefficients sur et sous la diagonale dans la colonne j
+        c = min(n, j + ku + 1)  # Fin des colonnes touchées par la ligne j de U
+        cols = np.arange(j, c)
+
+        if pivot:
+            # Trouve le plus grand pivot en valeur absolue, puis échange les lignes j et i0
+            i0 = j + int(np.argmax(np.abs(W[ku:ku + m, j])))
+            pivots.append(i0)
+            if i0 != j:
+                W[ku + j - cols, cols], W[ku + i0 - cols, cols] = W[ku + i0 - cols, cols], W[ku + j - cols, cols]
+
+        if W[ku, j] == 0:
+            raise ValueError('Matrice non inversible - factorisation terminée.')
+
+        # Coefficients de L, puis mise à jour de rang 1 du bloc (m-1) x (c-j-1) restant
+        W[ku + 1:ku + m, j] /= W[ku, j]
+        lignes = np.arange(j + 1, j + m)[:, None]
+        cols = cols[None, 1:]
+        W[ku + lignes - cols, cols] -= np.outer(W[ku + 1:ku + m, j], W[ku + j - cols[0], cols[0]])
+
+    return pivots
+
+
+def factorisation_LU_bande(
+        AB: list,
+        kl: int,
+        ku: int,
+        pivot: bool = True
+) -> tuple:
+    """
+    Factorise la matrice bande stockée dans `AB` suivant la décomposition LU, avec ou sans pivot partiel.
+    La matrice `AB` n'est pas modifiée : avec pivot partiel, le stockage doit être élargi pour accueillir le
+    remplissage de U.
+    :param AB: le stockage bande (kl+ku+1) x n de la matrice (cf. `bande_depuis_dense`).
+    :param kl: la largeur de bande inférieure.
+    :param ku: la largeur de bande supérieure.
+    :param pivot: (default=True) si la méthode du pivot partiel doit être appliquée.
+    :return: le stockage bande factorisé, de taille (2kl+ku+1) x n avec pivot, (kl+ku+1) x n sinon, et la liste des
+    pivots.
+    """
+
+    AB = np.asarray(AB, dtype=np.float64)
+    if AB.shape[0] != kl + ku + 1:
+        raise ValueError('Le stockage bande doit compter kl+ku+1 = {} lignes.'.format(kl + ku + 1))
+
+    # Lignes supplémentaires pour le remplissage dû aux échanges de lignes
+    remplissage = kl if pivot else 0
+    LUB = np.zeros((remplissage + kl + ku + 1, AB.shape[1]))
+    LUB[remplissage:] = AB
+
+    pivots = _factorisation_LU_bande(LUB, kl, pivot)
+
+    return LUB, pivots
+
+
+def descente_bande(
+        LUB: np.ndarray,
+        kl: int,
+        pivots: list,
+        b: list,
+        keep: bool = False
+) -> list:
+    """
+    Applique l'étape de descente à l'équation Ly = Pb d'inconnue y, avec y = Ux.
+    Les échanges de lignes sont appliqués au fil de la descente, dans l'ordre où ils ont été effectués lors de la
+    factorisation : les coefficients de L restent ainsi dans la bande.
+    :param LUB: le stockage bande provenant de `factorisation_LU_bande`.
+    :param kl: la largeur de bande inférieure.
+    :param pivots: la liste des pivots (vide si la factorisation a été faite sans pivot).
+    :param b: le vecteur second membre.
+    :param keep: (default=False) si le vecteur doit être gardé intact.
+    :return: le vecteur y intermédiaire.
+    """
+
+    if keep:
+        b = copy.deepcopy(b)
+
+    y = _vers_tableau(b)
+    n = LUB.shape[1]
+    ku = LUB.shape[0] - kl - 1
+
+    for j in range(n - 1):
+        if pivots and pivots[j] != j:
+            y[[j, pivots[j]]] = y[[pivots[j], j]]
+        m = min(kl + 1, n - j)
+        y[j + 1:j + m] -= np.multiply.outer(LUB[ku + 1:ku + m, j], y[j])
+
+    return _depuis_tableau(b, y)
+
+
+def remontee_bande(
+        LUB: np.ndarray,
+        kl: int,
+        y: list
+) -> list:
+    """
+    Applique l'étape de remontée à l'équation Ux = y, colonne par colonne de U.
+    :param LUB: le stockage bande provenant de `factorisation_LU_bande`.
+    :param kl: la largeur de bande inférieure.
+    :param y: le vecteur second membre intermédiaire.
+    :return: la solution x à l'équation Ux = y d'inconnue x.
+    """
+
+    x = _vers_tableau(y)
+    n = LUB.shape[1]
+    ku = LUB.shape[0] - kl - 1
+
+    for i in reversed(range(n)):
+        x[i] /= LUB[ku, i]
+        k = min(ku, i)  # Coefficients de la colonne i de U au-dessus de la diagonale
+        x[i - k:i] -= np.multiply.outer(LUB[ku - k:ku, i], x[i])
+
+    return _depuis_tableau(y, x)
+
+
+def gauss_bande(
+        AB: list,
+        kl: int,
+        ku: int,
+        b: list,
+        pivot: bool = True,
+        keep: bool = False
+) -> list:
+    """
+    Applique l'algorithme de Gauss à l'équation Ax = b d'inconnue x, où A est une matrice bande.
+    Dès lors qu'une exception `ValueError` est levée, A est une matrice non inversible (ou, sans pivot, possède un
+    pivot nul).
+    :param AB: le stockage bande (kl+ku+1) x n de la matrice (cf. `bande_depuis_dense`).
+    :param kl: la largeur de bande inférieure.
+    :param ku: la largeur de bande supérieure.
+    :param b: le vecteur second membre.
+    :param pivot: (default=True) si la méthode du pivot partiel doit être appliquée.
+    :param keep: (default=False) si le vecteur second membre doit être gardé intact.
+    :return: la solution à l'équation Ax = b d'inconnue x.
+    """
+
+    LUB, P = factorisation_LU_bande(AB, kl, ku, pivot)
+    y = descente_bande(LUB, kl, P, b, keep)
+    x = remontee_bande(LUB, kl, y)
+
+    return x
+
+
+# [4] FACTORISATION REUTILISABLE
+
+def _descente_transposee(
+        A: np.ndarray,
+        b: np.ndarray
+) -> np.ndarray:
+    """
+    Applique l'étape de descente à l'équation U^T z = b d'inconnue z, où U provient de la factorisation LU `A`.
+    :param A: la matrice provenant de la factorisation LU.
+    :param b: le vecteur second membre, réécrit par la solution z.
+    :return: le vecteur z intermédiaire.
+    """
+
+    n = len(A)
+    for i in range(n):
+        b[i] -= np.dot(A[:i, i], b[:i])
+        b[i] /= A[i, i]
+
+    return b
+
+
+def _remontee_transposee(
+        A: np.ndarray,
+        z: np.ndarray
+) -> np.ndarray:
+    """
+    Applique l'étape de remontée à l'équation L^T w = z d'inconnue w, où L provient de la factorisation LU `A`.
+    :param A: la matrice provenant de la factorisation LU.
+    :param z: le vecteur second membre intermédiaire, réécrit par la solution w.
+    :return: le vecteur w.
+    """
+
+    n = len(A)
+    for i in reversed(range(n - 1)):
+        z[i] -= np.dot(A[i + 1:, i], z[i + 1:])
+
+    return z
+
+
+def _descente_remontee_transposees_thomas(
+        A: MatriceTridiagonale,
+        b: np.ndarray
+) -> np.ndarray:
+    """
+    Résout l'équation A^T x = b à partir de la factorisation LU de la matrice tridiagonale `A` : descente
+    U^T z = b (U^T est bidiagonale inférieure) puis remontée L^T x = z (L^T est bidiagonale supérieure unité).
+    :param A: la matrice tridiagonale factorisée.
+    :param b: le vecteur second membre, réécrit par la solution x.
+    :return: la solution x.
+    """
+
+    inf, diag, sup, z = A.inf.tolist(), A.diag.tolist(), A.sup.tolist(), b.tolist()
+
+    n = len(z)
+    z[0] /= diag[0]
+    for i in range(1, n):
+        z[i] = (z[i] - sup[i - 1] * z[i - 1]) / diag[i]
+    for i in reversed(range(n - 1)):
+        z[i] -= inf[i] * z[i + 1]
+
+    b[:] = z
+
+    return b
+
+
+def _descente_remontee_transposees_bande(
+        LUB: np.ndarray,
+        kl: int,
+        pivots: list,
+        b: np.ndarray
+) -> np.ndarray:
+    """
+    Résout l'équation A^T x = b à partir de la factorisation LU bande de A. La factorisation s'écrivant
+    A = P0 L0 P1 L1 ... U, on résout U^T z = b, puis on applique les inverses des L_j^T et les échanges P_j en
+    remontant de la dernière colonne à la première.
+    :param LUB: le stockage bande provenant de `factorisation_LU_bande`.
+    :param kl: la largeur de bande inférieure.
+    :param pivots: la liste des pivots (vide si la factorisation a été faite sans pivot).
+    :param b: le vecteur second membre, réécrit par la solution x.
+    :return: la solution x.
+    """
+
+    n = LUB.shape[1]
+    ku = LUB.shape[0] - kl - 1
+
+    for i in range(n):
+        k = min(ku, i)
+        b[i] -= np.dot(LUB[ku - k:ku, i], b[i - k:i])
+        b[i] /= LUB[ku, i]
+
+    for j in reversed(range(n - 1)):
+        m = min(kl + 1, n - j)
+        b[j] -= np.dot(LUB[ku + 1:ku + m, j], b[j + 1:j + m])
+        if pivots and pivots[j] != j:
+            b[[j, pivots[j]]] = b[[pivots[j], j]]
+
+    return b
+
+
+def _permutation(
+        pivots: list,
+        n: int
+) -> np.ndarray:
+    """
+    Convertit la liste des échanges de lignes successifs effectués lors de la factorisation en une permutation p,
+    telle que le vecteur permuté soit b[p].
+    :param pivots: la liste des pivots (cf. `_factorisation_LU_pivot_partiel`).
+    :param n: la taille du système.
+    :return: la permutation p.
+    """
+
+    p = np.arange(n)
+    for j, pj in enumerate(pivots):
+        if 0 <= pj != j:
+            p[[j, pj]] = p[[pj, j]]
+
+    return p
+
+
+class FactorisationLU:
+    """
+    Factorisation d'une matrice carrée A, calculée une fois pour toutes puis réutilisée pour résoudre autant de
+    systèmes Ax = b que nécessaire (à la manière de `scipy.sparse.linalg.splu`).
+    Les facteurs sont ceux renvoyés par les fonctions de factorisation de ce fichier :
+      - `factorisation_LU` ou `factorisation_LU_pivot_partiel` (matrice pleine, pivots éventuels),
+      - `factorisation_LU_tridiagonal` appliquée à une `MatriceTridiagonale`,
+      - `factorisation_LU_bande` (cf. `FactorisationLU.depuis_bande`),
+      - `factorisation_choleski` (cf. `FactorisationLU.depuis_choleski`).
+    La liste des pivots est convertie une fois pour toutes en permutation.
+    """
+
+    def __init__(
+            self,
+            LU,
+            pivots: list = None
+    ):
+        """
+        :param LU: la matrice factorisée (pleine ou `MatriceTridiagonale`).
+        :param pivots: (default=None) la liste des pivots, si la factorisation a été faite avec pivot partiel.
+        """
+
+        if isinstance(LU, MatriceTridiagonale):
+            self.nature = 'tridiagonal'
+            self.LU = LU
+        else:
+            self.nature = 'dense'
+            self.LU = _vers_tableau(LU)
+
+        self.n = len(self.LU)
+        self.kl = None
+        self.pivots = pivots
+        self.permutation = None if not pivots else _permutation(pivots, self.n)
+
+    @classmethod
+    def factoriser(
+            cls,
+            A,
+            pivot: bool = True,
+            keep: bool = True
+    ) -> 'FactorisationLU':
+        """
+        Factorise la matrice pleine `A` et renvoie la factorisation réutilisable correspondante.
+        :param A: la matrice à factoriser.
+        :param pivot: (default=True) si la méthode du pivot partiel doit être appliquée.
+        :param keep: (default=True) si la matrice doit être gardée intacte. La copie est faite en un seul tableau numpy,
+        et non par `copy.deepcopy`.
+        :return: la factorisation.
+        """
+
+        T = np.array(A, dtype=np.float64) if keep else _vers_tableau(A)
+        if pivot:
+            return cls(*_factorisation_LU_pivot_partiel_bloc(T))
+
+        return cls(_factorisation_LU(T))
+
+    @classmethod
+    def depuis_bande(
+            cls,
+            LUB: np.ndarray,
+            kl: int,
+            pivots: list
+    ) -> 'FactorisationLU':
+        """
+        :param LUB: le stockage bande provenant de `factorisation_LU_bande`.
+        :param kl: la largeur de bande inférieure.
+        :param pivots: la liste des pivots renvoyée par `factorisation_LU_bande`.
+        :return: la factorisation.
+        """
+
+        facto = cls.__new__(cls)
+        facto.nature = 'bande'
+        facto.LU = LUB
+        facto.n = LUB.shape[1]
+        facto.kl = kl
+        facto.pivots = pivots
+        facto.permutation = None
+
+        return facto
+
+    @classmethod
+    def depuis_choleski(
+            cls,
+            L: list
+    ) -> 'FactorisationLU':
+        """
+        Convertit la factorisation de Choleski A = L L^T en factorisation LU (sans pivot) : en notant D la diagonale
+        de L, A = (L D^-1) (D L^T), où L D^-1 est à diagonale unité.
+        :param L: la matrice provenant de `factorisation_choleski`.
+        :return: la factorisation.
+        """
+
+        L = np.asarray(L, dtype=np.float64)
+        d = np.diagonal(L)
+
+        return cls(np.tril(L / d, -1) + np.triu(d[:, None] * L.T))
+
+    def solve(
+            self,
+            b
+    ) -> np.ndarray:
+        """
+        Résout l'équation Ax = b d'inconnue x.
+        :param b: le vecteur second membre (non modifié).
+        :return: la solution x.
+        """
+
+        return self.solve_into(b, np.empty(np.shape(b)))
+
+    def solve_many(
+            self,
+            B
+    ) -> np.ndarray:
+        """
+        Résout les équations Ax = b pour chaque colonne b de `B`, toutes les colonnes étant traitées ensemble.
+        :param B: la matrice n x k des seconds membres (non modifiée).
+        :return: la matrice n x k des solutions.
+        """
+
+        return self.solve_into(B, np.empty(np.shape(B)))
+
+    def solve_into(
+            self,
+            b,
+            out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Résout l'équation Ax = b d'inconnue x en écrivant la solution dans le tableau `out`, sans autre allocation
+        que celle éventuelle du vecteur permuté. `out` peut être `b` lui-même.
+        :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
+        :param out: le tableau de flottants recevant la solution, de même forme que `b`.
+        :return: le tableau `out`.
+        """
+
+        if self.permutation is not None:
+            out[...] = np.asarray(b)[self.permutation]
+        elif out is not b:
+            out[...] = b
+
+        if self.nature == 'tridiagonal':
+            _remontee_thomas(self.LU, _descente_thomas(self.LU, out))
+        elif self.nature == 'bande':
+            remontee_bande(self.LU, self.kl, descente_bande(self.LU, self.kl, self.pivots, out))
+        else:
+            remontee(self.LU, _descente(self.LU, out))
+
+        return out
+
+    def solve_transpose(
+            self,
+            b
+    ) -> np.ndarray:
+        """
+        Résout l'équation A^T x = b d'inconnue x, à partir des mêmes facteurs : si PA = LU, alors
+        A^T = U^T L^T P, et l'on résout successivement U^T z = b, L^T w = z puis Px = w.
+        :param b: le vecteur second membre (non modifié).
+        :return: la solution x.
+        """
+
+        x = np.array(b, dtype=np.float64)
+        if self.nature == 'tridiagonal':
+            return _descente_remontee_transposees_thomas(self.LU, x)
+        if self.nature == 'bande':
+            return _descente_remontee_transposees_bande(self.LU, self.kl, self.pivots, x)
+
+        w = _remontee_transposee(self.LU, _descente_transposee(self.LU, x))
+        if self.permutation is None:
+            return w
+
+        x = np.empty(w.shape)
+        x[self.permutation] = w
+
+        return x
+
+    def matrice(
+            self
+    ):
+        """
+        Reconstruit la matrice A à partir de ses facteurs (`MatriceTridiagonale` pour le stockage tridiagonal,
+        matrice pleine sinon).
+        :return: la matrice A.
+        """
+
+        if self.nature == 'tridiagonal':
+            LU = self.LU
+            diag = LU.diag.copy()
+            diag[1:] += LU.inf * LU.sup
+            return MatriceTridiagonale(LU.inf * LU.diag[:-1], diag, LU.sup)
+
+        if self.nature == 'bande':
+            AB, kl, ku = self.matrice_bande()
+            A = np.zeros((self.n, self.n))
+            for k in range(-kl, ku + 1):
+                A[np.arange(max(0, -k), self.n - max(0, k)), np.arange(max(0, k), self.n + min(0, k))] = \
+                    AB[ku - k, max(0, k):self.n + min(0, k)]
+            return A
+
+        L = np.tril(self.LU, -1) + np.eye(self.n)
+        PA = L @ np.triu(self.LU)
+        if self.permutation is None:
+            return PA
+
+        A = np.empty(PA.shape)
+        A[self.permutation] = PA
+
+        return A
+
+    def matrice_bande(
+            self
+    ) -> tuple:
+        """
+        Reconstruit le stockage bande de la matrice A à partir de ses facteurs en stockage bande, sans passer par la
+        matrice pleine, en O(n.kl.ku).
+        :return: le tableau AB de taille (kl+ku+1) x n (cf. `bande_depuis_dense`), et les largeurs de bande inférieure
+        kl et supérieure ku de A.
+        """
+
+        if self.nature != 'bande':
+            raise ValueError('La factorisation doit être en stockage bande.')
+
+        # A = P0 L0 P1 L1 ... U : les facteurs sont appliqués à U, de la dernière colonne à la première. Chaque
+        # produit intermédiaire a la structure de la matrice en cours de factorisation (largeur de bande supérieure
+        # ku + kl avec pivot, remplissage compris), et tient donc dans le stockage des facteurs.
+        n, kl = self.n, self.kl
+        ku = self.LU.shape[0] - kl - 1
+        W = np.zeros(self.LU.shape)
+        W[:ku + 1] = self.LU[:ku + 1]
+        for j in reversed(range(n - 1)):
+            m = min(kl + 1, n - j)  # Lignes j à j+m-1 touchées par L_j et P_j
+            cols = np.arange(j, min(n, j + ku + 1))
+            positions = (ku + np.arange(m)[:, None] - (cols - j), cols)
+            bloc = W[positions]
+            bloc[1:] += np.outer(self.LU[ku + 1:ku + m, j], bloc[0])
+            if self.pivots and self.pivots[j] != j:
+                i0 = self.pivots[j] - j
+                bloc[[0, i0]] = bloc[[i0, 0]]
+            W[positions] = bloc
+
+        ku_A = ku - kl if self.pivots else ku
+
+        return W[ku - ku_A:], kl, ku_A
+
+    def log_determinant(
+            self
+    ) -> tuple:
+        """
+        Calcule le déterminant de A à partir de ses facteurs, en O(n) : det(A) = (-1)^e . u11 . u22 ... unn, où e est
+        le nombre d'échanges de lignes. Le logarithme évite tout dépassement de capacité des flottants.
+        :return: le signe du déterminant (-1, 0 ou 1) et le logarithme de sa valeur absolue.
+        """
+
+        if self.nature == 'tridiagonal':
+            d = self.LU.diag
+        elif self.nature == 'bande':
+            d = self.LU[self.LU.shape[0] - self.kl - 1]
+        else:
+            d = np.diagonal(self.LU)
+
+        return _log_determinant(d, self.pivots)
+
+    def conditionnement(
+            self,
+            norme_A: float
+    ) -> float:
+        """
+        Estime le conditionnement cond_1(A) = ||A||_1 ||A^-1||_1 en O(n^2) (cf. `estimation_norme_inverse`), sans
+        calculer A^-1.
+        :param norme_A: la norme ||A||_1, calculée avant la factorisation (cf. `norme_1`).
+        :return: l'estimation du conditionnement, qui le minore (et l'atteint en général).
+        """
+
+        return norme_A * estimation_norme_inverse(self.solve, self.solve_transpose, self.n)
+
+
+# [5] METHODES CREUSES
+
+class FactorisationLUCreuse:
+    """
+    Factorisation LU (sans pivot) d'une matrice creuse A, donnée au format CSR ou CSC, en trois phases :
+     1. renumérotation des inconnues (Cuthill-McKee inverse ou degré minimal, cf. `creux.py`) pour limiter le
+     remplissage des facteurs,
+     2. analyse symbolique, qui prévoit la structure de L et U (et donc le remplissage) à partir de l'arbre
+     d'élimination,
+     3. factorisation numérique, colonne par colonne ("left-looking"), sur la structure prévue.
+    Les phases 1 et 2 ne dépendent que de la structure de A : `refactorisation` ne refait que la phase 3 pour une
+    nouvelle matrice de même structure.
+    Sans pivot, la factorisation est réservée aux matrices pour lesquelles la méthode de Gauss sans permutation est
+    stable, par exemple à diagonale dominante (comme les matrices de l'équation de la chaleur). Une `ValueError` est
+    levée en cas de pivot nul.
+    """
+
+    def __init__(
+            self,
+            A,
+            ordre: str = 'rcm',
+            symbolique: AnalyseSymbolique = None
+    ):
+        """
+        :param A: la matrice carrée à factoriser (CSR, CSC ou pleine).
+        :param ordre: (default='rcm') la renumérotation : 'rcm', 'degre_minimal' ou None.
+        :param symbolique: (default=None) une analyse symbolique déjà calculée pour une matrice de même structure.
+        """
+
+        self.symbolique = symbolique if symbolique is not None else AnalyseSymbolique(A, ordre)
+        self.n = self.symbolique.n
+        self.refactorisation(A)
+
+    def refactorisation(
+            self,
+            A
+    ) -> 'FactorisationLUCreuse':
+        """
+        Factorise numériquement la matrice `A`, de même structure que la matrice analysée, en réutilisant la
+        renumérotation et l'analyse symbolique.
+        :param A: la nouvelle matrice (CSR, CSC ou pleine).
+        :return: la factorisation, mise à jour.
+        """
+
+        C = self.symbolique.matrice_renumerotee(A)
+        lignes, colonnes = self.symbolique.lignes, self.symbolique.colonnes
+
+        self.diag = np.empty(self.n)
+        self.L = []  # Coefficients de la colonne j de L, aux lignes `lignes[j]`
+        self.U = []  # Coefficients de la colonne j de U (hors diagonale), aux lignes `colonnes[j]`
+
+        x = np.zeros(self.n)  # Colonne courante, pleine
+        for j in range(self.n):
+            debut, fin = C.indptr[j], C.indptr[j + 1]
+            x[C.indices[debut:fin]] = C.data[debut:fin]
+
+            # Contribution des colonnes précédentes de L, dans l'ordre croissant
+            for i in colonnes[j].tolist():
+                x[lignes[i]] -= self.L[i] * x[i]
+
+            if x[j] == 0:
+                raise ValueError('Pivot nul en position {} - factorisation creuse sans pivot impossible.'.format(j))
+
+            self.diag[j] = x[j]
+            self.U.append(x[colonnes[j]])
+            self.L.append(x[lignes[j]] / x[j])
+
+            x[colonnes[j]] = 0
+            x[lignes[j]] = 0
+            x[j] = 0
+
+        return self
+
+    def solve(
+            self,
+            b
+    ) -> np.ndarray:
+        """
+        Résout l'équation Ax = b d'inconnue x.
+        :param b: le vecteur second membre, ou la matrice n x k des seconds membres (non modifié).
+        :return: la solution x.
+        """
+
+        return self.solve_into(b, np.empty(np.shape(b)))
+
+    def solve_into(
+            self,
+            b,
+            out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Résout l'équation Ax = b d'inconnue x en écrivant la solution dans le tableau `out`.
+        :param b: le vecteur second membre, ou la matrice n x k des seconds membres.
+        :param out: le tableau de flottants recevant la solution, de même forme que `b` (éventuellement `b`).
+        :return: le tableau `out`.
+        """
+
+        lignes, colonnes = self.symbolique.lignes, self.symbolique.colonnes
+        y = np.asarray(b, dtype=np.float64)[self.symbolique.permutation]
+
+        # Descente Ly = Pb, puis remontée Ux = y
+        for j in range(self.n):
+            y[lignes[j]] -= np.multiply.outer(self.L[j], y[j])
+        for j in reversed(range(self.n)):
+            y[j] /= self.diag[j]
+            y[colonnes[j]] -= np.multiply.outer(self.U[j], y[j])
+
+        out[self.symbolique.permutation] = y
+
+        return out
+
+
+# [6] MISES A JOUR DE RANG FAIBLE
+
+# Lorsque seuls quelques coefficients de A changent (lignes des conditions aux limites, diffusivité modifiée sur un
+# segment, ...), la nouvelle matrice s'écrit A' = A + U V^T, avec U et V de taille n x k et k petit. La formule de
+# Sherman-Morrison-Woodbury donne alors la solution de A'x = b à partir des facteurs de A :
+#   x = y - Z (I + V^T Z)^-1 V^T y,   où y = A^-1 b et Z = A^-1 U,
+# soit une résolution avec les facteurs de A et O(n.k) opérations de plus, au lieu d'une nouvelle factorisation.
+
+def correction_lignes(
+        indices: list,
+        anciennes: list,
+        nouvelles: list
+) -> tuple:
+    """
+    Écrit le remplacement de lignes de A sous la forme d'une correction de rang faible U V^T.
+    :param indices: les indices des k lignes remplacées.
+    :param anciennes: les k anciennes lignes (matrice k x n).
+    :param nouvelles: les k nouvelles lignes (matrice k x n).
+    :return: les matrices U (n x k) et V (n x k), telles que A' = A + U V^T.
+    """
+
+    anciennes = np.atleast_2d(np.asarray(anciennes, dtype=np.float64))
+    V = (np.atleast_2d(np.asarray(nouvelles, dtype=np.float64)) - anciennes).T
+    U = np.zeros(V.shape)
+    U[np.asarray(indices), np.arange(V.shape[1])] = 1
+
+    return U, V
+
+
+class FactorisationLUModifiee:
+    """
+    Factorisation de la matrice A' = A + U V^T, obtenue à partir d'une factorisation de A (`FactorisationLU`, ou tout
+    objet muni d'une méthode `solve` acceptant une matrice de seconds membres, comme `FactorisationLUCreuse` ou
+    `scipy.sparse.linalg.splu`) et d'une correction de rang k, par la formule de Sherman-Morrison-Woodbury.
+    Chaque résolution coûte une résolution avec les facteurs de A, plus O(n.k) : O(n^2 + n.k) pour une matrice pleine,
+    O(n.(kl+ku) + n.k) pour une matrice bande.
+    Les corrections s'accumulent (cf. `ajouter`). Leur coût (calcul de A^-1 U, puis O(n.k) par résolution) est
+    comptabilisé : dès qu'il dépasse celui d'une nouvelle factorisation de A', celle-ci est faite et la correction
+    remise à zéro. Cette règle garantit un coût total au plus double de celui de la meilleure stratégie a posteriori.
+    La nouvelle factorisation n'est possible que pour une `FactorisationLU`, dont la matrice peut être reconstruite :
+    elle est faite en stockage bande si les corrections préservent une bande étroite, pleine sinon.
+    """
+
+    def __init__(
+            self,
+            facto,
+            U=None,
+            V=None
+    ):
+        """
+        :param facto: la factorisation de A.
+        :param U: (default=None) la matrice n x k (ou le vecteur) U de la correction initiale.
+        :param V: (default=None) la matrice n x k (ou le vecteur) V de la correction initiale.
+        """
+
+        self.facto = facto
+        self.n = facto.n if hasattr(facto, 'n') else facto.shape[0]
+        self._reinitialiser()
+        if U is not None:
+            self.ajouter(U, V)
+
+    def _reinitialiser(
+            self
+    ):
+        """
+        Remet à zéro la correction, après une (nouvelle) factorisation.
+        """
+
+        self.U = np.zeros((self.n, 0))
+        self.V = np.zeros((self.n, 0))
+        self.Z = np.zeros((self.n, 0))  # Z = A^-1 U
+        self.capacite = None  # Factorisation de I + V^T Z
+        self.cout = 0  # Coût cumulé de la correction, en nombre d'opérations
+        self.cout_factorisation = float('inf')  # Coût d'une nouvelle factorisation de A + U V^T
+
+    @property
+    def rang(
+            self
+    ) -> int:
+        """
+        :return: le rang k de la correction courante.
+        """
+
+        return self.U.shape[1]
+
+    def _largeurs_bande(
+            self
+    ) -> tuple:
+        """
+        :return: les largeurs de bande inférieure et supérieure de A' (majorées, pour la correction, à partir des
+        lignes non nulles de chaque colonne de U et de V).
+        """
+
+        nature = getattr(self.facto, 'nature', None)
+        if nature == 'tridiagonal':
+            kl, ku = 1, 1
+        elif nature == 'bande':
+            kl = self.facto.kl
+            ku = self.facto.LU.shape[0] - kl - 1 - (kl if self.facto.pivots else 0)
+        else:
+            return self.n - 1, self.n - 1
+
+        # Le terme U[:, c] V[:, c]^T n'a de coefficients non nuls qu'entre les lignes non nulles de U[:, c] et les
+        # colonnes non nulles de V[:, c]
+        for c in range(self.rang):
+            lignes_U = np.flatnonzero(self.U[:, c])
+            lignes_V = np.flatnonzero(self.V[:, c])
+            if len(lignes_U) and len(lignes_V):
+                kl = max(kl, lignes_U[-1] - lignes_V[0])
+                ku = max(ku, lignes_V[-1] - lignes_U[0])
+
+        return int(kl), int(ku)
+
+    def _couts(
+            self
+    ) -> tuple:
+        """
+        :return: le coût d'une résolution avec les facteurs de A, et celui d'une nouvelle factorisation de A' (infini
+        si elle est impossible), en nombre d'opérations.
+        """
+
+        n = self.n
+        nature = getattr(self.facto, 'nature', None)
+        if nature is None:
+            return 2 * n ** 2, float('inf')
+
+        if nature == 'tridiagonal':
+            resolution = 5 * n
+        elif nature == 'bande':
+            resolution = 2 * n * self.facto.LU.shape[0]
+        else:
+            resolution = 2 * n ** 2
+
+        kl, ku = self._largeurs_bande()
+        if kl + ku + 1 <= n // 4:
+            factorisation = 2 * n * (kl + 1) * (2 * kl + ku + 1)
+        else:
+            factorisation = 2 * n ** 3 // 3
+
+        return resolution, factorisation
+
+    def ajouter(
+            self,
+            U,
+            V
+    ) -> 'FactorisationLUModifiee':
+        """
+        Ajoute la correction U V^T à la matrice : la factorisation devient celle de A + U V^T, A désignant la matrice
+        actuelle (corrections précédentes comprises).
+        :param U: la matrice n x k (ou le vecteur) U.
+        :param V: la matrice n x k (ou le vecteur) V.
+        :return: la factorisation, mise à jour.
+        """
+
+        U = np.asarray(U, dtype=np.float64).reshape(self.n, -1)
+        V = np.asarray(V, dtype=np.float64).reshape(self.n, -1)
+        if U.shape != V.shape:
+            raise ValueError('Les matrices U et V doivent être de même taille.')
+
+        self.U = np.hstack((self.U, U))
+        self.V = np.hstack((self.V, V))
+
+        resolution, self.cout_factorisation = self._couts()
+        self.cout += U.shape[1] * (resolution + 2 * self.n * self.rang)
+        if self.cout > self.cout_factorisation:
+            return self.refactorisation()
+
+        self.Z = np.hstack((self.Z, self.facto.solve(U)))
+        self.capacite = FactorisationLU.factoriser(np.eye(self.rang) + self.V.T @ self.Z, keep=False)
+
+        return self
+
+    def refactorisation(
+            self
+    ) -> 'FactorisationLUModifiee':
+        """
+        Factorise à nouveau la matrice A' = A + U V^T, et remet la correction à zéro. La matrice A est reconstruite à
+        partir de ses facteurs, en stockage bande si A' reste une matrice bande étroite, sous forme pleine sinon.
+        :return: la factorisation, mise à jour.
+        """
+
+        if not isinstance(self.facto, FactorisationLU):
+            raise ValueError('Nouvelle factorisation impossible : la matrice ne peut être reconstruite.')
+
+        n = self.n
+        kl, ku = self._largeurs_bande()
+
+        if kl + ku + 1 > n // 4:
+            A = self.facto.matrice()
+            A = A.vers_dense() if isinstance(A, MatriceTridiagonale) else A
+            A += self.U @ self.V.T
+            self.facto = FactorisationLU.factoriser(A, keep=False)
+            self._reinitialiser()
+            return self
+
+        # Stockage bande : A est reconstruite directement en stockage bande, puis les diagonales de U V^T sont
+        # ajoutées aux siennes
+        AB = np.zeros((kl + ku + 1, n))
+        if self.facto.nature == 'tridiagonal':
+            A = self.facto.matrice()
+            AB[ku - 1, 1:] = A.sup
+            AB[ku] = A.diag
+            AB[ku + 1, :-1] = A.inf
+        else:
+            AB_A, kl_A, ku_A = self.facto.matrice_bande()
+            AB[ku - ku_A:ku + kl_A + 1] = AB_A
+        for k in range(-kl, ku + 1):
+            AB[ku - k, max(0, k):n + min(0, k)] += np.einsum('ij,ij->i', self.U[max(0, -k):n - max(0, k)],
+                                                             self.V[max(0, k):n + min(0, k)])
+
+        # Thomas si la matrice reste tridiagonale à diagonale dominante, LU bande avec pivot sinon
+        T = MatriceTridiagonale(AB[2, :-1], AB[1], AB[0, 1:]) if kl == ku == 1 else None
+        if T is not None and np.all(np.abs(T.diag) >= np.abs(AB[0]) + np.abs(AB[2])):
+            self.facto = FactorisationLU(factorisation_LU_tridiagonal(T, keep=False))
+        else:
+            LUB, P = factorisation_LU_bande(AB, kl, ku)
+            self.facto = FactorisationLU.depuis_bande(LUB, kl, P)
+        self._reinitialiser()
+
+        return self
+
+    def solve(
+            self,
+            b
+    ) -> np.ndarray:
+        """
+        Résout l'équation A'x = b d'inconnue x.
+        :param b: le vecteur second membre, ou la matrice n x m des seconds membres (non modifié).
+        :return: la solution x.
+        """
+
+        return self.solve_into(b, np.empty(np.shape(b)))
+
+    solve_many = solve
+
+    def solve_into(
+            self,
+            b,
+            out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Résout l'équation A'x = b d'inconnue x en écrivant la solution dans le tableau `out`. Si le coût cumulé de la
+        correction dépasse celui d'une nouvelle factorisation, celle-ci est faite au préalable.
+        :param b: le vecteur second membre, ou la matrice n x m des seconds membres.
+        :param out: le tableau de flottants recevant la solution, de même forme que `b` (éventuellement `b`).
+        :return: le tableau `out`.
+        """
+
+        if self.rang:
+            self.cout += 4 * self.n * self.rang * (np.shape(b)[1] if np.ndim(b) == 2 else 1)
+            if self.cout > self.cout_factorisation:
+                self.refactorisation()
+
+        if hasattr(self.facto, 'solve_into'):
+            self.facto.solve_into(b, out)
+        else:
+            out[...] = self.facto.solve(np.asarray(b, dtype=np.float64))
+
+        if self.rang:
+            # x = y - Z (I + V^T Z)^-1 V^T y
+            out -= self.Z @ self.capacite.solve(self.V.T @ out)
+
+        return out
+
+
+# [7] CONDITIONNEMENT ET DETERMINANT
+
+# Le conditionnement cond_1(A) = ||A||_1 ||A^-1||_1 mesure la perte de précision lors de la résolution de Ax = b :
+# environ log10(cond_1(A)) chiffres significatifs sont perdus. Le calculer exactement demande A^-1, soit O(n^3)
+# opérations de plus ; l'estimateur de Hager et Higham ne demande que quelques résolutions avec les facteurs de A.
+
+def norme_1(
+        A
+) -> float:
+    """
+    :param A: la matrice (liste de listes, tableau numpy ou matrice creuse `scipy.sparse`).
+    :return: la norme ||A||_1, plus grande somme des valeurs absolues d'une colonne.
+    """
+
+    if hasattr(A, 'tocsc'):
+        return float(abs(A).sum(axis=0).max())
+
+    return float(np.abs(np.asarray(A, dtype=np.float64)).sum(axis=0).max())
+
+
+def estimation_norme_inverse(
+        resoudre,
+        resoudre_transposee,
+        n: int,
+        iter_max: int = 5
+) -> float:
+    """
+    Estime la norme ||A^-1||_1 par l'algorithme de Hager, avec les améliorations de Higham (LAPACK `xLACON`) : la
+    norme ||A^-1 x||_1 est maximisée sur la boule unité par une montée de gradient, dont chaque itération coûte une
+    résolution avec A et une avec A^T (2 à 5 itérations suffisent en général). Une seconde estimation, sur un vecteur
+    de signes alternés, corrige les rares cas où la montée s'arrête trop tôt.
+    :param resoudre: la fonction b -> A^-1 b.
+    :param resoudre_transposee: la fonction b -> A^-T b.
+    :param n: la taille de la matrice.
+    :param iter_max: (default=5) le nombre maximal d'itérations.
+    :return: l'estimation de ||A^-1||_1, qui la minore.
+    """
+
+    x = np.full(n, 1 / n)
+    y = resoudre(x)
+    estimation = np.abs(y).sum()
+    signes = np.where(y >= 0, 1., -1.)
+    z = resoudre_transposee(signes)
+
+    for _ in range(1, iter_max):
+        j = int(np.argmax(np.abs(z)))
+        if abs(z[j]) <= np.dot(z, x):
+            break  # Maximum local atteint
+
+        x = np.zeros(n)
+        x[j] = 1
+        y = resoudre(x)
+        precedente, estimation = estimation, np.abs(y).sum()
+        nouveaux_signes = np.where(y >= 0, 1., -1.)
+        if estimation <= precedente or np.array_equal(nouveaux_signes, signes):
+            estimation = max(estimation, precedente)
+            break
+
+        signes = nouveaux_signes
+        z = resoudre_transposee(signes)
+
+    # Vecteur de signes alternés, de norme croissante : b_i = (-1)^i (1 + i/(n-1))
+    b = (1 + np.arange(n) / max(1, n - 1)) * (-1) ** np.arange(n)
+    alternee = 2 * np.abs(resoudre(b)).sum() / (3 * n)
+
+    return float(max(estimation, alternee))
+
+
+def estimation_conditionnement(
+        LU: list,
+        pivots: list,
+        norme_A: float
+) -> float:
+    """
+    Estime le conditionnement cond_1(A) à partir de la factorisation LU de A, en O(n^2).
+    :param LU: la matrice provenant de `factorisation_LU` ou `factorisation_LU_pivot_partiel` (non modifiée).
+    :param pivots: la liste des pivots (None sans pivot).
+    :param norme_A: la norme ||A||_1, calculée avant la factorisation (cf. `norme_1`).
+    :return: l'estimation du conditionnement.
+    """
+
+    return FactorisationLU(np.array(LU, dtype=np.float64), pivots).conditionnement(norme_A)
+
+
+def log_determinant(
+        LU: list,
+        pivots: list = None
+) -> tuple:
+    """
+    Calcule le déterminant de A à partir de sa factorisation LU, en O(n).
+    :param LU: la matrice provenant de `factorisation_LU` ou `factorisation_LU_pivot_partiel`.
+    :param pivots: (default=None) la liste des pivots.
+    :return: le signe du déterminant (-1, 0 ou 1) et le logarithme de sa valeur absolue.
+    """
+
+    return _log_determinant(np.diagonal(np.asarray(LU, dtype=np.float64)), pivots)
+
+
+def _log_determinant(
+        d: np.ndarray,
+        pivots: list
+) -> tuple:
+    """
+    :param d: la diagonale de U.
+    :param pivots: la liste des pivots (None ou vide sans pivot).
+    :return: le signe du déterminant et le logarithme de sa valeur absolue.
+    """
+
+    echanges = sum(1 for j, pj in enumerate(pivots or []) if 0 <= pj != j)
+    signe = (-1) ** echanges * np.prod(np.sign(d))
+    with np.errstate(divide='ignore'):
+        return float(signe), float(np.sum(np.log(np.abs(d))))
+
+
 '''
 # Test simple
 M = [[2, 1, 1], [-1, 0, 2], [3, -2, -1]]
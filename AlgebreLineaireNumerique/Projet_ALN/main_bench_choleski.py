@@ -0,0 +1,51 @@
+import numpy as np
+import time
+import matplotlib.pyplot as plt
+
+from choleski import *
+
+# Comparaison de la factorisation de Choleski classique (listes Python, nouvelle matrice L pleine) et des
+# factorisations sur place (triangle inférieur de A) et compacte (n(n+1)/2 flottants).
+# Attention : la méthode classique prend plusieurs minutes pour n = 2000.
+
+n_list = np.array([250, 500, 1000, 2000])
+
+temps_classique = np.array([])
+temps_sur_place = np.array([])
+temps_compacte = np.array([])
+
+rng = np.random.default_rng(0)
+
+for n in n_list:
+    M = rng.standard_normal((n, n))
+    A = M @ M.T + n * np.eye(n)
+
+    start_time = time.perf_counter()
+    factorisation_choleski(A.tolist())
+    end_time = time.perf_counter()
+    temps_classique = np.append(temps_classique, end_time - start_time)
+    print("classique n={} - {:.3f}s - {:.1f} Mo pour L".format(n, temps_classique[-1], n * n * 8 / 1e6))
+
+    B = A.copy()
+    start_time = time.perf_counter()
+    factorisation_choleski_sur_place(B)
+    end_time = time.perf_counter()
+    temps_sur_place = np.append(temps_sur_place, end_time - start_time)
+    print("sur place n={} - {:.3f}s (x{:.0f}) - aucune allocation n x n".format(
+        n, temps_sur_place[-1], temps_classique[-1] / temps_sur_place[-1]))
+
+    AP = compacter(A)
+    start_time = time.perf_counter()
+    factorisation_choleski_compacte(AP)
+    end_time = time.perf_counter()
+    temps_compacte = np.append(temps_compacte, end_time - start_time)
+    print("compacte n={} - {:.3f}s (x{:.0f}) - {:.1f} Mo".format(
+        n, temps_compacte[-1], temps_classique[-1] / temps_compacte[-1], AP.nbytes / 1e6))
+
+plt.xlabel('n')
+plt.ylabel("Durée d'exécution [en s]")
+plt.loglog(n_list, temps_classique, 'r', label="Choleski classique")
+plt.loglog(n_list, temps_sur_place, 'g', label="Choleski sur place")
+plt.loglog(n_list, temps_compacte, 'b', label="Choleski compacte")
+plt.legend()
+plt.show()
@@ -0,0 +1,50 @@
+import numpy as np
+import time
+
+from choleski import *
+from scipy.sparse import diags, identity, kron, linalg as sla
+
+# Factorisation de Choleski creuse de la matrice Euler implicite de l'équation de la chaleur en dimension 2, pour
+# plusieurs pas de temps : la structure de A = I + beta * L ne dépend pas de dt, seules ses valeurs changent.
+# La renumérotation et l'analyse symbolique sont faites une fois, puis chaque nouveau pas de temps ne demande qu'une
+# refactorisation numérique, comparée à une factorisation complète (renumérotation, analyse symbolique et calcul
+# numérique) à chaque fois. SuperLU, compilé, sert de référence pour la solution et les durées.
+
+R = 0.065  # en mètres
+D = 98.8e-6  # Diffusivité thermique de l'aluminium
+dt_list = [1e-3, 2e-3, 5e-3, 1e-2, 2e-2]
+m_list = [30, 60, 100]
+
+for m in m_list:
+    dx = R / (m + 1)
+    T = diags([np.full(m - 1, -1.), np.full(m, 2.), np.full(m - 1, -1.)], [-1, 0, 1])
+    L = (kron(identity(m), T) + kron(T, identity(m))).tocsc()
+    b = np.random.default_rng(0).random(m * m)
+
+    start_time = time.perf_counter()
+    LLt = FactorisationCholeskiCreuse(identity(m * m, format='csc') + L)
+    end_time = time.perf_counter()
+    print("n={}, nnz(A)={}, nnz(L)={} - analyse et première factorisation {:.3f}s".format(
+        m * m, L.nnz, LLt.symbolique.nnz_L, end_time - start_time))
+
+    temps_splu, temps_complete, temps_refactorisation = 0., 0., 0.
+    for dt in dt_list:
+        beta = D * dt / dx ** 2
+        A = (identity(m * m, format='csc') + beta * L).tocsc()
+
+        start_time = time.perf_counter()
+        x_splu = sla.splu(A).solve(b)
+        temps_splu += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        FactorisationCholeskiCreuse(A).solve(b)
+        temps_complete += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        x = LLt.refactorisation(A).solve(b)
+        temps_refactorisation += time.perf_counter() - start_time
+
+        print("  beta={:.3f} - écart à SuperLU {:.1e}".format(beta, np.abs(x - x_splu).max()))
+
+    print("  {} pas de temps : factorisation complète {:.3f}s, refactorisation numérique {:.3f}s, "
+          "SuperLU {:.3f}s".format(len(dt_list), temps_complete, temps_refactorisation, temps_splu))
@@ -0,0 +1,57 @@
+import numpy as np
+import time
+import matplotlib.pyplot as plt
+
+from choleski import *
+
+# Débit (matrices factorisées puis résolues par seconde) pour une pile de petites matrices symétriques définies
+# positives : appels successifs de `factorisation_choleski`, `descente_choleski` et `remontee_choleski` pour chaque
+# matrice, comparés aux versions par lots, vectorisées sur toute la pile.
+# La méthode classique n'est chronométrée que sur les `echantillon` premières matrices de la pile.
+
+n_list = np.array([2, 4, 8, 16, 32, 64])
+lot = 10_000
+echantillon = 200
+
+debit_classique = np.array([])
+debit_lot = np.array([])
+debit_numpy = np.array([])
+
+rng = np.random.default_rng(0)
+
+for n in n_list:
+    M = rng.standard_normal((lot, n, n))
+    A = M @ M.transpose(0, 2, 1) + n * np.eye(n)
+    B = rng.standard_normal((lot, n))
+
+    start_time = time.perf_counter()
+    for p in range(echantillon):
+        L = factorisation_choleski(A[p].tolist())
+        b = B[p].tolist()
+        descente_choleski(L, b)
+        remontee_choleski(L, b)
+    end_time = time.perf_counter()
+    debit_classique = np.append(debit_classique, echantillon / (end_time - start_time))
+
+    start_time = time.perf_counter()
+    L = factorisation_choleski_lot(A)
+    X = resolution_choleski_lot(L, B)
+    end_time = time.perf_counter()
+    debit_lot = np.append(debit_lot, lot / (end_time - start_time))
+
+    start_time = time.perf_counter()
+    X_numpy = np.linalg.solve(A, B[:, :, None])[:, :, 0]
+    end_time = time.perf_counter()
+    debit_numpy = np.append(debit_numpy, lot / (end_time - start_time))
+
+    print("n={} - classique {:.0f}/s, par lots {:.0f}/s (x{:.0f}), numpy.linalg.solve {:.0f}/s - écart {:.1e}".format(
+        n, debit_classique[-1], debit_lot[-1], debit_lot[-1] / debit_classique[-1], debit_numpy[-1],
+        np.abs(X - X_numpy).max()))
+
+plt.xlabel('n')
+plt.ylabel('Matrices par seconde')
+plt.loglog(n_list, debit_classique, 'r', label="Choleski classique, matrice par matrice")
+plt.loglog(n_list, debit_lot, 'g', label="Choleski par lots")
+plt.loglog(n_list, debit_numpy, 'b', label="numpy.linalg.solve (LU par lots)")
+plt.legend()
+plt.show()
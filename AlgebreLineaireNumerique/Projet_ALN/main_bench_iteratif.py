@@ -0,0 +1,57 @@
+import numpy as np
+import time
+import matplotlib.pyplot as plt
+
+from iteratif import *
+from scipy.sparse import diags, linalg as sla
+
+# Comparaison, sur les pas de temps du schéma Euler implicite de l'équation de la chaleur, d'une résolution directe
+# (SuperLU) et du gradient conjugué démarré depuis le champ de température du pas précédent.
+# Les conditions aux bornes (températures imposées) sont reportées dans le second membre : la matrice des points
+# intérieurs est alors symétrique définie positive.
+# Note : En dimension 1, la matrice tridiagonale se factorise sans remplissage et la résolution directe reste la plus
+# rapide ; le gradient conjugué devient avantageux lorsque la factorisation remplit (dimensions 2 et 3).
+
+R, tmax = 0.065, 60.  # en mètres, en secondes
+D = 98.8e-6  # Diffusivité thermique de l'aluminium
+Tmax = 80.  # °C
+Tamb = 20.  # °C
+Nx = 1_000
+Nt = 10_000
+
+dx = R / (Nx + 1)
+dt = tmax / (Nt + 1)
+beta = D * dt / dx ** 2
+print("beta={}, Nx={}, Nt={}".format(beta, Nx, Nt))
+
+# Matrice Euler implicite des points intérieurs
+M = diags([np.full(Nx - 1, -beta), np.full(Nx, 1 + 2. * beta), np.full(Nx - 1, -beta)], [-1, 0, 1], format='csr')
+bord = np.zeros(Nx)
+bord[0] = beta * Tmax
+bord[-1] = beta * Tamb
+
+# SuperLU : factorisation puis une résolution par pas de temps
+start_time = time.perf_counter()
+LU = sla.splu(M.tocsc())
+X = np.full(Nx, Tamb)
+for _ in range(Nt):
+    X = LU.solve(X + bord)
+X_direct = X
+temps_direct = time.perf_counter() - start_time
+print("SuperLU - {:.3f}s".format(temps_direct))
+
+# Gradient conjugué démarré depuis le pas précédent
+start_time = time.perf_counter()
+X = np.full(Nx, Tamb)
+iterations = []
+for _ in range(Nt):
+    X, convergence = gradient_conjugue(M, X + bord, x0=X, tol=1e-10)
+    iterations.append(convergence.iterations)
+temps_cg = time.perf_counter() - start_time
+print("Gradient conjugué - {:.3f}s (x{:.1f}), {:.1f} itérations par pas, écart {:.2e}".format(
+    temps_cg, temps_direct / temps_cg, np.mean(iterations), max(abs(X - X_direct))))
+
+plt.xlabel('Pas de temps')
+plt.ylabel("Nombre d'itérations du gradient conjugué")
+plt.plot(iterations, 'b')
+plt.show()
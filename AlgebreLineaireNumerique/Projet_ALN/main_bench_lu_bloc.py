@@ -0,0 +1,45 @@
+import numpy as np
+import time
+import matplotlib.pyplot as plt
+
+from lu import *
+
+# Comparaison de la factorisation LU avec pivot partiel classique (mises à jour de rang 1) et par blocs
+# (mise à jour de la sous-matrice restante par produit matrice-matrice).
+# Attention : la méthode classique prend plusieurs minutes pour les plus grandes tailles.
+
+n_list = np.array([500, 1000, 2000, 4000, 8000])
+taille_bloc_list = [32, 64, 128]
+
+gflops_classique = np.array([])
+gflops_bloc = {taille_bloc: np.array([]) for taille_bloc in taille_bloc_list}
+
+rng = np.random.default_rng(0)
+
+for n in n_list:
+    A = rng.standard_normal((n, n))
+    operations = 2 * n ** 3 / 3  # Nombre d'opérations flottantes de la factorisation LU
+
+    # Temps "horloge" (et non temps processeur) : le produit matrice-matrice peut utiliser plusieurs coeurs
+    start_time = time.perf_counter()
+    factorisation_LU_pivot_partiel(A, keep=True)
+    end_time = time.perf_counter()
+    gflops_classique = np.append(gflops_classique, operations / (end_time - start_time) / 1e9)
+    print("classique n={} - {:.3f}s - {:.2f} GFLOP/s".format(n, end_time - start_time, gflops_classique[-1]))
+
+    for taille_bloc in taille_bloc_list:
+        start_time = time.perf_counter()
+        factorisation_LU_pivot_partiel_bloc(A, keep=True, taille_bloc=taille_bloc)
+        end_time = time.perf_counter()
+        gflops_bloc[taille_bloc] = np.append(gflops_bloc[taille_bloc], operations / (end_time - start_time) / 1e9)
+        print("blocs de {} n={} - {:.3f}s - {:.2f} GFLOP/s (x{:.1f})".format(
+            taille_bloc, n, end_time - start_time, gflops_bloc[taille_bloc][-1],
+            gflops_bloc[taille_bloc][-1] / gflops_classique[-1]))
+
+plt.xlabel('n')
+plt.ylabel('Performance [en GFLOP/s]')
+plt.loglog(n_list, gflops_classique, 'r', label="LU pivot partiel classique")
+for taille_bloc in taille_bloc_list:
+    plt.loglog(n_list, gflops_bloc[taille_bloc], label="LU pivot partiel par blocs de {}".format(taille_bloc))
+plt.legend()
+plt.show()
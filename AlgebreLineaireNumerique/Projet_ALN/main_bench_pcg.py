@@ -0,0 +1,38 @@
+import numpy as np
+import time
+
+from choleski import *
+from iteratif import *
+from scipy.sparse import diags, identity, kron
+
+# Gradient conjugué préconditionné par Choleski incomplète, sur l'équation de la chaleur en dimension 2 (schéma Euler
+# implicite, grille de m x m points intérieurs). La factorisation de Choleski complète remplirait toute la bande de
+# largeur m, soit m^3 coefficients ; les factorisations incomplètes restent de l'ordre de la taille de A.
+
+R, tmax = 0.065, 60.  # en mètres, en secondes
+D = 98.8e-6  # Diffusivité thermique de l'aluminium
+Nt = 10_000
+m_list = [50, 100, 200]
+
+for m in m_list:
+    dx = R / (m + 1)
+    dt = tmax / (Nt + 1)
+    beta = D * dt / dx ** 2
+
+    # Matrice Euler implicite : I + beta * (laplacien discret en dimension 2)
+    T = diags([np.full(m - 1, -1.), np.full(m, 2.), np.full(m - 1, -1.)], [-1, 0, 1])
+    A = (identity(m * m) + beta * (kron(identity(m), T) + kron(T, identity(m)))).tocsr()
+    b = np.random.default_rng(0).random(m * m)
+    print("beta={:.3f}, n={}, nnz(A)={}, coefficients de Choleski complète ~ {}".format(beta, m * m, A.nnz, m ** 3))
+
+    for nom, seuil in [('sans préconditionneur', -1), ('IC(0)', None), ('IC seuil=1e-2', 1e-2),
+                       ('IC seuil=1e-3', 1e-3)]:
+        start_time = time.perf_counter()
+        preconditionneur, nnz = None, 0
+        if seuil != -1:
+            L = factorisation_choleski_incomplete(A, seuil=seuil)
+            preconditionneur, nnz = preconditionneur_choleski(L), L.nnz
+        x, convergence = gradient_conjugue(A, b, preconditionneur=preconditionneur)
+        end_time = time.perf_counter()
+        print("  {} : {} itérations, nnz(L)={}, {:.3f}s".format(nom, convergence.iterations, nnz,
+                                                              end_time - start_time))
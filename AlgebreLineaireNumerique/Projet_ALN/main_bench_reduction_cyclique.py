@@ -0,0 +1,78 @@
+import numpy as np
+import time
+import matplotlib.pyplot as plt
+
+from lu import *
+
+# Comparaison de l'algorithme de Thomas (récurrence séquentielle) et de la réduction cyclique (hybride ou complète)
+# sur la matrice Euler implicite de l'équation de la chaleur.
+# Attention : pour n = 10^8, chaque méthode demande plusieurs Go de mémoire vive.
+
+R, tmax = 0.065, 60.  # en mètres, en secondes
+D = 98.8e-6  # Diffusivité thermique de l'aluminium
+Tmax = 80.  # °C
+Tamb = 20.  # °C
+Nt = 10_000
+n_list = np.array([10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8])
+
+temps_thomas = np.array([])
+temps_reduction_cyclique = np.array([])
+temps_reduction_cyclique_complete = np.array([])
+
+for n in n_list:
+    Nx = n - 2
+    dx = R / (Nx + 1)
+    dt = tmax / (Nt + 1)
+    beta = D * dt / dx ** 2
+    print("beta={}, Nx={}".format(beta, Nx))
+
+    # Matrice Euler implicite
+    diag = np.full(Nx + 2, 1 + 2. * beta)
+    diag[0], diag[Nx + 1] = 1, 1  # Condition aux bornes
+
+    upper_band = np.full(Nx + 1, -beta)
+    upper_band[0] = 0
+
+    lower_band = np.full(Nx + 1, -beta)
+    lower_band[Nx] = 0
+
+    # Vecteur initial
+    B = np.full(Nx + 2, Tamb)
+    B[0] = Tmax
+
+    # Thomas : factorisation puis descente/remontée
+    start_time = time.perf_counter()
+    LU = factorisation_LU_tridiagonal(MatriceTridiagonale(lower_band, diag, upper_band))
+    X_thomas = remontee_tridiagonal(LU, descente_tridiagonal(LU, B, keep=True))
+    end_time = time.perf_counter()
+    temps_thomas = np.append(temps_thomas, end_time - start_time)
+    print("Thomas n={} - {:.3f}s".format(n, temps_thomas[-1]))
+    del LU
+
+    # Réduction cyclique hybride
+    start_time = time.perf_counter()
+    X = resolution_tridiagonal_reduction_cyclique(lower_band, diag, upper_band, B)
+    end_time = time.perf_counter()
+    temps_reduction_cyclique = np.append(temps_reduction_cyclique, end_time - start_time)
+    print("Réduction cyclique hybride n={} - {:.3f}s (x{:.1f}, écart {:.2e})".format(
+        n, temps_reduction_cyclique[-1], temps_thomas[-1] / temps_reduction_cyclique[-1], max(abs(X - X_thomas))))
+
+    # Réduction cyclique complète
+    start_time = time.perf_counter()
+    X = resolution_tridiagonal_reduction_cyclique(lower_band, diag, upper_band, B, seuil=0)
+    end_time = time.perf_counter()
+    temps_reduction_cyclique_complete = np.append(temps_reduction_cyclique_complete, end_time - start_time)
+    print("Réduction cyclique complète n={} - {:.3f}s".format(n, temps_reduction_cyclique_complete[-1]))
+    del X, X_thomas
+
+slope_thomas, _ = np.polyfit(np.log(n_list), np.log(temps_thomas), 1)
+slope_reduction_cyclique, _ = np.polyfit(np.log(n_list), np.log(temps_reduction_cyclique), 1)
+
+plt.xlabel('n')
+plt.ylabel("Durée d'exécution [en s]")
+plt.loglog(n_list, temps_thomas, 'r', label="Thomas (ordre={:.3f})".format(slope_thomas))
+plt.loglog(n_list, temps_reduction_cyclique, 'g',
+           label="Réduction cyclique hybride (ordre={:.3f})".format(slope_reduction_cyclique))
+plt.loglog(n_list, temps_reduction_cyclique_complete, 'c', label="Réduction cyclique complète")
+plt.legend()
+plt.show()
@@ -0,0 +1,44 @@
+import numpy as np
+import time
+import matplotlib.pyplot as plt
+
+from lu import *
+from choleski import *
+
+# Passage à l'échelle des factorisations LU et de Choleski par tuiles, selon le nombre de fils d'exécution.
+# Pour mesurer l'effet du parallélisme par tuiles seul, limiter la bibliothèque BLAS à un coeur par produit
+# (par exemple OMP_NUM_THREADS=1 ou OPENBLAS_NUM_THREADS=1) avant de lancer le script.
+
+n = 4_000
+taille_tuile = 256
+workers_list = np.array([1, 2, 4, 8])
+
+temps_LU = np.array([])
+temps_choleski = np.array([])
+
+rng = np.random.default_rng(0)
+A = rng.standard_normal((n, n))
+S = A @ A.T + n * np.eye(n)  # Matrice symétrique définie positive
+
+for workers in workers_list:
+    # Temps "horloge" (et non temps processeur), puisque plusieurs coeurs travaillent en même temps
+    start_time = time.perf_counter()
+    factorisation_LU_pivot_partiel_tuiles(A, keep=True, taille_tuile=taille_tuile, workers=workers)
+    end_time = time.perf_counter()
+    temps_LU = np.append(temps_LU, end_time - start_time)
+    print("LU workers={} - {:.3f}s (accélération x{:.2f})".format(workers, temps_LU[-1], temps_LU[0] / temps_LU[-1]))
+
+    start_time = time.perf_counter()
+    factorisation_choleski_tuiles(S, taille_tuile=taille_tuile, workers=workers)
+    end_time = time.perf_counter()
+    temps_choleski = np.append(temps_choleski, end_time - start_time)
+    print("Choleski workers={} - {:.3f}s (accélération x{:.2f})".format(
+        workers, temps_choleski[-1], temps_choleski[0] / temps_choleski[-1]))
+
+plt.xlabel('Nombre de fils d\'exécution')
+plt.ylabel('Accélération')
+plt.plot(workers_list, temps_LU[0] / temps_LU, 'r', label="LU pivot partiel par tuiles (n={})".format(n))
+plt.plot(workers_list, temps_choleski[0] / temps_choleski, 'g', label="Choleski par tuiles (n={})".format(n))
+plt.plot(workers_list, workers_list, 'k--', label="Accélération idéale")
+plt.legend()
+plt.show()
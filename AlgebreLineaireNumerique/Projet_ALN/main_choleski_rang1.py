@@ -0,0 +1,37 @@
+import numpy as np
+import time
+
+from choleski import *
+
+# Matrice de covariance sur une fenêtre glissante d'observations : à chaque pas, une observation entre dans la
+# fenêtre (ajout de rang 1) et la plus ancienne en sort (retrait de rang 1). Le facteur de Choleski est tenu à jour en
+# O(n^2) par pas, au lieu d'être recalculé en O(n^3).
+
+n = 1500  # Nombre de variables
+fenetre = 3000  # Nombre d'observations dans la fenêtre
+pas = 20
+
+rng = np.random.default_rng(0)
+observations = rng.standard_normal((fenetre + pas, n))
+
+# Covariance (non centrée, régularisée) C = eps I + somme des x x^T sur la fenêtre
+C = 1e-3 * np.eye(n) + observations[:fenetre].T @ observations[:fenetre]
+L = factorisation_choleski_sur_place(C.copy())
+
+temps_rang1, temps_complete = 0., 0.
+for k in range(pas):
+    entree, sortie = observations[fenetre + k], observations[k]
+
+    start_time = time.perf_counter()
+    ajout_choleski(L, entree)
+    retrait_choleski(L, sortie)
+    temps_rang1 += time.perf_counter() - start_time
+
+    C += np.outer(entree, entree) - np.outer(sortie, sortie)
+    start_time = time.perf_counter()
+    L_complete = factorisation_choleski_sur_place(C.copy())
+    temps_complete += time.perf_counter() - start_time
+
+print("n={}, {} pas - ajout et retrait de rang 1 {:.3f}s, factorisation complète {:.3f}s (x{:.1f})".format(
+    n, pas, temps_rang1, temps_complete, temps_complete / temps_rang1))
+print("écart au facteur recalculé : {:.1e}".format(np.abs(np.tril(L) - np.tril(L_complete)).max()))
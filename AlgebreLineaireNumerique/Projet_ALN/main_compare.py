@@ -2,6 +2,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import time
 
+from chaleur import pas_explicites, pas_explicites_blocs
 from scipy.sparse import csr_matrix
 
 R, tmax = 0.065, 60.  # en mètres, en secondes
@@ -14,6 +15,8 @@ temps_mult_simple = np.array([])
 temps_mult_tridiagonal = np.array([])
 temps_mult_np_dot = np.array([])
 temps_mult_sparce = np.array([])
+temps_mult_tranches = np.array([])
+temps_mult_blocs = np.array([])
 
 for Nx in Nx_lst:
     dx = R/(Nx+1)
@@ -119,12 +122,53 @@ for Nx in Nx_lst:
     compare -= B
     #print(compare)
 
+    # Stencil par tranches, sur place (sans former M)
+    B = np.full(Nx + 2, float(Tamb))
+    B[0] = Tmax
+    start_time = time.process_time()
+    pas_explicites(B, beta, Nt)
+    end_time = time.process_time()
+    temps_mult_tranches = np.append(temps_mult_tranches, end_time - start_time)
+
+    # Stencil par tranches, avec blocage temporel
+    B_blocs = np.full(Nx + 2, float(Tamb))
+    B_blocs[0] = Tmax
+    start_time = time.process_time()
+    pas_explicites_blocs(B_blocs, beta, Nt)
+    end_time = time.process_time()
+    temps_mult_blocs = np.append(temps_mult_blocs, end_time - start_time)
+    print("np.dot {:.3f}s, sparse {:.3f}s, tranches {:.3f}s, blocs {:.3f}s - écart {:.1e}".format(
+        temps_mult_np_dot[-1], temps_mult_sparce[-1], temps_mult_tranches[-1], temps_mult_blocs[-1],
+        max(np.abs(B - X).max(), np.abs(B_blocs - X).max())))
+
+
+# Grands tableaux : le blocage temporel ne parcourt le tableau qu'une fois tous les PROFONDEUR_BLOC_EXPLICITE pas
+Nx_grands = [10 ** 5, 10 ** 6, 10 ** 7]
+Nt_grands = 64
+for Nx in Nx_grands:
+    B = np.full(Nx + 2, float(Tamb))
+    B[0] = Tmax
+    start_time = time.process_time()
+    pas_explicites(B, 0.4, Nt_grands)
+    end_time = time.process_time()
+    temps_tranches = end_time - start_time
+
+    B_blocs = np.full(Nx + 2, float(Tamb))
+    B_blocs[0] = Tmax
+    start_time = time.process_time()
+    pas_explicites_blocs(B_blocs, 0.4, Nt_grands)
+    end_time = time.process_time()
+    print("Nx={}, {} pas - tranches {:.3f}s, blocage temporel {:.3f}s (x{:.1f})".format(
+        Nx, Nt_grands, temps_tranches, end_time - start_time, temps_tranches / (end_time - start_time)))
+
 
 #print(temps_mult_np_dot)
 #slope_simple, _ = np.polyfit(np.log(Nx_lst), np.log(temps_mult_simple), 1)
 #slope_tridiagonal, _ = np.polyfit(np.log(Nx_lst), np.log(temps_mult_tridiagonal), 1)
 slope_np_dot, _ = np.polyfit(np.log(Nx_lst), np.log(temps_mult_np_dot), 1)
 slope_sparce, _ = np.polyfit(np.log(Nx_lst), np.log(temps_mult_sparce), 1)
+slope_tranches, _ = np.polyfit(np.log(Nx_lst), np.log(temps_mult_tranches), 1)
+slope_blocs, _ = np.polyfit(np.log(Nx_lst), np.log(temps_mult_blocs), 1)
 #print(slope_simple, slope_np_dot)
 #print(temps_mult_np_dot)
 #print(temps_mult_sparce)
@@ -135,6 +179,8 @@ plt.ylabel("log(durée d'exécution [en s])")
 #plt.loglog(Nx_lst, temps_mult_tridiagonal, 'g', label="Multiplication tridiagonale (ordre={:.3f})".format(slope_tridiagonal))
 plt.loglog(Nx_lst, temps_mult_np_dot, 'c', label="np.dot (ordre={:.3f})".format(slope_np_dot))
 plt.loglog(Nx_lst, temps_mult_sparce, 'm', label="sparce @ (ordre={:.3f})".format(slope_sparce))
+plt.loglog(Nx_lst, temps_mult_tranches, 'g', label="Stencil par tranches (ordre={:.3f})".format(slope_tranches))
+plt.loglog(Nx_lst, temps_mult_blocs, 'b', label="Stencil, blocage temporel (ordre={:.3f})".format(slope_blocs))
 plt.legend()
 # plt.plot(np.log(Nx_lst), np.log(y_predicted), 'b')
 plt.show()
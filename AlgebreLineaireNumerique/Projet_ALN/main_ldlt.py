@@ -0,0 +1,30 @@
+import matplotlib.pyplot as plt
+
+from chaleur import SolveurChaleur1D
+
+# Schéma Euler implicite, résolu à chaque pas de temps par la factorisation LDL^T de la matrice tridiagonale (choix
+# par défaut de `SolveurChaleur1D`) : seules la diagonale et la sous-diagonale sont stockées, et la solution est
+# réécrite dans le vecteur de température lui-même (aucune allocation par pas de temps).
+
+R, tmax = 0.065, 60.  # en mètres, en secondes
+D = 98.8e-6  # Diffusivité thermique de l'aluminium
+Tmax = 80.  # °C
+Tamb = 20.  # °C
+Nx = 10_000
+Nt = 100_000
+
+solveur = SolveurChaleur1D(D, R, Nx, Nt, tmax, 1., Tmax, Tamb)
+
+print("beta={}, Nx={}, Nt={}".format(solveur.beta, Nx, Nt))
+
+x_i = solveur.positions * 100  # Positions des points (en cm)
+plt.xlim(0, R * 100)
+plt.ylim(Tamb, Tmax)
+plt.xlabel('Position (cm)')
+plt.ylabel('Temperature (°C)')
+
+for t, B in solveur.instantanes(Nt // 20, copie=False):
+    print(solveur.k)
+    plt.plot(x_i, B, 'b')
+plt.plot(x_i, solveur.solution_stationnaire(), "k,")
+plt.show()
@@ -0,0 +1,65 @@
+import numpy as np
+import time
+import matplotlib.pyplot as plt
+
+from lu import *
+from multigrille import *
+
+# Solveur multigrille sur les deux problèmes du cours :
+#  1. l'équation de Poisson -u'' = f sur [0,1], u(0) = u(1) = 0 (cf. 01_DiscretisationEquationChaleur/main.py),
+#  2. les pas de temps du schéma Euler implicite de l'équation de la chaleur, comparés à l'algorithme de Thomas.
+# Les nombres de points intérieurs sont de la forme 2^k - 1, pour une hiérarchie de grilles complète.
+
+# [1] Poisson : -u''(x) = Pi**2 * sin(Pi*x), de solution u(x) = sin(Pi*x)
+n = 2 ** 12 - 1
+h = 1. / (n + 1)
+x_i = np.arange(1, n + 1) * h
+
+multigrille = Multigrille(n, c=0., beta=1. / h ** 2)
+X = multigrille.fmg(np.pi ** 2 * np.sin(np.pi * x_i))
+print("Poisson n={} - FMG, erreur max {:.2e} (erreur de discrétisation ~ h^2 = {:.2e})".format(
+    n, max(abs(X - np.sin(np.pi * x_i))), h ** 2))
+
+# [2] Chaleur : Euler implicite, températures imposées aux bords reportées dans le second membre
+R, tmax = 0.065, 60.  # en mètres, en secondes
+D = 98.8e-6  # Diffusivité thermique de l'aluminium
+Tmax = 80.  # °C
+Tamb = 20.  # °C
+Nx = 2 ** 14 - 1
+Nt = 1_000
+
+dx = R / (Nx + 1)
+dt = tmax / (Nt + 1)
+beta = D * dt / dx ** 2
+print("beta={}, Nx={}, Nt={}".format(beta, Nx, Nt))
+
+bord = np.zeros(Nx)
+bord[0], bord[-1] = beta * Tmax, beta * Tamb
+
+# Thomas
+start_time = time.perf_counter()
+LU = FactorisationLU(factorisation_LU_tridiagonal(
+    MatriceTridiagonale(np.full(Nx - 1, -beta), np.full(Nx, 1 + 2. * beta), np.full(Nx - 1, -beta))))
+X = np.full(Nx, Tamb)
+for _ in range(Nt):
+    X = LU.solve(X + bord)
+X_thomas = X
+temps_thomas = time.perf_counter() - start_time
+print("Thomas - {:.3f}s".format(temps_thomas))
+
+# Multigrille, démarré depuis le pas précédent
+start_time = time.perf_counter()
+multigrille = Multigrille(Nx, c=1., beta=beta, tol=1e-12)
+X = np.full(Nx, Tamb)
+cycles = []
+for _ in range(Nt):
+    X = multigrille.solve(X + bord, x0=X)
+    cycles.append(multigrille.convergence.iterations)
+temps_multigrille = time.perf_counter() - start_time
+print("Multigrille - {:.3f}s, {:.1f} cycles par pas, écart {:.2e}".format(
+    temps_multigrille, np.mean(cycles), max(abs(X - X_thomas))))
+
+plt.xlabel('Position (cm)')
+plt.ylabel('Temperature (°C)')
+plt.plot(np.arange(1, Nx + 1) * dx * 100, X, 'b')
+plt.show()
@@ -0,0 +1,426 @@
+import warnings
+
+import numpy as np
+from scipy.sparse import diags, identity, kron
+from scipy.sparse.linalg import splu
+
+from iteratif import Convergence
+
+
+# Ce fichier contient un solveur multigrille géométrique pour les opérateurs discrétisés de l'équation de la chaleur
+# (et de Poisson) sur une grille uniforme de dimension 1 ou 2, avec conditions de Dirichlet homogènes :
+#   A = c.I + beta.L
+# où L est le laplacien discret non normalisé (stencil (-1, 2, -1) en dimension 1, stencil à 5 points de centre 4 en
+# dimension 2). Le schéma Euler implicite donne c = 1 et beta = D.dt/dx^2 ; l'équation de Poisson -u'' = f donne
+# c = 0 et beta = 1/h^2.
+
+# Note : Un lisseur (Jacobi pondérée ou Gauss-Seidel rouge-noir) atténue rapidement les composantes oscillantes de
+# l'erreur, mais pas ses composantes lisses. Celles-ci sont corrigées sur une grille deux fois plus grossière, où
+# elles redeviennent oscillantes, et ainsi de suite récursivement. Chaque cycle coûte O(N) opérations pour N
+# inconnues et réduit le résidu d'un facteur indépendant de N.
+
+# Note : La grille est grossie tant que le nombre de points intérieurs par direction est impair (n -> (n-1)/2) : les
+# tailles de la forme 2^k - 1 donnent la hiérarchie complète. Sur la grille la plus grossière, le système est résolu
+# directement (SuperLU). Sur la grille grossière, le pas double : beta y est divisé par 4.
+
+
+# [0] OPERATIONS SUR LES GRILLES
+
+# Les grilles sont stockées avec une couche de points fantômes nuls (conditions de Dirichlet homogènes) : les
+# stencils s'écrivent alors par décalage de tranches, sans cas particulier au bord.
+
+def _interieur(
+        u: np.ndarray
+) -> np.ndarray:
+    """
+    :return: la vue sur les points intérieurs de la grille `u` (points fantômes exclus).
+    """
+
+    return u[(slice(1, -1),) * u.ndim]
+
+
+def _voisins(
+        u: np.ndarray
+) -> np.ndarray:
+    """
+    :return: la somme des valeurs des voisins de chaque point intérieur de la grille `u`.
+    """
+
+    if u.ndim == 1:
+        return u[:-2] + u[2:]
+
+    return u[:-2, 1:-1] + u[2:, 1:-1] + u[1:-1, :-2] + u[1:-1, 2:]
+
+
+def _restriction_axe(
+        r: np.ndarray,
+        axe: int
+) -> np.ndarray:
+    """
+    Restreint `r` (de taille 2m+1 suivant `axe`) à la grille grossière (de taille m) par pondération (1/4, 1/2, 1/4).
+    """
+
+    r = np.moveaxis(r, axe, 0)
+
+    return np.moveaxis((r[0:-2:2] + 2 * r[1:-1:2] + r[2::2]) / 4, 0, axe)
+
+
+def _prolongement_axe(
+        e: np.ndarray,
+        axe: int
+) -> np.ndarray:
+    """
+    Prolonge `e` (de taille m suivant `axe`) à la grille fine (de taille 2m+1) par interpolation linéaire.
+    """
+
+    e = np.moveaxis(e, axe, 0)
+    m = e.shape[0]
+    ep = np.zeros((m + 2,) + e.shape[1:])
+    ep[1:-1] = e
+
+    f = np.empty((2 * m + 1,) + e.shape[1:])
+    f[1::2] = e
+    f[0::2] = (ep[:-1] + ep[1:]) / 2
+
+    return np.moveaxis(f, 0, axe)
+
+
+# [1] SOLVEUR MULTIGRILLE
+
+class Multigrille:
+    """
+    Solveur multigrille géométrique du système (c.I + beta.L) x = b sur une grille uniforme de n points intérieurs par
+    direction, en dimension 1 ou 2 (cf. en-tête du fichier).
+    La hiérarchie des grilles et la factorisation de la grille la plus grossière sont calculées une fois pour toutes :
+    comme une factorisation, l'objet est ensuite réutilisé pour chaque pas de temps (cf. `solve`).
+    """
+
+    def __init__(
+            self,
+            n: int,
+            c: float,
+            beta: float,
+            dimension: int = 1,
+            lisseur: str = 'rouge_noir',
+            cycle: str = 'V',
+            pre: int = 2,
+            post: int = 2,
+            tol: float = 1e-8,
+            iter_max: int = 50,
+            taille_grossiere: int = 3
+    ):
+        """
+        :param n: le nombre de points intérieurs par direction.
+        :param c: le coefficient de l'identité.
+        :param beta: le coefficient du laplacien discret non normalisé.
+        :param dimension: (default=1) la dimension de la grille, 1 ou 2.
+        :param lisseur: (default='rouge_noir') 'jacobi' (Jacobi pondérée) ou 'rouge_noir' (Gauss-Seidel rouge-noir).
+        :param cycle: (default='V') 'V' (une correction grossière par niveau) ou 'W' (deux corrections, plus robuste
+        mais en O(N log N) en dimension 1).
+        :param pre: (default=2) le nombre d'itérations de lissage avant la correction grossière.
+        :param post: (default=2) le nombre d'itérations de lissage après la correction grossière.
+        :param tol: (default=1e-8) la tolérance relative sur la norme du résidu.
+        :param iter_max: (default=50) le nombre maximal de cycles par résolution.
+        :param taille_grossiere: (default=3) le nombre de points par direction en dessous duquel la grille n'est plus
+        grossie.
+        """
+
+        if dimension not in (1, 2):
+            raise ValueError('La dimension doit valoir 1 ou 2.')
+        if lisseur not in ('jacobi', 'rouge_noir'):
+            raise ValueError("Lisseur inconnu : '{}'.".format(lisseur))
+        if cycle not in ('V', 'W'):
+            raise ValueError("Cycle inconnu : '{}'.".format(cycle))
+
+        self.dimension = dimension
+        self.c = c
+        self.lisseur = lisseur
+        self.gamma = 1 if cycle == 'V' else 2
+        self.pre, self.post = pre, post
+        self.tol, self.iter_max = tol, iter_max
+        self.convergence = None  # Suivi de convergence de la dernière résolution
+
+        # Hiérarchie des grilles : nombre de points par direction et coefficient beta de chaque niveau
+        self.tailles, self.betas = [n], [beta]
+        while self.tailles[-1] % 2 == 1 and self.tailles[-1] > taille_grossiere:
+            self.tailles.append((self.tailles[-1] - 1) // 2)
+            self.betas.append(self.betas[-1] / 4)
+        if len(self.tailles) == 1 and n > taille_grossiere:
+            warnings.warn('n={} est pair : aucune grille grossière, chaque résolution se ramène à une factorisation '
+                          'directe (SuperLU) de la grille entière, plus les lissages. Choisir n de la forme 2^k - 1.'
+                          .format(n), RuntimeWarning)
+
+        # Poids de Jacobi optimal pour le lissage des hautes fréquences
+        self.w = 2 / 3 if dimension == 1 else 4 / 5
+
+        # Résolution directe sur la grille la plus grossière
+        m = self.tailles[-1]
+        L = diags([np.full(m - 1, -1.), np.full(m, 2.), np.full(m - 1, -1.)], [-1, 0, 1])
+        if dimension == 2:
+            L = kron(identity(m), L) + kron(L, identity(m))
+        self.grossiere = splu((c * identity(m ** dimension) + self.betas[-1] * L).tocsc())
+
+    def _diagonale(
+            self,
+            niveau: int
+    ) -> float:
+        """
+        :return: le coefficient diagonal de A au niveau `niveau`.
+        """
+
+        return self.c + 2 * self.dimension * self.betas[niveau]
+
+    def _residu(
+            self,
+            niveau: int,
+            u: np.ndarray,
+            b: np.ndarray
+    ) -> np.ndarray:
+        """
+        :return: le résidu b - Au aux points intérieurs, pour la grille `u` du niveau `niveau`.
+        """
+
+        return b - self._diagonale(niveau) * _interieur(u) + self.betas[niveau] * _voisins(u)
+
+    def _lissage(
+            self,
+            niveau: int,
+            u: np.ndarray,
+            b: np.ndarray,
+            iterations: int
+    ):
+        """
+        Applique `iterations` itérations du lisseur à la grille `u` du niveau `niveau`, sur place.
+        """
+
+        d, beta = self._diagonale(niveau), self.betas[niveau]
+        interieur = _interieur(u)
+
+        for _ in range(iterations):
+            if self.lisseur == 'jacobi':
+                interieur += self.w * (b - d * interieur + beta * _voisins(u)) / d
+                continue
+
+            # Gauss-Seidel rouge-noir : les points "rouges" (somme des indices paire) ne dépendent que des points
+            # "noirs", et inversement : chaque demi-itération est un calcul vectoriel
+            for couleur in (0, 1):
+                masque = self._masques(niveau)[couleur]
+                interieur[masque] = ((b + beta * _voisins(u)) / d)[masque]
+
+    def _masques(
+            self,
+            niveau: int
+    ) -> tuple:
+        """
+        :return: les masques des points rouges et noirs de la grille du niveau `niveau`.
+        """
+
+        if not hasattr(self, '_cache_masques'):
+            self._cache_masques = {}
+        if niveau not in self._cache_masques:
+            indices = np.indices((self.tailles[niveau],) * self.dimension).sum(axis=0)
+            self._cache_masques[niveau] = (indices % 2 == 0, indices % 2 == 1)
+
+        return self._cache_masques[niveau]
+
+    def _restriction(
+            self,
+            r: np.ndarray
+    ) -> np.ndarray:
+        """
+        :return: le vecteur `r` des points intérieurs restreint à la grille grossière.
+        """
+
+        for axe in range(self.dimension):
+            r = _restriction_axe(r, axe)
+
+        return r
+
+    def _prolongement(
+            self,
+            e: np.ndarray
+    ) -> np.ndarray:
+        """
+        :return: le vecteur `e` des points intérieurs de la grille grossière prolongé à la grille fine.
+        """
+
+        for axe in range(self.dimension):
+            e = _prolongement_axe(e, axe)
+
+        return e
+
+    def _grille(
+            self,
+            niveau: int,
+            interieur: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        :return: une grille du niveau `niveau` avec ses points fantômes nuls, de points intérieurs `interieur` (nuls
+        par défaut).
+        """
+
+        u = np.zeros((self.tailles[niveau] + 2,) * self.dimension)
+        if interieur is not None:
+            _interieur(u)[...] = interieur
+
+        return u
+
+    def _cycle(
+            self,
+            niveau: int,
+            u: np.ndarray,
+            b: np.ndarray
+    ):
+        """
+        Applique un cycle (V ou W) à partir du niveau `niveau` à la grille `u`, sur place, pour le second membre `b`.
+        """
+
+        if niveau == len(self.tailles) - 1:
+            _interieur(u)[...] = self.grossiere.solve(b.ravel()).reshape(b.shape)
+            return
+
+        self._lissage(niveau, u, b, self.pre)
+
+        # Correction grossière : Ae = r résolu (approximativement) sur la grille grossière
+        r = self._restriction(self._residu(niveau, u, b))
+        e = self._grille(niveau + 1)
+        for _ in range(self.gamma):
+            self._cycle(niveau + 1, e, r)
+        _interieur(u)[...] += self._prolongement(_interieur(e))
+
+        self._lissage(niveau, u, b, self.post)
+
+    def fmg(
+            self,
+            b
+    ) -> np.ndarray:
+        """
+        Multigrille complet (FMG) : le système est résolu sur la grille la plus grossière, puis la solution est
+        prolongée à chaque niveau plus fin et améliorée par un cycle. Une seule passe, en O(N), donne une solution
+        précise à l'ordre de l'erreur de discrétisation.
+        :param b: le second membre aux points intérieurs (vecteur de taille n^dimension, ou tableau n x n).
+        :return: la solution approchée, de même forme que `b`.
+        """
+
+        forme = np.shape(b)
+        seconds_membres = [np.asarray(b, dtype=np.float64).reshape((self.tailles[0],) * self.dimension)]
+        for _ in range(len(self.tailles) - 1):
+            seconds_membres.append(self._restriction(seconds_membres[-1]))
+
+        u = self._grille(len(self.tailles) - 1)
+        self._cycle(len(self.tailles) - 1, u, seconds_membres[-1])
+        for niveau in reversed(range(len(self.tailles) - 1)):
+            u = self._grille(niveau, self._prolongement(_interieur(u)))
+            self._cycle(niveau, u, seconds_membres[niveau])
+
+        return _interieur(u).reshape(forme).copy()
+
+    def solve(
+            self,
+            b,
+            x0=None
+    ) -> np.ndarray:
+        """
+        Résout le système Ax = b par des cycles successifs, jusqu'à ce que ||b - Ax||_2 <= tol * ||b||_2 (ou
+        `iter_max` cycles). Le suivi de convergence est conservé dans l'attribut `convergence`.
+        :param b: le second membre aux points intérieurs (vecteur de taille n^dimension, ou tableau n x n).
+        :param x0: (default=None) l'itéré initial, par exemple la solution du pas de temps précédent. Par défaut, le
+        multigrille complet (cf. `fmg`) fournit l'itéré initial.
+        :return: la solution, de même forme que `b`.
+        """
+
+        forme = np.shape(b)
+        b = np.asarray(b, dtype=np.float64).reshape((self.tailles[0],) * self.dimension)
+        u = self._grille(0, self.fmg(b) if x0 is None else np.reshape(x0, b.shape))
+        norme_b = np.linalg.norm(b) or 1.
+
+        residus = [float(np.linalg.norm(self._residu(0, u, b)))]
+        k = 0
+        while residus[-1] > self.tol * norme_b and k < self.iter_max:
+            self._cycle(0, u, b)
+            residus.append(float(np.linalg.norm(self._residu(0, u, b))))
+            k += 1
+        self.convergence = Convergence(residus[-1] <= self.tol * norme_b, k, residus)
+
+        return _interieur(u).reshape(forme).copy()
+
+
+# [2] MATRICES TRIDIAGONALES AVEC CONDITIONS AUX BORNES
+
+class MultigrilleTridiagonale:
+    """
+    Adaptation de `Multigrille` (dimension 1) aux matrices tridiagonales de l'équation de la chaleur dont les lignes 0
+    et n-1 sont des lignes de l'identité (températures imposées), telles que la matrice implicite de
+    `chaleur.SolveurChaleur1D` : les lignes intérieures sont celles de c.I + beta.L, et les températures imposées sont
+    reportées dans le second membre des lignes 1 et n-2 (cf. `choleski.FactorisationLDLtTridiagonale`). Le
+    multigrille ne porte ainsi que sur les n-2 points intérieurs.
+    Chaque résolution part de la solution de la précédente, proche lors de pas de temps successifs. Le nombre de
+    points intérieurs (Nx pour `SolveurChaleur1D`) doit être de la forme 2^k - 1 pour que le coût reste en O(N) : un
+    nombre pair ne permet aucune grille grossière (cf. `Multigrille`, qui le signale par un avertissement). L'objet s'utilise
+    comme paramètre `factorisation` de `SolveurChaleur1D`, directement ou par `functools.partial` pour fixer les
+    options de `Multigrille`.
+    """
+
+    def __init__(
+            self,
+            A,
+            **options
+    ):
+        """
+        :param A: la matrice tridiagonale (`MatriceTridiagonale`), de lignes 0 et n-1 égales à celles de l'identité,
+        et de coefficients constants sur les lignes intérieures.
+        :param options: les paramètres optionnels de `Multigrille` (lisseur, cycle, tol, ...), hors dimension.
+        """
+
+        inf, diag, sup = (np.asarray(v, dtype=np.float64) for v in (A.inf, A.diag, A.sup))
+        n = len(diag)
+        if n < 3 or diag[0] != 1 or diag[-1] != 1 or sup[0] != 0 or inf[-1] != 0:
+            raise ValueError("Les lignes 0 et n-1 de la matrice doivent être celles de l'identité.")
+
+        # Couplages des lignes intérieures à leurs voisines (points des bords compris), tous égaux à -beta
+        couplages = np.concatenate((inf[:-1], sup[1:]))
+        if np.any(couplages != couplages[0]) or np.any(diag[1:-1] != diag[1]):
+            raise ValueError('Les coefficients des lignes intérieures doivent être constants.')
+
+        beta = -couplages[0]
+        self.n = n
+        self.bords = (float(inf[0]), float(sup[-1]))  # Couplages (A[1][0], A[n-2][n-1])
+        self.multigrille = Multigrille(n - 2, diag[1] - 2 * beta, beta, **options)
+        self._precedent = None  # Solution intérieure de la résolution précédente
+
+    def solve(
+            self,
+            b
+    ) -> np.ndarray:
+        """
+        Résout l'équation Ax = b d'inconnue x.
+        :param b: le vecteur second membre (non modifié).
+        :return: la solution x.
+        """
+
+        return self.solve_into(b, np.empty(np.shape(b)))
+
+    def solve_into(
+            self,
+            b,
+            out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Résout l'équation Ax = b d'inconnue x en écrivant la solution dans le tableau `out`, qui peut être `b`
+        lui-même. Contrairement à une factorisation, le multigrille alloue ses grilles à chaque résolution.
+        :param b: le vecteur second membre.
+        :param out: le tableau de flottants recevant la solution, de même forme que `b`.
+        :return: le tableau `out`.
+        """
+
+        if out is not b:
+            out[...] = b
+
+        # Les températures imposées x[0] = b[0] et x[n-1] = b[n-1] passent dans le second membre des lignes 1 et n-2
+        interieur = out[1:-1]
+        interieur[0] -= self.bords[0] * out[0]
+        interieur[-1] -= self.bords[1] * out[-1]
+        interieur[...] = self.multigrille.solve(interieur, x0=self._precedent)
+        self._precedent = interieur.copy()
+
+        return out
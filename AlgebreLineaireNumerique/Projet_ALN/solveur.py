@@ -0,0 +1,294 @@
+import weakref
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix, issparse, linalg as sla
+
+from lu import *
+from choleski import factorisation_choleski_tuiles
+
+
+# Ce fichier contient un point d'entrée unique, `solve(A, b)`, qui résout le système Ax = b avec la méthode la moins
+# coûteuse parmi celles valables pour la matrice A. La structure de A (densité, largeurs de bande, symétrie,
+# dominance diagonale, caractère défini positif) est analysée une fois, puis la méthode choisie et la factorisation
+# obtenue sont conservées : les appels suivants avec la même matrice (le même objet) ne font plus que la résolution.
+
+# Note : Le cache repose sur l'identité de l'objet A. Si les coefficients de A sont modifiés sur place, il faut
+# appeler `oublier(A)` avant de la résoudre à nouveau.
+
+
+# Seuils de décision
+SEUIL_BANDE = 0.25  # Stockage bande si (kl+ku+1) <= SEUIL_BANDE * n
+SEUIL_CREUSE = 0.1  # Méthodes creuses si la proportion de coefficients non nuls est inférieure
+TAILLE_CACHE = 16  # Nombre de matrices dont l'analyse et la factorisation sont conservées
+
+
+Structure = namedtuple('Structure', ['n', 'nnz', 'densite', 'kl', 'ku', 'symetrique', 'diagonale_dominante'])
+Structure.__doc__ = """
+Structure d'une matrice carrée : taille, nombre et proportion de coefficients non nuls, largeurs de bande inférieure
+et supérieure, symétrie et dominance diagonale (au sens large, par lignes).
+"""
+
+Rapport = namedtuple('Rapport', ['moteur', 'raison', 'structure'])
+Rapport.__doc__ = """
+Méthode choisie par `solve` pour une matrice, avec la raison de ce choix et la structure analysée.
+"""
+
+
+_cache = OrderedDict()  # id(A) -> (référence vers A, rapport, factorisation)
+
+
+# [1] ANALYSE DE STRUCTURE
+
+def analyse_structure(
+        A
+) -> Structure:
+    """
+    Analyse la structure de la matrice carrée `A`.
+    :param A: la matrice (liste de listes, tableau numpy, matrice creuse `scipy.sparse` ou `MatriceTridiagonale`).
+    :return: la structure de A.
+    """
+
+    if isinstance(A, MatriceTridiagonale):
+        n = len(A)
+        symetrique = bool(np.array_equal(A.inf, A.sup))
+        hors_diagonale = np.zeros(n)
+        hors_diagonale[1:] += np.abs(A.inf)
+        hors_diagonale[:-1] += np.abs(A.sup)
+        dominante = bool(np.all(np.abs(A.diag) >= hors_diagonale))
+        nnz = n + np.count_nonzero(A.inf) + np.count_nonzero(A.sup)
+        return Structure(n, nnz, nnz / n ** 2, int(np.any(A.inf)), int(np.any(A.sup)), symetrique, dominante)
+
+    if issparse(A):
+        C = csr_matrix(A)
+        C.eliminate_zeros()
+        n = C.shape[0]
+        if C.shape[1] != n:
+            raise ValueError('La matrice doit être carrée.')
+        lignes, colonnes = C.nonzero()
+        symetrique = abs(C - C.T).max() == 0 if C.nnz else True
+        diagonale = np.abs(C.diagonal())
+        hors_diagonale = np.asarray(abs(C).sum(axis=1)).ravel() - diagonale
+    else:
+        T = np.asarray(A, dtype=np.float64)
+        n = len(T)
+        if T.shape != (n, n):
+            raise ValueError('La matrice doit être carrée.')
+        lignes, colonnes = np.nonzero(T)
+        symetrique = bool(np.array_equal(T, T.T))
+        diagonale = np.abs(np.diagonal(T))
+        hors_diagonale = np.abs(T).sum(axis=1) - diagonale
+
+    nnz = len(lignes)
+    kl = int(max(0, (lignes - colonnes).max(initial=0)))
+    ku = int(max(0, (colonnes - lignes).max(initial=0)))
+    dominante = bool(np.all(diagonale >= hors_diagonale))
+
+    return Structure(n, nnz, nnz / max(1, n) ** 2, kl, ku, bool(symetrique), dominante)
+
+
+# [2] CHOIX DE LA METHODE ET FACTORISATION
+
+def _choix_et_factorisation(
+        A,
+        structure: Structure
+) -> tuple:
+    """
+    Choisit la méthode la moins coûteuse valable pour la matrice `A`, et factorise A avec celle-ci.
+    Le caractère défini positif d'une matrice symétrique est établi par une tentative de factorisation (de Choleski
+    pour une matrice pleine, LU sans pivot à pivots positifs pour une matrice bande), dont le résultat est conservé.
+    :return: le rapport et la factorisation (objet muni d'une méthode `solve`).
+    """
+
+    n, kl, ku = structure.n, structure.kl, structure.ku
+
+    # Tridiagonale : algorithme de Thomas en O(n)
+    if kl <= 1 and ku <= 1 and (structure.diagonale_dominante or n <= 2):
+        T = A if isinstance(A, MatriceTridiagonale) else _tridiagonale(A, n)
+        try:
+            facto = FactorisationLU(factorisation_LU_tridiagonal(T, keep=True))
+            return Rapport('tridiagonal', 'matrice tridiagonale à diagonale dominante : Thomas en O(n)',
+                           structure), facto
+        except ZeroDivisionError:
+            pass  # Pivot nul : la bande avec pivot prend le relais
+
+    # Bande étroite : LU bande en O(n.kl.ku)
+    if kl + ku + 1 <= SEUIL_BANDE * n:
+        AB = _bande(A, kl, ku)
+        raison = 'largeurs de bande kl={}, ku={} faibles devant n={}'.format(kl, ku, n)
+        if structure.diagonale_dominante or structure.symetrique:
+            try:
+                LUB, P = factorisation_LU_bande(AB, kl, ku, pivot=False)
+                if structure.diagonale_dominante or np.all(LUB[ku] > 0):
+                    motif = 'à diagonale dominante' if structure.diagonale_dominante else 'symétrique définie positive'
+                    return Rapport('bande sans pivot', raison + ', matrice ' + motif, structure), \
+                        FactorisationLU.depuis_bande(LUB, kl, P)
+            except ValueError:
+                pass
+        LUB, P = factorisation_LU_bande(AB, kl, ku, pivot=True)
+        return Rapport('bande avec pivot', raison, structure), FactorisationLU.depuis_bande(LUB, kl, P)
+
+    # Creuse : LU creuse renumérotée sans pivot, ou SuperLU avec pivot
+    if structure.densite < SEUIL_CREUSE:
+        raison = 'proportion de coefficients non nuls {:.2%}'.format(structure.densite)
+        if structure.diagonale_dominante:
+            try:
+                return Rapport('LU creuse', raison + ', matrice à diagonale dominante : LU renumérotée sans pivot',
+                               structure), FactorisationLUCreuse(A)
+            except ValueError:
+                pass
+        return Rapport('splu', raison + ' : SuperLU avec pivot', structure), sla.splu(csc_matrix(A))
+
+    # Pleine
+    T = _dense(A)
+    if structure.symetrique:
+        try:
+            facto = FactorisationLU.depuis_choleski(factorisation_choleski_tuiles(T))
+            return Rapport('choleski', 'matrice pleine symétrique définie positive', structure), facto
+        except ValueError:
+            pass  # Non définie positive
+    if structure.diagonale_dominante:
+        try:
+            return Rapport('LU sans permutation', 'matrice pleine à diagonale dominante : pas de recherche de pivot',
+                           structure), FactorisationLU.factoriser(T, pivot=False)
+        except ZeroDivisionError:
+            pass
+
+    return Rapport('LU pivot partiel', 'matrice pleine quelconque', structure), FactorisationLU.factoriser(T)
+
+
+def _dense(
+        A
+) -> np.ndarray:
+    """
+    :return: la matrice `A` sous forme de tableau numpy plein.
+    """
+
+    if isinstance(A, MatriceTridiagonale):
+        return A.vers_dense()
+    if issparse(A):
+        return A.toarray()
+
+    return np.asarray(A, dtype=np.float64)
+
+
+def _tridiagonale(
+        A,
+        n: int
+) -> MatriceTridiagonale:
+    """
+    :return: la matrice tridiagonale `A` sous forme de `MatriceTridiagonale`.
+    """
+
+    if issparse(A):
+        C = csr_matrix(A)
+        return MatriceTridiagonale(C.diagonal(-1), C.diagonal(), C.diagonal(1))
+
+    return MatriceTridiagonale.depuis_dense(A)
+
+
+def _bande(
+        A,
+        kl: int,
+        ku: int
+) -> np.ndarray:
+    """
+    :return: le stockage bande de la matrice `A` (cf. `bande_depuis_dense`), construit sans passer par une matrice
+    pleine lorsque A est creuse.
+    """
+
+    if isinstance(A, MatriceTridiagonale) or not issparse(A):
+        return bande_depuis_dense(_dense(A), kl, ku)
+
+    C = csr_matrix(A)
+    n = C.shape[0]
+    AB = np.zeros((kl + ku + 1, n))
+    for k in range(-kl, ku + 1):
+        AB[ku - k, max(0, k):n + min(0, k)] = C.diagonal(k)
+
+    return AB
+
+
+# [3] POINT D'ENTREE
+
+def analyse(
+        A
+) -> tuple:
+    """
+    Analyse et factorise la matrice `A`, ou récupère le résultat en cache si A a déjà été analysée.
+    :param A: la matrice (liste de listes, tableau numpy, matrice creuse `scipy.sparse` ou `MatriceTridiagonale`).
+    :return: le rapport et la factorisation.
+    """
+
+    cle = id(A)
+    if cle in _cache:
+        reference, rapport, facto = _cache[cle]
+        if reference() is A:
+            _cache.move_to_end(cle)
+            return rapport, facto
+
+    rapport, facto = _choix_et_factorisation(A, analyse_structure(A))
+
+    try:
+        reference = weakref.ref(A)
+    except TypeError:
+        # Les listes Python ne peuvent pas être référencées faiblement : la matrice est alors conservée
+        reference = (lambda objet: lambda: objet)(A)
+    _cache[cle] = (reference, rapport, facto)
+    while len(_cache) > TAILLE_CACHE:
+        _cache.popitem(last=False)
+
+    return rapport, facto
+
+
+def oublier(
+        A=None
+):
+    """
+    Retire la matrice `A` du cache (toutes les matrices si `A` n'est pas donnée), par exemple après une modification
+    de ses coefficients.
+    """
+
+    if A is None:
+        _cache.clear()
+    else:
+        _cache.pop(id(A), None)
+
+
+def solve(
+        A,
+        b,
+        rapport: bool = False
+):
+    """
+    Résout l'équation Ax = b d'inconnue x avec la méthode la moins coûteuse valable pour A, parmi : Thomas
+    (tridiagonale), LU bande avec ou sans pivot, LU creuse renumérotée, SuperLU, Choleski, Gauss sans permutation et
+    Gauss avec pivot partiel.
+    :param A: la matrice (liste de listes, tableau numpy, matrice creuse `scipy.sparse` ou `MatriceTridiagonale`).
+    Elle n'est pas modifiée.
+    :param b: le vecteur second membre (non modifié).
+    :param rapport: (default=False) si le rapport (méthode choisie et raison) doit aussi être renvoyé.
+    :return: la solution x, et le rapport si demandé.
+    """
+
+    r, facto = analyse(A)
+    x = facto.solve(np.asarray(b, dtype=np.float64))
+
+    return (x, r) if rapport else x
+
+
+def mise_a_jour(
+        A,
+        U,
+        V
+) -> FactorisationLUModifiee:
+    """
+    Renvoie la factorisation de la matrice A + U V^T, obtenue à partir de celle de `A` (calculée ou récupérée en
+    cache) par une correction de rang faible (cf. `FactorisationLUModifiee`).
+    :param A: la matrice (liste de listes, tableau numpy, matrice creuse `scipy.sparse` ou `MatriceTridiagonale`).
+    :param U: la matrice n x k (ou le vecteur) U.
+    :param V: la matrice n x k (ou le vecteur) V.
+    :return: la factorisation de A + U V^T, munie d'une méthode `solve`.
+    """
+
+    return FactorisationLUModifiee(analyse(A)[1], U, V)
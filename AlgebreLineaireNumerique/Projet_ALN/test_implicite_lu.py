@@ -21,18 +21,18 @@ for Nx in Nx_list:
     beta = D * dt / dx ** 2
     print("beta={}".format(beta))
 
-    # Matrice Euler implicite
-    M = np.array([[0. for _ in range(Nx + 2)] for _ in range(Nx + 2)])
+    # Matrice Euler implicite, stockée par ses trois diagonales
+    diag = [1 + 2. * beta for _ in range(Nx + 2)]
+    diag[0], diag[Nx + 1] = 1, 1  # Condition aux bornes
 
-    M[0][0], M[Nx + 1][Nx + 1] = 1, 1  # Condition aux bornes
-    for i in range(1, Nx + 1):
-        M[i][i] = 1 + 2. * beta
+    upper_band = [-beta for _ in range(Nx + 1)]
+    upper_band[0] = 0
 
-    for i in range(1, Nx + 1):
-        M[i][i + 1] = -beta
+    lower_band = [-beta for _ in range(Nx + 1)]
+    lower_band[Nx] = 0
 
-    for i in range(Nx):
-        M[i + 1][i] = -beta
+    diagonals = [diag, lower_band, upper_band]
+    M = MatriceTridiagonale.depuis_diags(diagonals)
 
     # Vecteur initial
     B = np.transpose(np.array([Tamb for _ in range(Nx + 2)]))
@@ -2,9 +2,7 @@ import numpy as np
 import time
 import matplotlib.pyplot as plt
 
-from scipy.sparse import csc_matrix, linalg as sla
-from scipy.sparse import diags
-from lu import *
+from chaleur import SolveurChaleur1D, factorisation_superlu
 
 R, tmax = 0.065, 60.  # en mètres, en secondes
 D = 98.8e-6  # Diffusivité thermique de l'aluminium
@@ -26,76 +24,13 @@ dx = R / (Nx + 1)
 x_i = [i * dx * 100 for i in range(Nx + 2)]
 temperatures_attendues = [Tmax - (Tmax - Tamb) * x / (R * 100) for x in x_i]
 for Nt in Nt_list:
-    dt = tmax / (Nt + 1)
-    beta = D * dt / dx ** 2
-    print("beta={}".format(beta))
+    # Euler implicite (theta = 1), résolu par SuperLU
+    solveur = SolveurChaleur1D(D, R, Nx, Nt, tmax, 1., Tmax, Tamb, factorisation=factorisation_superlu)
+    print("beta={}".format(solveur.beta))
 
-    # Matrice Euler implicite
-    diag = [1 + 2. * beta for _ in range(Nx+2)]
-    diag[0], diag[Nx+1] = 1, 1  # Condition aux bornes
-
-    upper_band = [-beta for _ in range(Nx+1)]
-    upper_band[0] = 0
-
-    lower_band = [-beta for _ in range(Nx+1)]
-    lower_band[Nx] = 0
-
-    diagonals = [diag, lower_band, upper_band]
-    M = csc_matrix(diags(diagonals, [0, -1, 1]))
-
-    # Vecteur initial
-    B = np.transpose(np.array([Tamb for _ in range(Nx + 2)]))
-    B[0] = Tmax
-
-    '''
-    # LU simple
-    start_time = time.process_time()
-    LU = factorisation_LU(M, keep=True)
-    end_time = time.process_time()
-    temps_LU_simple = np.append(temps_LU_simple, end_time - start_time)
-    print("simple {} done - {}s".format(Nx, end_time - start_time))
-    '''
-
-    '''
-    start_time = time.process_time()
-    Y = descente(M, B, keep=True)
-    X = remontee(M, Y)
-    end_time = time.process_time()
-    temps_LU_simple = np.append(temps_LU_simple, end_time - start_time)
-    print("simple {} done - {}s".format(Nx, end_time - start_time))
-
-    compare = X.copy()
-    '''
-
-    '''
-    # LU tridiagonal
-    start_time = time.process_time()
-    LU = factorisation_LU_tridiagonal(M)
-    end_time = time.process_time()
-    temps_LU_tridiagonal = np.append(temps_LU_tridiagonal, end_time - start_time)
-    print("tridiag {} done - {}s".format(Nx, end_time - start_time))
-    '''
-
-    '''
-    start_time = time.process_time()
-    Y = descente_tridiagonal(M, B, keep=True)
-    X = remontee_tridiagonal(M, Y)
-    end_time = time.process_time()
-    temps_LU_tridiagonal = np.append(temps_LU_tridiagonal, end_time - start_time)
-    print("tridiag {} done - {}s".format(Nx, end_time - start_time))
-    #compare -= X
-    # print(compare)
-    '''
-
-    # sparce superLU
-    M = csc_matrix(M)
-    LU = sla.splu(M)
     #start_time = time.process_time()
-    for i in range(Nt):
-        if i % 1_000 == 0:
-            print(i)
-        X = LU.solve(B)
-        B = X.copy()
+    for t, B in solveur.instantanes(1_000, copie=False):
+        print(solveur.k)
     #end_time = time.process_time()
     #temps_superLU = np.append(temps_superLU, end_time - start_time)
     #print("superLU {} done - {}s".format(Nx, end_time - start_time))